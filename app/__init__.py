@@ -1,6 +1,7 @@
 from flask import Flask
 from flask_cors import CORS
 from dotenv import load_dotenv
+from typing import Iterable, Optional
 import os
 
 
@@ -8,22 +9,53 @@ import os
 # .env 파일 로드
 load_dotenv()
 
-def create_app():
+# asr: 회의 음성 처리 (torch/whisperx), rag: /rag/*, agent: /chat
+ALL_ROLES = ("asr", "rag", "agent")
+
+def _resolve_roles(roles: Optional[Iterable[str]]) -> set:
+    if roles is None:
+        roles = [role.strip() for role in os.getenv("APP_ROLES", ",".join(ALL_ROLES)).split(",") if role.strip()]
+    roles = set(roles)
+    unknown = roles - set(ALL_ROLES)
+    if unknown:
+        raise ValueError(f"알 수 없는 역할입니다: {', '.join(sorted(unknown))} (가능한 값: {', '.join(ALL_ROLES)})")
+    return roles
+
+def create_app(roles: Optional[Iterable[str]] = None):
+    """역할별 Flask 앱 생성
+
+    각 역할은 자기 라우터만 import 하므로, 예를 들어 rag/agent 워커는
+    torch/whisperx 를 불러오지 않는다.
+
+    Args:
+        roles: 활성화할 역할 목록 (None 이면 APP_ROLES 환경 변수, 기본값 전체)
+    """
+    roles = _resolve_roles(roles)
+    eager_init = os.getenv("EAGER_INIT", "true").lower() in ("1", "true", "yes")
+
     app = Flask(__name__)
     CORS(app)
-    
+
     # 환경 변수 설정
     app.config['UPLOAD_FOLDER'] = os.path.join(os.path.dirname(__file__), 'uploads')
+    app.config['ROLES'] = sorted(roles)
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-    
-    # 라우터 등록
-    from app.routes.api_router import bp
-    from app.routes.rag_router import bp as rag_bp
-    from app.routes.agent_router import agent_bp
-    
-    app.register_blueprint(bp)
-    app.register_blueprint(rag_bp, url_prefix='/rag')
-    app.register_blueprint(agent_bp) 
-    
-    return app 
 
+    # 라우터 등록 (역할에 필요한 모듈만 import)
+    if "asr" in roles:
+        from app.routes import api_router
+        app.register_blueprint(api_router.bp)
+        if eager_init:
+            api_router.get_api_service()
+
+    if "rag" in roles:
+        from app.routes import rag_router
+        app.register_blueprint(rag_router.bp, url_prefix='/rag')
+        if eager_init:
+            rag_router.get_rag_service()
+
+    if "agent" in roles:
+        from app.routes.agent_router import agent_bp
+        app.register_blueprint(agent_bp)
+
+    return app
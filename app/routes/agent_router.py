@@ -1,25 +1,12 @@
 from flask import Blueprint, request, jsonify
-import boto3, os, json
+import os, json
 from dotenv import load_dotenv
+from app.services.container import get_container
 
 load_dotenv()
 
 agent_bp = Blueprint("agent_bp", __name__)
 
-s3 = boto3.client(
-    "s3",
-    region_name=os.getenv("AWS_REGION"),
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
-)
-
-bedrock = boto3.client(
-    "bedrock-agent-runtime",
-    region_name=os.getenv("AWS_REGION"),
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
-)
-
 @agent_bp.route("/chat", methods=["POST"])
 def chat():
     # Check if request is JSON
@@ -30,6 +17,11 @@ def chat():
     if not request.json:
         return jsonify({"error": "Request body is required"}), 400
 
+    # S3/Bedrock 클라이언트는 공유 컨테이너의 것을 사용
+    container = get_container()
+    s3 = container.s3_client
+    bedrock = container.bedrock_agent_client
+
     user_input = request.json.get("message", "")
     user_id = request.json.get("user_id", "")
     bucket = os.getenv("S3_BUCKET")  # 예: ai-s3-j2pk
@@ -1,37 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 import os
-from app.services.api_service import APIService
-from app.utils.whisper_util import WhisperUtil
-from app.services.rag_service import RAGService
-from app.utils.bedrock_util import BedrockUtil
-from app.utils.s3_util import S3Util
-from app.utils.embedding_util import EmbeddingUtil
-from app.utils.vector_db_util import VectorDBUtil
-from app.utils.langchain_util import LangChainUtil
-
-# 유틸리티 인스턴스 초기화
-whisper_util = WhisperUtil()
-bedrock_util = BedrockUtil()
-s3_util = S3Util()
-embedding_util = EmbeddingUtil()
-vector_db_util = VectorDBUtil()
-langchain_util = LangChainUtil()
-
-# RAG 서비스 초기화
-rag_service = RAGService(
-    bedrock_util=bedrock_util,
-    s3_util=s3_util,
-    embedding_util=embedding_util,
-    vector_db_util=vector_db_util,
-    langchain_util=langchain_util
-)
-
-# API 서비스 초기화
-api_service = APIService(
-    whisper_util=whisper_util,
-    langchain_util=langchain_util,
-    s3_util=s3_util
-)
+import json
+from app.services.container import get_container
+from app.services.job_service import JobService, JobQueueFullError
+from app.utils.audio_utils import cleanup_temp_file
+from app.utils.asr_profile_util import ASR_PROFILES
+
+def get_api_service():
+    """API 서비스 조회 (처음 호출 시 공유 컨테이너에서 WhisperUtil 등 생성)"""
+    return get_container().api_service
+
+# 비동기 작업 큐 초기화
+job_service = JobService()
 
 # Blueprint 생성
 bp = Blueprint('api', __name__)
@@ -44,6 +24,15 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 def home():
     return jsonify({"message": "작동댄다아아아아앗"})
 
+@bp.route('/models/stats')
+def model_stats():
+    """모델 캐시 적중/로드 시간 통계 API"""
+    api_service = get_api_service()
+    stats = api_service.whisper_util.model_stats()
+    stats["transcript_cache"] = api_service.transcript_cache.stats()
+    stats["llm_cache"] = api_service.langchain_util.llm_cache.stats()
+    return jsonify(stats), 200
+
 @bp.route('/process-meeting', methods=['POST'])
 def process_meeting():
     """회의 오디오 파일 처리 API"""
@@ -67,14 +56,86 @@ def process_meeting():
         if not meeting_date:
             return jsonify(error="회의 날짜가 필요합니다."), 400
 
+        # ASR 프로필 확인 (선택)
+        asr_profile = request.form.get('asr_profile') or None
+        if asr_profile and asr_profile not in ASR_PROFILES:
+            return jsonify(error=f"지원하지 않는 ASR 프로필입니다: {asr_profile}"), 400
+
+        # 무음 제거/음량 정규화 전처리 여부 (기본값 AUDIO_PREPROCESS, 요청별로 끌 수 있음)
+        preprocess_default = os.getenv('AUDIO_PREPROCESS', 'true')
+        preprocess = request.form.get('preprocess', preprocess_default).lower() in ('1', 'true', 'yes')
+
+        api_service = get_api_service()
+
+        # 비동기 모드: 파일만 저장하고 작업 ID를 바로 반환
+        if request.form.get('async', '').lower() in ('1', 'true', 'yes'):
+            temp_path = api_service.save_upload(audio)
+            try:
+                job_id = job_service.submit(
+                    api_service.process_saved_audio,
+                    temp_path,
+                    user_id,
+                    meeting_date,
+                    asr_profile=asr_profile,
+                    preprocess=preprocess
+                )
+            except JobQueueFullError as e:
+                cleanup_temp_file(temp_path)
+                return jsonify(error=str(e)), 503
+            return jsonify(job_id=job_id, status_url=f"/jobs/{job_id}"), 202
+
         # 오디오 처리
         result = api_service.process_audio(
             audio_file=audio,
             user_id=user_id,
-            meeting_date=meeting_date
+            meeting_date=meeting_date,
+            asr_profile=asr_profile,
+            preprocess=preprocess
         )
         
         return jsonify(**result), 200
         
     except Exception as e:
-        return jsonify(error=str(e)), 500
\ No newline at end of file
+        return jsonify(error=str(e)), 500
+
+
+@bp.route('/process-meeting/stream', methods=['POST'])
+def process_meeting_stream():
+    """회의 오디오 스트리밍 전사 API (SSE)
+    
+    구간별 전사 결과를 segments 이벤트로 바로 보내고,
+    화자 분리가 끝나면 speakers 이벤트로 화자 라벨이 붙은 전체 세그먼트를 보낸다.
+    """
+    if 'audio' not in request.files:
+        return jsonify(error="파일이 없습니다."), 400
+
+    audio = request.files['audio']
+    if audio.filename == '':
+        return jsonify(error="선택된 파일이 없습니다."), 400
+
+    api_service = get_api_service()
+    try:
+        temp_path = api_service.save_upload(audio)
+    except Exception as e:
+        return jsonify(error=str(e)), 400
+
+    def generate():
+        try:
+            for event, data in api_service.stream_saved_audio(temp_path):
+                yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """비동기 회의 처리 작업 상태 조회 API"""
+    job = job_service.get(job_id)
+    if job is None:
+        return jsonify(error="작업을 찾을 수 없습니다."), 404
+    return jsonify(**job), 200
@@ -1,26 +1,11 @@
-from flask import Blueprint, jsonify, request
-from app.services.rag_service import RAGService
-from app.utils.bedrock_util import BedrockUtil
-from app.utils.s3_util import S3Util
-from app.utils.embedding_util import EmbeddingUtil
-from app.utils.vector_db_util import VectorDBUtil
-from app.utils.langchain_util import LangChainUtil
-
-# 유틸리티 인스턴스 초기화
-bedrock_util = BedrockUtil()
-s3_util = S3Util()
-embedding_util = EmbeddingUtil()
-vector_db_util = VectorDBUtil()
-langchain_util = LangChainUtil()
-
-# RAG 서비스 초기화
-rag_service = RAGService(
-    bedrock_util=bedrock_util,
-    s3_util=s3_util,
-    embedding_util=embedding_util,
-    vector_db_util=vector_db_util,
-    langchain_util=langchain_util
-)
+import json
+from flask import Blueprint, Response, jsonify, request
+from app.services.container import get_container
+
+
+def get_rag_service():
+    """RAG 서비스 조회 (처음 호출 시 공유 컨테이너에서 생성)"""
+    return get_container().rag_service
 
 # Blueprint 생성
 bp = Blueprint('rag', __name__)
@@ -32,7 +17,7 @@ def summarize_text():
     text = data.get("text")
     if not text:
         return jsonify({"error": "텍스트가 필요합니다."}), 400
-    result = rag_service.summarize_text(text)
+    result = get_rag_service().summarize_text(text)
     return jsonify({"summary": result})
 
 
@@ -42,7 +27,7 @@ def extract_todos():
     text = data.get("text")
     if not text:
         return jsonify({"error": "텍스트가 필요합니다."}), 400
-    result = rag_service.extract_todos(text)
+    result = get_rag_service().extract_todos(text)
     return jsonify({"todos": result})
 
 
@@ -52,13 +37,50 @@ def extract_schedules():
     text = data.get("text")
     if not text:
         return jsonify({"error": "텍스트가 필요합니다."}), 400
-    result = rag_service.extract_schedules(text)
+    result = get_rag_service().extract_schedules(text)
     return jsonify({"schedules": result})
 
 
+# ✅ 스트리밍 버전 (SSE: token, item, result 이벤트)
+def _stream_text_task(task: str):
+    data = request.get_json()
+    text = data.get("text") if data else None
+    if not text:
+        return jsonify({"error": "텍스트가 필요합니다."}), 400
+
+    rag_service = get_rag_service()
+
+    def generate():
+        try:
+            for event, payload in rag_service.stream_text_task(task, text):
+                yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@bp.route("/summary/stream", methods=["POST"])
+def summarize_text_stream():
+    return _stream_text_task("summary")
+
+
+@bp.route("/todos/stream", methods=["POST"])
+def extract_todos_stream():
+    return _stream_text_task("todos")
+
+
+@bp.route("/schedules/stream", methods=["POST"])
+def extract_schedules_stream():
+    return _stream_text_task("schedules")
+
+
 @bp.route("/summary/all", methods=["GET"])
 def get_all_summaries():
-    results = rag_service.summarize_all_files()
+    results = get_rag_service().summarize_all_files()
     if not results:
         return jsonify({"error": "S3에서 파일을 찾을 수 없습니다."}), 404
     return jsonify({"summaries": results})
@@ -66,7 +88,7 @@ def get_all_summaries():
 
 @bp.route("/todos/all", methods=["GET"])
 def get_all_todos():
-    results = rag_service.generate_todos()
+    results = get_rag_service().generate_todos()
     if not results:
         return jsonify({"error": "S3에서 파일을 찾을 수 없습니다."}), 404
     return jsonify({"todos": results})
@@ -74,12 +96,51 @@ def get_all_todos():
 
 @bp.route("/schedules/all", methods=["GET"])
 def get_all_schedules():
-    results = rag_service.generate_schedules()
+    results = get_rag_service().generate_schedules()
     if not results:
         return jsonify({"error": "S3에서 파일을 찾을 수 없습니다."}), 404
     return jsonify({"schedules": results})
 
 
+BATCH_TASKS = ("summary", "todos", "schedules")
+
+
+@bp.route("/all/stream", methods=["GET"])
+def stream_all_files():
+    """S3 전체 파일 요약/할일/일정 스트리밍 API (SSE)
+
+    파일 목록을 한 번만 조회하고 파일마다 한 번만 내려받아 요청한 작업을 모두 실행하며,
+    파일 하나가 끝날 때마다 file 이벤트를 보낸다. (?tasks=summary,todos,schedules)
+    """
+    tasks = tuple(task for task in request.args.get("tasks", ",".join(BATCH_TASKS)).split(",") if task)
+    unknown = [task for task in tasks if task not in BATCH_TASKS]
+    if not tasks or unknown:
+        return jsonify({"error": f"지원하지 않는 작업입니다: {unknown}"}), 400
+
+    rag_service = get_rag_service()
+
+    def generate():
+        try:
+            for event, payload in rag_service.stream_all_files(tasks):
+                yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@bp.route("/router/stats", methods=["GET"])
+def router_stats():
+    """LLM 공급자별 지연 시간/오류율과 헤지 통계 API"""
+    llm_router = get_rag_service().llm_router
+    if llm_router is None:
+        return jsonify({"error": "LLM 라우터를 사용하지 않습니다."}), 404
+    return jsonify(llm_router.stats())
+
+
 @bp.route('/search', methods=['POST'])
 def search_meetings():
     """회의 내용 검색 API"""
@@ -91,7 +152,7 @@ def search_meetings():
         query = data['query']
         user_id = data.get('user_id')  # 선택적
         
-        results = rag_service.search_meetings(
+        results = get_rag_service().search_meetings(
             query=query,
             user_id=user_id
         )
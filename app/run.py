@@ -1,6 +1,10 @@
+import multiprocessing
 from app import create_app
 
-app = create_app()
+# WSGI 진입점 (gunicorn "app.run:app")
+# spawn 워커(긴 녹음 병렬 전사 등)가 이 모듈을 다시 import 할 때는 앱을 만들지 않아 모델을 로드하지 않음
+if multiprocessing.parent_process() is None:
+    app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,16 +1,8 @@
-# services 패키지 초기화 
-from app.services.api_service import APIService
-from app.utils.whisper_util import WhisperUtil
-from app.utils.langchain_util import LangChainUtil
-from app.utils.s3_util import S3Util
+# services 패키지 초기화
+# 패키지 import 만으로 torch/whisperx 가 로드되지 않도록 의존성은 함수 안에서 import
+
 
 def create_api_service():
-    whisper_util = WhisperUtil()
-    langchain_util = LangChainUtil()
-    s3_util = S3Util()
-    
-    return APIService(
-        whisper_util=whisper_util,
-        langchain_util=langchain_util,
-        s3_util=s3_util
-    ) 
\ No newline at end of file
+    """공유 서비스 컨테이너의 API 서비스 반환"""
+    from app.services.container import get_container
+    return get_container().api_service
@@ -1,71 +1,187 @@
-from typing import Dict
-from app.utils.whisper_util import WhisperUtil
-from app.utils.langchain_util import LangChainUtil
-from app.utils.audio_utils import save_audio_file, cleanup_temp_file
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from app.utils.langchain_util import LangChainUtil, merge_extracted_items
+from app.utils.audio_utils import save_audio_file, cleanup_temp_file, decode_audio, preprocess_audio, OffsetMap
 from app.utils.s3_util import S3Util
 from app.utils.date_util import DateUtil
+from app.utils.transcript_cache_util import TranscriptCache
+from app.utils.transcript_util import Transcript
+from app.utils.async_loop_util import get_background_loop
+import os
 import json
+import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+
+# torch/whisperx 는 WhisperUtil 을 만드는 쪽(서비스 컨테이너)에서만 import
+if TYPE_CHECKING:
+    from app.utils.whisper_util import WhisperUtil
 
 class APIService:
     def __init__(self, 
-                 whisper_util: WhisperUtil,
+                 whisper_util: "WhisperUtil",
                  langchain_util: LangChainUtil,
-                 s3_util: S3Util):
+                 s3_util: S3Util,
+                 transcript_cache: Optional[TranscriptCache] = None):
         self.whisper_util = whisper_util
         self.langchain_util = langchain_util
         self.s3_util = s3_util
         self.date_util = DateUtil()
+        self.transcript_cache = transcript_cache or TranscriptCache()
+        # 전처리 무음 제거 시 에너지 기준에 더해 VAD 로 음성 구간 확인
+        self.preprocess_vad = os.getenv("AUDIO_PREPROCESS_VAD", "true").lower() in ("1", "true", "yes")
         self.concurrent_processor = ConcurrentProcessor(langchain_util, self.date_util)
+
+    # ConcurrentProcessor 작업 이름 -> 응답 필드 이름
+    RESULT_KEYS = {
+        "summarize": "meetingSummary",
+        "schedule": "schedule",
+        "todos": "todos"
+    }
         
     def process_audio(self, 
                      audio_file,
                      user_id: str,
-                     meeting_date: str) -> Dict:
+                     meeting_date: str,
+                     asr_profile: Optional[str] = None,
+                     preprocess: bool = True) -> Dict:
         """오디오 파일 처리 및 저장
         
         Args:
             audio_file: 오디오 파일 객체
             user_id: 사용자 ID
             meeting_date: 회의 날짜 (YYYY-MM-DD)
+            asr_profile: ASR 프로필 이름 (None 이면 배포 기본 프로필)
+            preprocess: 무음 제거/음량 정규화 전처리 여부
             
         Returns:
             처리 결과 (요약, 할일, 일정)
         """
-        # 임시 파일로 저장
+        temp_path = self.save_upload(audio_file)
+        return self.process_saved_audio(temp_path, user_id, meeting_date, asr_profile=asr_profile, preprocess=preprocess)
+
+    def save_upload(self, audio_file) -> str:
+        """업로드 파일을 임시 파일로 저장하고 경로 반환"""
         temp_path, error_response, status_code = save_audio_file(audio_file)
         if error_response:
             raise Exception(error_response)
+        return temp_path
+
+    def process_saved_audio(self,
+                            temp_path: str,
+                            user_id: str,
+                            meeting_date: str,
+                            asr_profile: Optional[str] = None,
+                            preprocess: bool = True,
+                            progress: Optional[Callable[[str, Optional[Dict]], None]] = None) -> Dict:
+        """임시 파일로 저장된 오디오 처리 (처리 후 임시 파일 삭제)
+        
+        Args:
+            temp_path: 임시 오디오 파일 경로
+            user_id: 사용자 ID
+            meeting_date: 회의 날짜 (YYYY-MM-DD)
+            asr_profile: ASR 프로필 이름 (None 이면 배포 기본 프로필)
+            preprocess: 무음 제거/음량 정규화 전처리 여부
+            progress: 단계/부분 결과 콜백 (비동기 작업에서 사용)
             
+        Returns:
+            처리 결과 (요약, 할일, 일정)
+        """
+        if progress is None:
+            progress = lambda stage, partial_result=None: None
+
         try:
-            # 1. SST 수행
-            whisper_result = self.whisper_util.transcribe(temp_path)
-            
-            # 2. 화자 분리 수행
-            diarize_segments = self.whisper_util.diarize(temp_path)
-            
-            # 3. 세그먼트 통합
-            integrated_segments = self.whisper_util.integrate_segments(whisper_result, diarize_segments)
-            
-            # words 필드 제거
-            integrated_segments["segments"] = self.whisper_util.remove_words_from_segments(integrated_segments["segments"])
+            timings = {}
+
+            # 0. 같은 오디오를 이미 처리했다면 전사 캐시에서 바로 가져옴
+            started = time.perf_counter()
+            cache_config = self.whisper_util.cache_config(profile=asr_profile)
+            cache_config["preprocess"] = preprocess
+            cache_config["preprocess_vad"] = preprocess and self.preprocess_vad
+            cache_key = self.transcript_cache.make_key(
+                self.transcript_cache.hash_file(temp_path),
+                cache_config
+            )
+            cached = self.transcript_cache.get(cache_key)
+            timings["transcript_cache_lookup"] = time.perf_counter() - started
+            transcript_cache_hit = cached is not None
+            align_cache = {}
+
+            if transcript_cache_hit:
+                transcript = Transcript.from_segments(cached["segments"])
+                preprocess_report = cached.get("audio_preprocess")
+            else:
+                # 1. 오디오를 한 번만 디코딩해서 모든 단계가 같은 파형을 공유
+                progress("decoding")
+                started = time.perf_counter()
+                waveform = decode_audio(temp_path)
+                timings["decode"] = time.perf_counter() - started
+
+                # 긴 무음 제거 + 음량 정규화 (타임스탬프는 offset_map 으로 원본 기준 복원)
+                offset_map = OffsetMap.identity()
+                preprocess_report = None
+                if preprocess:
+                    started = time.perf_counter()
+                    waveform, offset_map, preprocess_report = preprocess_audio(
+                        waveform,
+                        speech_intervals=self.whisper_util.speech_intervals if self.preprocess_vad else None
+                    )
+                    timings["preprocess"] = time.perf_counter() - started
+
+                # 2. SST 수행 + 화자 분리 수행 (PIPELINE_MODE=parallel 이면 동시에 실행)
+                progress("transcribing")
+                started = time.perf_counter()
+                whisper_result, diarize_segments, stage_timings = self.whisper_util.transcribe_and_diarize(waveform, profile=asr_profile)
+                timings.update(stage_timings)
+                timings["transcribe_diarize_wall"] = time.perf_counter() - started
+                
+                # 3. 세그먼트 통합 (단어 타임스탬프까지 배열 기반 Transcript 로 보관)
+                started = time.perf_counter()
+                integrated_segments = self.whisper_util.integrate_segments(whisper_result, diarize_segments)
+                transcript = Transcript.from_segments(integrated_segments["segments"])
+                transcript.remap_times(offset_map.to_original)
+                timings["integrate"] = time.perf_counter() - started
+                self.transcript_cache.put(cache_key, {
+                    "segments": transcript.to_segments(include_words=True),
+                    "audio_preprocess": preprocess_report
+                })
+
+                # 정렬 모델 로드 시간은 전사 시간에 포함되어 있으므로 분리해서 보고
+                align_cache = whisper_result.get("align_cache", {})
+                timings["align_model_load"] = align_cache.get("load_time", 0.0)
+
+            # 응답/저장용 JSON 형식 (words 제외)
+            meeting_segments = transcript.to_segments()
+            progress("transcribed", {"meetingTranscript": meeting_segments})
             
             # 4. 통합된 세그먼트를 S3에 저장
-            self.s3_util.save_meeting_segments(integrated_segments["segments"], user_id, meeting_date)
+            progress("saving")
+            started = time.perf_counter()
+            self.s3_util.save_meeting_segments(meeting_segments, user_id, meeting_date)
+            timings["s3_save"] = time.perf_counter() - started
 
-            # 5. 병렬로 추출 작업 수행
-            results = self.concurrent_processor.process_all(integrated_segments, meeting_date)
+            # 5. 병렬로 추출 작업 수행 (각 작업이 끝나는 대로 부분 결과 보고)
+            progress("extracting")
+            started = time.perf_counter()
+            results = self.concurrent_processor.process_all(
+                transcript,
+                meeting_date,
+                on_result=lambda name, value: progress("extracting", {self.RESULT_KEYS[name]: value})
+            )
+            timings["llm"] = time.perf_counter() - started
 
             result = {
-                "meetingTranscript": integrated_segments["segments"],
+                "meetingTranscript": meeting_segments,
                 "meetingSummary": results["summarize"],
                 "todos": results["todos"],
-                "schedule": results["schedule"]
+                "schedule": results["schedule"],
+                "metadata": {
+                    "timings": {name: round(value, 3) for name, value in timings.items()},
+                    "alignModelCacheHit": align_cache.get("cache_hit", False),
+                    "transcriptCacheHit": transcript_cache_hit,
+                    "asrProfile": asr_profile or self.whisper_util.default_profile,
+                    "audioPreprocess": preprocess_report
+                }
             }
 
-            print("resultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresultresult:", result)
-            
             return result
             
         finally:
@@ -73,12 +189,43 @@ class APIService:
             cleanup_temp_file(temp_path)
 
 
+    def stream_saved_audio(self, temp_path: str) -> Iterator[Tuple[str, Dict]]:
+        """임시 파일로 저장된 오디오를 구간별로 전사하며 결과를 바로 내보냄 (처리 후 임시 파일 삭제)
+        
+        Args:
+            temp_path: 임시 오디오 파일 경로
+            
+        Yields:
+            (이벤트 이름, 데이터)
+        """
+        try:
+            waveform = decode_audio(temp_path)
+            yield from self.whisper_util.transcribe_stream(waveform)
+        finally:
+            cleanup_temp_file(temp_path)
+
+
 class ConcurrentProcessor:
-    """동시 실행을 위한 프로세서 클래스"""
+    """동시 실행을 위한 프로세서 클래스
+
+    추출 방식(LLM_EXTRACTION_MODE):
+        fanout: 요약/일정/할일 템플릿으로 LLM 을 세 번 동시에 호출 (기본값)
+        combined: 구조화된 LLM 호출 한 번으로 세 결과를 함께 추출 (실패 시 fanout 으로 전환)
+
+    회의록이 구간 토큰 예산(LLM_WINDOW_TOKENS)을 넘으면 map-reduce 로 처리한다
+    (LLM_MAP_REDUCE=false 로 끌 수 있음). 구간마다 fanout 추출을 병렬로 실행하고,
+    할 일/일정은 합친 뒤 중복을 제거하며 요약은 한 번 더 LLM 으로 압축한다.
+    """
+
+    EXTRACTION_MODES = ("fanout", "combined")
     
-    def __init__(self, langchain_util: LangChainUtil, date_util: DateUtil):
+    def __init__(self, langchain_util: LangChainUtil, date_util: DateUtil, mode: Optional[str] = None):
         self.langchain_util = langchain_util
         self.date_util = date_util
+        self.mode = (mode or os.getenv("LLM_EXTRACTION_MODE", "fanout")).lower()
+        self.event_loop = get_background_loop()
+        if self.mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"알 수 없는 추출 방식입니다: {self.mode} (가능한 값: {', '.join(self.EXTRACTION_MODES)})")
     
     def _validate_json_response(self, response, task_name: str) -> bool:
         """응답이 유효한 JSON인지 확인"""
@@ -99,116 +246,179 @@ class ConcurrentProcessor:
             print(f"{task_name}: JSON 검증 중 오류: {str(e)}")
             return False
     
-    def summarize_meeting(self, segments: Dict) -> Dict:
+    # 작업이 실패했을 때 사용할 기본 결과
+    DEFAULT_RESULTS = {
+        "summarize": {
+            "subject": "회의 요약 실패",
+            "summary": "회의 내용을 요약하는데 실패했습니다."
+        },
+        "schedule": {"items": []},
+        "todos": {"items": []}
+    }
+    TASK_LABELS = {"summarize": "회의 요약", "schedule": "일정 추출", "todos": "할일 추출"}
+
+    def _default_result(self, name: str) -> Dict:
+        return json.loads(json.dumps(self.DEFAULT_RESULTS[name]))
+
+    def _finalize(self, name: str, result) -> Dict:
+        """LLM 결과 후처리 (일정/할일 날짜 처리 + JSON 검증, 실패 시 기본 결과)"""
+        if name == "schedule" and isinstance(result, dict) and "items" in result:
+            result = {"items": self.date_util.process_schedule_dates(result["items"])}
+        elif name == "todos" and isinstance(result, dict) and "items" in result:
+            result = {"items": self.date_util.process_todo_dates(result["items"])}
+
+        if not self._validate_json_response(result, self.TASK_LABELS[name]) or not isinstance(result, dict):
+            return self._default_result(name)
+        return result
+    
+    def summarize_meeting(self, segments: Union[Transcript, Dict]) -> Dict:
         """회의 요약 처리"""
         try:
-            # 1. langchain_util.summarize_meeting 실행
-            result = self.langchain_util.summarize_meeting(segments)
-            
-            # 2. JSON 검증
-            if not self._validate_json_response(result, "회의 요약"):
-                return {
-                    "subject": "회의 요약 실패",
-                    "summary": "회의 내용을 요약하는데 실패했습니다."
-                }
-            
-            # 3. 결과 리턴
-            return result
-            
+            return self._finalize("summarize", self.langchain_util.summarize_meeting(segments))
         except Exception as e:
             print(f"회의 요약 처리 실패: {str(e)}")
-            return {
-                "subject": "회의 요약 실패",
-                "summary": "회의 내용을 요약하는데 실패했습니다."
-            }
+            return self._default_result("summarize")
     
-    def extract_schedule(self, segments: Dict, meeting_date: str) -> Dict:
+    def extract_schedule(self, segments: Union[Transcript, Dict], meeting_date: str) -> Dict:
         """일정 추출 처리"""
         try:
-            # 1. langchain_util.extract_schedule 실행
-            result = self.langchain_util.extract_schedule(segments, meeting_date)
-            
-            # 2. 날짜 처리
-            if "items" in result:
-                processed_items = self.date_util.process_schedule_dates(result["items"])
-                result = {"items": processed_items}
-            
-            # 3. JSON 검증
-            if not self._validate_json_response(result, "일정 추출"):
-                return {"items": []}
-            
-            # 4. 결과 리턴
-            return result
-            
+            return self._finalize("schedule", self.langchain_util.extract_schedule(segments, meeting_date))
         except Exception as e:
             print(f"일정 추출 처리 실패: {str(e)}")
-            return {"items": []}
+            return self._default_result("schedule")
     
-    def extract_todos(self, segments: Dict, meeting_date: str) -> Dict:
+    def extract_todos(self, segments: Union[Transcript, Dict], meeting_date: str) -> Dict:
         """할일 추출 처리"""
         try:
-            # 1. langchain_util.extract_todos 실행
-            result = self.langchain_util.extract_todos(segments, meeting_date)
-            
-            # 2. 날짜 처리
-            if "items" in result:
-                processed_items = self.date_util.process_todo_dates(result["items"])
-                result = {"items": processed_items}
-            
-            # 3. JSON 검증
-            if not self._validate_json_response(result, "할일 추출"):
-                return {"items": []}
-            
-            # 4. 결과 리턴
-            return result
-            
+            return self._finalize("todos", self.langchain_util.extract_todos(segments, meeting_date))
         except Exception as e:
             print(f"할일 추출 처리 실패: {str(e)}")
-            return {"items": []}
-    
-    def process_all(self, segments: Dict, meeting_date: str) -> Dict:
-        """세 메소드를 동시에 실행"""
+            return self._default_result("todos")
+
+    def task_timeout(self, name: str) -> float:
+        """작업별 제한 시간(초) (LLM_TIMEOUT_<TASK>, 기본값 LLM_TASK_TIMEOUT_SECONDS)"""
+        return float(os.getenv(f"LLM_TIMEOUT_{name.upper()}", os.getenv("LLM_TASK_TIMEOUT_SECONDS", "120")))
+
+    def _map_reduce_windows(self, segments) -> Optional[List[List[str]]]:
+        """map-reduce 가 필요하면 구간 목록, 아니면 None"""
+        if os.getenv("LLM_MAP_REDUCE", "true").lower() not in ("1", "true", "yes"):
+            return None
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def run_tasks():
-                with ThreadPoolExecutor(max_workers=3) as executor:
-                    # 세 태스크를 동시에 실행
-                    tasks = [
-                        loop.run_in_executor(executor, self.summarize_meeting, segments),
-                        loop.run_in_executor(executor, self.extract_schedule, segments, meeting_date),
-                        loop.run_in_executor(executor, self.extract_todos, segments, meeting_date)
-                    ]
-                    
-                    # 모든 태스크 완료 대기
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # 결과 처리
-                    processed_results = {}
-                    task_names = ["summarize", "schedule", "todos"]
-                    
-                    for i, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            print(f"{task_names[i]} 태스크 실패: {str(result)}")
-                            # 기본값 설정
-                            if task_names[i] == "summarize":
-                                processed_results[task_names[i]] = {
-                                    "subject": "회의 요약 실패",
-                                    "summary": "회의 내용을 요약하는데 실패했습니다."
-                                }
-                            else:
-                                processed_results[task_names[i]] = {"items": []}
-                        else:
-                            processed_results[task_names[i]] = result
-                    
-                    return processed_results
-            
+            windows = self.langchain_util.split_transcript(segments)
+        except Exception as e:
+            print(f"회의록 구간 분할 실패: {str(e)}")
+            return None
+        return windows if len(windows) > 1 else None
+
+    async def _run_map_reduce(self, name: str, windows: List[List[str]], meeting_date: str):
+        """구간별 추출(map)을 병렬로 실행하고 결과를 합침(reduce)"""
+        partials = await asyncio.gather(
+            *(self._run_task(name, window, meeting_date) for window in windows),
+            return_exceptions=True
+        )
+        succeeded = []
+        for index, partial in enumerate(partials):
+            if isinstance(partial, BaseException):
+                print(f"{name} 구간 {index + 1}/{len(windows)} 실패: {str(partial)}")
+            elif isinstance(partial, dict):
+                succeeded.append(partial)
+        if not succeeded:
+            raise RuntimeError(f"{name}: 모든 구간 추출 실패")
+
+        if name != "summarize":
+            return {"items": merge_extracted_items([partial.get("items", []) for partial in succeeded])}
+
+        if len(succeeded) == 1:
+            return succeeded[0]
+
+        async def reduce():
+            async with self.event_loop.limit("reduce"):
+                return await self.langchain_util.areduce_summaries(succeeded)
+        return await asyncio.wait_for(reduce(), timeout=self.task_timeout("reduce"))
+
+    async def _run_task(self, name: str, segments, meeting_date: str):
+        """공유 이벤트 루프에서 LLM 작업 하나 실행 (작업별 동시 실행 제한 + 제한 시간)
+
+        동시 실행 제한을 기다리는 시간도 제한 시간에 포함한다.
+        """
+        async def limited():
+            async with self.event_loop.limit(name):
+                return await self.langchain_util.arun_task(name, segments, meeting_date)
+        return await asyncio.wait_for(limited(), timeout=self.task_timeout(name))
+    
+    def extract_combined(self, segments: Union[Transcript, Dict], meeting_date: str) -> Dict:
+        """요약/일정/할일 통합 추출 처리 (한 번의 LLM 호출)"""
+        result = self.event_loop.run(self._run_task("extract", segments, meeting_date))
+        return {
+            "summarize": result["summary"],
+            "schedule": {"items": self.date_util.process_schedule_dates(result["schedule"]["items"])},
+            "todos": {"items": self.date_util.process_todo_dates(result["todos"]["items"])}
+        }
+
+    def process_all(self,
+                    segments: Union[Transcript, Dict],
+                    meeting_date: str,
+                    on_result: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+        """세 메소드를 동시에 실행
+        
+        프로세스 공유 이벤트 루프에서 체인의 ainvoke 로 실행하므로 요청마다 루프나
+        스레드 풀을 만들지 않는다. 제한 시간을 넘긴 작업은 취소되고 기본 결과가 쓰인다.
+        
+        Args:
+            segments: 통합된 세그먼트 (Transcript 또는 {"segments": [...]})
+            meeting_date: 회의 날짜
+            on_result: 작업 하나가 끝날 때마다 (작업 이름, 결과)로 호출되는 콜백
+        """
+        def notify(name: str, result: Dict) -> None:
+            if on_result is not None:
+                try:
+                    on_result(name, result)
+                except Exception as e:
+                    print(f"{name} 결과 콜백 실패: {str(e)}")
+
+        windows = self._map_reduce_windows(segments)
+        if windows:
+            print(f"회의록이 길어 {len(windows)}개 구간으로 나누어 map-reduce 추출")
+
+        if self.mode == "combined" and windows:
+            print("통합 추출은 한 구간에 들어가는 회의록에만 사용, 구간별 개별 추출로 전환")
+        elif self.mode == "combined":
             try:
-                return loop.run_until_complete(run_tasks())
-            finally:
-                loop.close()
-                
+                results = self.extract_combined(segments, meeting_date)
+                for name, result in results.items():
+                    notify(name, result)
+                return results
+            except Exception as e:
+                print(f"통합 추출 실패, 개별 추출로 전환: {str(e)}")
+
+        task_names = ["summarize", "schedule", "todos"]
+
+        async def run_and_notify(name: str) -> Dict:
+            try:
+                if windows:
+                    raw = await self._run_map_reduce(name, windows, meeting_date)
+                else:
+                    raw = await self._run_task(name, segments, meeting_date)
+                result = self._finalize(name, raw)
+            except asyncio.TimeoutError:
+                print(f"{name} 태스크 시간 초과 ({self.task_timeout(name)}s)")
+                result = self._default_result(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"{name} 태스크 실패: {str(e)}")
+                result = self._default_result(name)
+            # 콜백은 요청 쪽 코드이므로 루프를 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(notify, name, result)
+            return result
+
+        async def run_tasks() -> Dict:
+            # 세 태스크를 동시에 실행
+            results = await asyncio.gather(*(run_and_notify(name) for name in task_names))
+            return dict(zip(task_names, results))
+
+        try:
+            return self.event_loop.run(run_tasks())
         except Exception as e:
             print(f"병렬 처리 실패: {str(e)}")
             # 실패 시 기본값 반환
@@ -219,4 +429,4 @@ class ConcurrentProcessor:
                 },
                 "schedule": {"items": []},
                 "todos": {"items": []}
-            }
\ No newline at end of file
+            }
@@ -0,0 +1,231 @@
+import os
+import threading
+from typing import Any, Callable, Dict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ServiceContainer:
+    """외부 클라이언트와 서비스를 한 번씩만 만들어 모든 블루프린트가 공유하는 컨테이너
+
+    각 항목은 처음 사용할 때 생성된다. boto3/httpx/Pinecone 클라이언트는 fork 후
+    부모의 커넥션을 그대로 쓰면 안 되므로, 프로세스가 바뀌면(예: gunicorn preload 후
+    워커 fork) 만들어 둔 인스턴스를 버리고 자식 프로세스에서 다시 생성한다.
+    """
+
+    def __init__(self):
+        # 커넥션 풀 크기 (동시 요청 수에 맞춰 조정)
+        self.aws_max_pool_connections = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
+        self.http_max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+        self.http_max_keepalive = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+        self._instances: Dict[str, Any] = {}
+        # 항목별 생성 잠금 (느린 생성이 다른 항목 조회를 막지 않도록)
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _key_lock(self, name: str) -> threading.Lock:
+        """항목 생성 잠금 (프로세스가 바뀌었으면 인스턴스와 잠금을 모두 새로 만듦)"""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._instances = {}
+                self._key_locks = {}
+                self._pid = os.getpid()
+            if name not in self._key_locks:
+                self._key_locks[name] = threading.Lock()
+            return self._key_locks[name]
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        # 이미 만든 항목은 잠금 없이 반환
+        if self._pid == os.getpid():
+            instance = self._instances.get(name)
+            if instance is not None:
+                return instance
+
+        # 생성은 항목별 잠금 안에서 다시 확인한 뒤 한 번만 (WhisperUtil 처럼 수십 초 걸려도
+        # 다른 항목은 기다리지 않음, 의존 항목은 각자의 잠금으로 생성)
+        with self._key_lock(name):
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = factory()
+                self._instances[name] = instance
+            return instance
+
+    def reset(self) -> None:
+        """만들어 둔 인스턴스 전체 폐기 (다음 사용 시 다시 생성)"""
+        with self._lock:
+            self._instances = {}
+
+    # 공유 클라이언트
+    @property
+    def aws_session(self):
+        def factory():
+            import boto3
+            return boto3.session.Session(
+                region_name=os.getenv("AWS_REGION"),
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
+            )
+        return self._get("aws_session", factory)
+
+    def _aws_client(self, service_name: str):
+        from botocore.config import Config
+        return self.aws_session.client(
+            service_name,
+            config=Config(
+                max_pool_connections=self.aws_max_pool_connections,
+                retries={"max_attempts": 3, "mode": "adaptive"}
+            )
+        )
+
+    @property
+    def s3_client(self):
+        return self._get("s3_client", lambda: self._aws_client("s3"))
+
+    @property
+    def bedrock_runtime_client(self):
+        return self._get("bedrock_runtime_client", lambda: self._aws_client("bedrock-runtime"))
+
+    @property
+    def bedrock_agent_client(self):
+        return self._get("bedrock_agent_client", lambda: self._aws_client("bedrock-agent-runtime"))
+
+    @property
+    def http_client(self):
+        """OpenAI SDK 와 LangChain 이 함께 쓰는 httpx 클라이언트"""
+        def factory():
+            import httpx
+            return httpx.Client(limits=httpx.Limits(
+                max_connections=self.http_max_connections,
+                max_keepalive_connections=self.http_max_keepalive
+            ))
+        return self._get("http_client", factory)
+
+    @property
+    def http_async_client(self):
+        """LangChain ainvoke 용 httpx 비동기 클라이언트 (공유 이벤트 루프에서만 사용)"""
+        def factory():
+            import httpx
+            return httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=self.http_max_connections,
+                max_keepalive_connections=self.http_max_keepalive
+            ))
+        return self._get("http_async_client", factory)
+
+    @property
+    def openai_client(self):
+        def factory():
+            from openai import OpenAI
+            return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self.http_client)
+        return self._get("openai_client", factory)
+
+    @property
+    def llm_cache(self):
+        def factory():
+            from app.utils.llm_cache_util import LLMResponseCache
+            return LLMResponseCache()
+        return self._get("llm_cache", factory)
+
+    # 유틸
+    @property
+    def s3_util(self):
+        def factory():
+            from app.utils.s3_util import S3Util
+            return S3Util(s3_client=self.s3_client)
+        return self._get("s3_util", factory)
+
+    @property
+    def bedrock_util(self):
+        def factory():
+            from app.utils.bedrock_util import BedrockUtil
+            return BedrockUtil(
+                runtime_client=self.bedrock_runtime_client,
+                s3_client=self.s3_client,
+                llm_cache=self.llm_cache
+            )
+        return self._get("bedrock_util", factory)
+
+    @property
+    def embedding_util(self):
+        def factory():
+            from app.utils.embedding_util import EmbeddingUtil
+            return EmbeddingUtil(client=self.openai_client)
+        return self._get("embedding_util", factory)
+
+    @property
+    def vector_db_util(self):
+        def factory():
+            from app.utils.vector_db_util import VectorDBUtil
+            return VectorDBUtil()
+        return self._get("vector_db_util", factory)
+
+    @property
+    def langchain_util(self):
+        def factory():
+            from app.utils.langchain_util import LangChainUtil
+            return LangChainUtil(
+                http_client=self.http_client,
+                http_async_client=self.http_async_client,
+                llm_cache=self.llm_cache
+            )
+        return self._get("langchain_util", factory)
+
+    @property
+    def whisper_util(self):
+        # torch/whisperx 는 asr 역할에서 처음 사용할 때만 import
+        def factory():
+            from app.utils.whisper_util import WhisperUtil
+            return WhisperUtil()
+        return self._get("whisper_util", factory)
+
+    @property
+    def llm_router(self):
+        """rag 텍스트 API 가 쓰는 LLM 공급자 라우터 (LLM_ROUTER_BACKENDS 순서가 기본 우선순위)"""
+        def factory():
+            from app.utils.llm_router_util import LLMRouter, BedrockProvider, OpenAIProvider
+            available = {
+                "bedrock": lambda: BedrockProvider(self.bedrock_util),
+                "openai": lambda: OpenAIProvider(self.langchain_util)
+            }
+            names = [name.strip() for name in os.getenv("LLM_ROUTER_BACKENDS", "bedrock,openai").split(",") if name.strip()]
+            unknown = [name for name in names if name not in available]
+            if unknown:
+                raise ValueError(f"지원하지 않는 LLM_ROUTER_BACKENDS: {unknown}")
+            return LLMRouter([available[name]() for name in names])
+        return self._get("llm_router", factory)
+
+    # 서비스
+    @property
+    def api_service(self):
+        def factory():
+            from app.services.api_service import APIService
+            return APIService(
+                whisper_util=self.whisper_util,
+                langchain_util=self.langchain_util,
+                s3_util=self.s3_util
+            )
+        return self._get("api_service", factory)
+
+    @property
+    def rag_service(self):
+        def factory():
+            from app.services.rag_service import RAGService
+            return RAGService(
+                bedrock_util=self.bedrock_util,
+                s3_util=self.s3_util,
+                embedding_util=self.embedding_util,
+                vector_db_util=self.vector_db_util,
+                langchain_util=self.langchain_util,
+                llm_router=self.llm_router
+            )
+        return self._get("rag_service", factory)
+
+
+_container = ServiceContainer()
+
+
+def get_container() -> ServiceContainer:
+    """프로세스 전체에서 공유하는 서비스 컨테이너"""
+    return _container
@@ -0,0 +1,129 @@
+from typing import Callable, Dict, Optional
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업이 너무 많아 새 작업을 받을 수 없음"""
+
+
+class JobService:
+    """프로세스 내 비동기 작업 큐
+
+    제한된 크기의 워커 풀에서 작업을 실행하고, 진행 단계와 부분 결과를 보관한다.
+    완료(성공/실패)된 작업은 TTL이 지나면 삭제된다.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 max_pending: Optional[int] = None,
+                 ttl_seconds: Optional[int] = None):
+        self.max_workers = max_workers or int(os.getenv("JOB_MAX_WORKERS", "2"))
+        self.max_pending = max_pending or int(os.getenv("JOB_MAX_PENDING", "20"))
+        self.ttl_seconds = ttl_seconds or int(os.getenv("JOB_TTL_SECONDS", "3600"))
+
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _purge_expired(self) -> None:
+        """TTL이 지난 완료 작업 삭제 (잠금을 잡은 상태에서 호출)"""
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None and now - job["finished_at"] > self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def submit(self, func: Callable, *args, **kwargs) -> str:
+        """작업 등록
+
+        func 는 progress(stage, partial_result) 콜백을 키워드 인자로 받는다.
+
+        Args:
+            func: 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            작업 ID
+        """
+        with self._lock:
+            self._purge_expired()
+            pending = sum(1 for job in self._jobs.values() if job["status"] in ("queued", "running"))
+            if pending >= self.max_pending:
+                raise JobQueueFullError("처리 대기 중인 작업이 너무 많습니다.")
+
+            job_id = uuid.uuid4().hex
+            now = time.time()
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "status": "queued",
+                "stage": "queued",
+                "result": {},
+                "error": None,
+                "created_at": now,
+                "updated_at": now,
+                "finished_at": None
+            }
+
+        self.executor.submit(self._run, job_id, func, *args, **kwargs)
+        return job_id
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            job["updated_at"] = time.time()
+
+    def _run(self, job_id: str, func: Callable, *args, **kwargs) -> None:
+        def progress(stage: str, partial_result: Optional[Dict] = None) -> None:
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                job["stage"] = stage
+                if partial_result:
+                    job["result"].update(partial_result)
+                job["updated_at"] = time.time()
+
+        self._update(job_id, status="running", stage="started")
+        try:
+            result = func(*args, progress=progress, **kwargs)
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None and result:
+                    job["result"].update(result)
+            self._update(job_id, status="completed", stage="completed", finished_at=time.time())
+        except Exception as e:
+            print(f"작업 실패 ({job_id}): {str(e)}")
+            self._update(job_id, status="failed", error=str(e), finished_at=time.time())
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 상태 (단계, 부분 결과 포함) 또는 None
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = dict(job)
+            snapshot["result"] = dict(job["result"])
+
+        if snapshot["finished_at"] is not None:
+            snapshot["expires_at"] = snapshot["finished_at"] + self.ttl_seconds
+        return snapshot
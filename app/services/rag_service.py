@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 import json
 from datetime import datetime
 import os
@@ -8,8 +8,7 @@ from app.utils.s3_util import S3Util
 from app.utils.embedding_util import EmbeddingUtil
 from app.utils.vector_db_util import VectorDBUtil
 from app.utils.langchain_util import LangChainUtil
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from app.utils.llm_router_util import LLMRouter
 
 load_dotenv()
 
@@ -19,13 +18,15 @@ class RAGService:
                  s3_util: S3Util,
                  embedding_util: EmbeddingUtil,
                  vector_db_util: VectorDBUtil,
-                 langchain_util: LangChainUtil):
+                 langchain_util: LangChainUtil,
+                 llm_router: Optional[LLMRouter] = None):
         self.bedrock_util = bedrock_util
         self.s3_util = s3_util
         self.embedding_util = embedding_util
         self.vector_db_util = vector_db_util
         self.langchain_util = langchain_util
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        # 있으면 단일 텍스트 요약/할일/일정을 지연 시간이 가장 좋은 공급자로 보냄
+        self.llm_router = llm_router
         
     def process_meeting(self, 
                        segments: List[Dict], 
@@ -118,7 +119,81 @@ class RAGService:
             
         except Exception as e:
             raise Exception(f"회의 처리 중 오류 발생: {str(e)}")
-        
+
+    # 단일 텍스트 기반 요약/할일/일정 (/rag/summary, /rag/todos, /rag/schedules)
+    def _route_text_task(self, task: str, text: str, default):
+        """라우터로 작업 실행 (모든 공급자가 실패하면 기본값)"""
+        try:
+            return self.llm_router.run(task, text, timeout=float(os.getenv("LLM_ROUTER_TIMEOUT_SECONDS", "120")))
+        except Exception as e:
+            print(f"{task} 실패: {str(e)}")
+            return default
+
+    def summarize_text(self, text: str) -> Dict:
+        if self.llm_router is not None:
+            return self._route_text_task("summary", text, {"subject": "", "summary": "요약 실패"})
+        return self.bedrock_util.summarize_meeting(text)
+
+    def extract_todos(self, text: str) -> List[Dict]:
+        if self.llm_router is not None:
+            return self._route_text_task("todos", text, [])
+        return self.bedrock_util.extract_todos(text)
+
+    def extract_schedules(self, text: str) -> List[Dict]:
+        if self.llm_router is not None:
+            return self._route_text_task("schedules", text, [])
+        return self.bedrock_util.extract_schedule(text)
+
+    def stream_text_task(self, task: str, text: str) -> Iterator[Tuple[str, Dict]]:
+        """단일 텍스트 요약/할일/일정 추출을 SSE 이벤트로 스트리밍
+
+        Args:
+            task: summary, todos, schedules 중 하나
+            text: 회의 텍스트
+
+        Returns:
+            (이벤트, 데이터) 이터레이터
+            - token: {"text": 응답 텍스트 조각}
+            - item: {"index": 순번, "item": 완성된 할 일/일정} (객체가 닫히는 즉시)
+            - result: {task: 최종 결과} (비스트리밍 API 응답과 같은 형식)
+        """
+        index = 0
+        for event, data in self.bedrock_util.stream_task(task, text):
+            if event == "token":
+                yield "token", {"text": data}
+            elif event == "item":
+                yield "item", {"index": index, "item": data}
+                index += 1
+            else:
+                yield "result", {task: data}
+
+    # S3 전체 파일 요약/할일/일정 (/rag/*/all)
+    def summarize_all_files(self) -> List[Dict]:
+        return self.bedrock_util.summarize_all_files()
+
+    def generate_todos(self) -> List[Dict]:
+        return self.bedrock_util.generate_all_todos()
+
+    def generate_schedules(self) -> List[Dict]:
+        return self.bedrock_util.generate_all_schedules()
+
+    def stream_all_files(self, tasks: Tuple[str, ...]) -> Iterator[Tuple[str, Dict]]:
+        """S3 전체 파일 처리 결과를 파일이 끝날 때마다 SSE 이벤트로 스트리밍
+
+        Args:
+            tasks: summary, todos, schedules 중 실행할 작업
+
+        Returns:
+            (이벤트, 데이터) 이터레이터
+            - file: {"index", "file", 작업 이름: 결과} (파일을 읽지 못하면 "error")
+            - done: {"files": 처리한 파일 수}
+        """
+        count = 0
+        for result in self.bedrock_util.iter_batch(tasks):
+            count += 1
+            yield "file", result
+        yield "done", {"files": count}
+
     def _process_rag(self, segments: List[Dict], user_id: str, meeting_date: str):
         """RAG 처리를 위한 백그라운드 작업"""
         try:
@@ -170,10 +245,6 @@ class RAGService:
         except Exception as e:
             print(f"RAG 처리 중 오류 발생: {str(e)}")
             
-    def __del__(self):
-        """ThreadPoolExecutor 정리"""
-        self.executor.shutdown(wait=False)
-        
     def _format_segments(self, segments: List[Dict]) -> str:
         """회의 세그먼트를 텍스트로 변환
         
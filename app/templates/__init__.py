@@ -3,13 +3,17 @@
 """
 
 from .prompts import RELATIVE_DATE_TEMPLATE
-from .meeting import SUMMARIZE_MEETING_TEMPLATE
+from .meeting import SUMMARIZE_MEETING_TEMPLATE, REDUCE_SUMMARY_TEMPLATE
 from .schedule import SCHEDULE_TEMPLATE
 from .todo import TODO_TEMPLATE
+from .extraction import MEETING_EXTRACTION_TEMPLATE, MEETING_EXTRACTION_SCHEMA
 
 __all__ = [
     'RELATIVE_DATE_TEMPLATE',
     'SUMMARIZE_MEETING_TEMPLATE',
+    'REDUCE_SUMMARY_TEMPLATE',
     'SCHEDULE_TEMPLATE',
-    'TODO_TEMPLATE'
+    'TODO_TEMPLATE',
+    'MEETING_EXTRACTION_TEMPLATE',
+    'MEETING_EXTRACTION_SCHEMA'
 ] 
\ No newline at end of file
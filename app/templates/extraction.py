@@ -0,0 +1,88 @@
+"""
+회의 통합 추출(요약 + 할일 + 일정) 템플릿 모듈
+"""
+
+MEETING_EXTRACTION_TEMPLATE = """
+너는 회의록 분석 전문가다.
+다음 회의록을 한 번 읽고 요약, 할 일(TODO), 일정을 모두 추출하라.
+현재 회의 날짜는 {meeting_date}이다.
+
+반드시 아래와 같은 JSON 하나로 응답:
+{{
+    "summary": {{
+        "subject": "회의 주제",
+        "summary": "회의 내용 요약"
+    }},
+    "todos": {{
+        "items": [
+            {{
+                "text": "할 일 내용",
+                "start": 할 일 시작까지 {relative_date_template},
+                "end": 할 일 종료까지 {relative_date_template}
+            }}
+        ]
+    }},
+    "schedule": {{
+        "items": [
+            {{
+                "text": "일정 내용",
+                "start": 일정 시작까지 {relative_date_template},
+                "end": 일정 종료까지 {relative_date_template},
+                "place": 장소
+            }}
+        ]
+    }}
+}}
+단, start, end, place에 대한 내용이 없다면 없는 값에 null 입력
+
+네가 분석할 회의록:
+{transcript}
+각 발언은 "화자: 내용" 형식임.
+"""
+
+_NULLABLE_STRING = {"type": ["string", "null"]}
+
+
+def _items_schema(fields):
+    return {
+        "type": "object",
+        "additionalProperties": False,
+        "required": ["items"],
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "required": ["text"] + list(fields),
+                    "properties": {
+                        "text": {"type": "string"},
+                        **{field: _NULLABLE_STRING for field in fields}
+                    }
+                }
+            }
+        }
+    }
+
+
+# OpenAI structured output(strict) 에 그대로 넘기는 JSON 스키마
+MEETING_EXTRACTION_SCHEMA = {
+    "title": "meeting_extraction",
+    "description": "회의 요약, 할 일, 일정",
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["summary", "todos", "schedule"],
+    "properties": {
+        "summary": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["subject", "summary"],
+            "properties": {
+                "subject": {"type": "string"},
+                "summary": {"type": "string"}
+            }
+        },
+        "todos": _items_schema(["start", "end"]),
+        "schedule": _items_schema(["start", "end", "place"])
+    }
+}
@@ -15,4 +15,18 @@ SUMMARIZE_MEETING_TEMPLATE = """
 네가 요약할 회의록:
 {transcript}
 각 발언은 "화자: 내용" 형식임.
-""" 
\ No newline at end of file
+""" 
+REDUCE_SUMMARY_TEMPLATE = """
+너는 회의록 요약 전문가다.
+다음은 긴 회의를 시간 순서대로 나눈 구간별 요약이다.
+구간별 요약을 합쳐 회의 전체에 대한 하나의 요약으로 정리하라. 중복된 내용은 한 번만 쓴다.
+
+반드시 아래와 같은 JSON으로 응답:
+{{
+    "subject": "회의 주제",
+    "summary": "회의 내용 요약"
+}}
+
+구간별 요약 (JSON 배열, 시간 순서):
+{summaries}
+"""
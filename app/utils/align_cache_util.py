@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import torch
+import whisperx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class AlignModelCache:
+    """언어별 WhisperX 정렬(wav2vec2) 모델 캐시
+
+    한 번 로드한 정렬 모델을 재사용하고, 전체 메모리 사용량이 상한을 넘으면
+    가장 오래 사용하지 않은 언어의 모델부터 내린다(LRU).
+    """
+
+    def __init__(self, device: str, max_memory_mb: Optional[float] = None):
+        self.device = device
+        if max_memory_mb is None:
+            max_memory_mb = float(os.getenv("ALIGN_MODEL_CACHE_MAX_MB", "2048"))
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+
+        self._models: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "total_load_time": 0.0,
+            "load_times": {}
+        }
+
+    @staticmethod
+    def _estimate_model_bytes(model: torch.nn.Module) -> int:
+        """모델 파라미터와 버퍼가 차지하는 메모리(바이트) 추정"""
+        total = 0
+        for tensor in list(model.parameters()) + list(model.buffers()):
+            total += tensor.numel() * tensor.element_size()
+        return total
+
+    def _memory_in_use(self) -> int:
+        return sum(entry["bytes"] for entry in self._models.values())
+
+    def _evict_if_needed(self, keep: str) -> None:
+        """메모리 상한을 넘으면 LRU 순서로 모델 제거 (방금 로드한 모델은 제외)"""
+        while self._memory_in_use() > self.max_memory_bytes and len(self._models) > 1:
+            language = next(iter(self._models))
+            if language == keep:
+                self._models.move_to_end(language)
+                continue
+            self._models.pop(language)
+            self._stats["evictions"] += 1
+            print(f"정렬 모델 캐시에서 제거: {language}")
+
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
+
+    def get(self, language_code: str) -> Tuple[torch.nn.Module, Dict, Dict]:
+        """정렬 모델 조회 (없으면 로드)
+
+        Args:
+            language_code: 언어 코드 (예: ko)
+
+        Returns:
+            Tuple[정렬 모델, 모델 메타데이터, 캐시 정보(cache_hit, load_time)]
+        """
+        with self._lock:
+            entry = self._models.get(language_code)
+            if entry is not None:
+                self._models.move_to_end(language_code)
+                self._stats["hits"] += 1
+                return entry["model"], entry["metadata"], {
+                    "language": language_code,
+                    "cache_hit": True,
+                    "load_time": 0.0
+                }
+            load_lock = self._load_locks.setdefault(language_code, threading.Lock())
+
+        # 같은 언어를 동시에 여러 번 로드하지 않도록 언어별 잠금
+        with load_lock:
+            with self._lock:
+                entry = self._models.get(language_code)
+                if entry is not None:
+                    self._models.move_to_end(language_code)
+                    self._stats["hits"] += 1
+                    return entry["model"], entry["metadata"], {
+                        "language": language_code,
+                        "cache_hit": True,
+                        "load_time": 0.0
+                    }
+
+            started = time.perf_counter()
+            model, metadata = whisperx.load_align_model(language_code=language_code, device=self.device)
+            load_time = time.perf_counter() - started
+            print(f"정렬 모델 로드 완료: {language_code} ({load_time:.2f}s)")
+
+            with self._lock:
+                self._models[language_code] = {
+                    "model": model,
+                    "metadata": metadata,
+                    "bytes": self._estimate_model_bytes(model)
+                }
+                self._stats["misses"] += 1
+                self._stats["total_load_time"] += load_time
+                self._stats["load_times"][language_code] = load_time
+                self._evict_if_needed(keep=language_code)
+
+        return model, metadata, {
+            "language": language_code,
+            "cache_hit": False,
+            "load_time": load_time
+        }
+
+    def preload(self, language_codes) -> None:
+        """서버 시작 시 정렬 모델 미리 로드"""
+        for language_code in language_codes:
+            try:
+                self.get(language_code)
+            except Exception as e:
+                print(f"정렬 모델 사전 로드 실패 ({language_code}): {e}")
+
+    def clear(self) -> None:
+        """캐시된 정렬 모델 전체 제거"""
+        with self._lock:
+            self._models.clear()
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
+
+    def stats(self) -> Dict:
+        """캐시 적중/로드 시간 통계"""
+        with self._lock:
+            return {
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "evictions": self._stats["evictions"],
+                "total_load_time": round(self._stats["total_load_time"], 3),
+                "load_times": {k: round(v, 3) for k, v in self._stats["load_times"].items()},
+                "cached_languages": list(self._models.keys()),
+                "memory_mb": round(self._memory_in_use() / (1024 * 1024), 1),
+                "max_memory_mb": round(self.max_memory_bytes / (1024 * 1024), 1)
+            }
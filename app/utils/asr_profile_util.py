@@ -0,0 +1,199 @@
+import os
+import sys
+import json
+import time
+import queue
+import multiprocessing
+from datetime import datetime
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 정확도가 높은 순서로 나열 (캘리브레이션 시 목표 속도를 만족하는 가장 앞 프로필 선택)
+ASR_PROFILES = {
+    "accurate": {"model": "small", "compute_type": "float32", "batch_size": 16},
+    "balanced": {"model": "base", "compute_type": "float32", "batch_size": 16},
+    "latency": {"model": "base", "compute_type": "int8", "batch_size": 8},
+}
+
+DEFAULT_PROFILE = "balanced"
+CALIBRATION_FILE = os.getenv(
+    "ASR_CALIBRATION_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache", "asr_calibration.json")
+)
+CALIBRATION_AUDIO_FILES = ["moat1.mp3", "aod.mp3"]
+
+
+def get_profile(name: str) -> Dict:
+    """프로필 설정 조회
+
+    Args:
+        name: 프로필 이름
+
+    Returns:
+        프로필 설정 (model, compute_type, batch_size)
+    """
+    if name not in ASR_PROFILES:
+        raise ValueError(f"알 수 없는 ASR 프로필입니다: {name} (가능한 값: {', '.join(ASR_PROFILES)})")
+    return ASR_PROFILES[name]
+
+
+def load_calibration() -> Optional[Dict]:
+    """저장된 캘리브레이션 결과 조회 (없으면 None)"""
+    try:
+        with open(CALIBRATION_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def resolve_default_profile() -> str:
+    """배포 기본 프로필 결정
+
+    ASR_PROFILE 환경 변수 > 캘리브레이션 결과 > balanced 순서로 사용한다.
+    """
+    name = os.getenv("ASR_PROFILE")
+    if name:
+        get_profile(name)
+        return name
+
+    calibration = load_calibration()
+    if calibration and calibration.get("best_profile") in ASR_PROFILES:
+        return calibration["best_profile"]
+
+    return DEFAULT_PROFILE
+
+
+def _measure_profile(name: str, audio_paths: List[str], device: str, result_queue) -> None:
+    """별도 프로세스에서 프로필 하나의 실시간 배율(RTF)과 메모리 측정"""
+    try:
+        import whisperx
+        from app.utils.audio_utils import decode_audio, SAMPLE_RATE
+        from app.utils.memory_util import get_rss_mb, get_peak_rss_mb
+
+        profile = get_profile(name)
+        rss_before = get_rss_mb()
+
+        started = time.perf_counter()
+        model = whisperx.load_model(profile["model"], device, compute_type=profile["compute_type"])
+        load_time = time.perf_counter() - started
+
+        audio_seconds = 0.0
+        transcribe_seconds = 0.0
+        for path in audio_paths:
+            waveform = decode_audio(path)
+            audio_seconds += len(waveform) / SAMPLE_RATE
+            started = time.perf_counter()
+            model.transcribe(waveform, batch_size=profile["batch_size"], language="ko")
+            transcribe_seconds += time.perf_counter() - started
+
+        rss_after = get_rss_mb()
+        result_queue.put({
+            "profile": name,
+            "load_time": round(load_time, 3),
+            "audio_seconds": round(audio_seconds, 3),
+            "transcribe_seconds": round(transcribe_seconds, 3),
+            "rtf": round(transcribe_seconds / audio_seconds, 4) if audio_seconds else None,
+            "rss_mb": round(rss_after - rss_before, 1) if rss_before is not None and rss_after is not None else None,
+            "peak_rss_mb": get_peak_rss_mb()
+        })
+    except Exception as e:
+        result_queue.put({"profile": name, "error": str(e)})
+
+
+def _wait_measurement(name: str, process, result_queue, timeout: float) -> Dict:
+    """측정 프로세스 결과 대기 (프로세스가 결과 없이 죽거나 시간을 넘기면 실패로 기록)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return result_queue.get(timeout=1.0)
+        except queue.Empty:
+            pass
+        if not process.is_alive():
+            # 종료 직전에 넣은 결과가 남아 있을 수 있으므로 한 번 더 확인
+            try:
+                return result_queue.get(timeout=1.0)
+            except queue.Empty:
+                # 예: 메모리 부족으로 강제 종료되어 결과를 넣지 못함
+                return {"profile": name, "error": f"측정 프로세스 비정상 종료 (exitcode {process.exitcode})"}
+        if time.monotonic() > deadline:
+            process.terminate()
+            return {"profile": name, "error": f"측정 시간 초과 ({timeout}s)"}
+
+
+def calibrate(audio_paths: List[str],
+              device: str = "cpu",
+              target_rtf: Optional[float] = None,
+              max_memory_mb: Optional[float] = None,
+              timeout: Optional[float] = None) -> Dict:
+    """번들 오디오로 모든 프로필을 측정하고 현재 하드웨어에 가장 맞는 프로필 기록
+
+    목표 RTF 와 메모리 상한을 만족하는 프로필 중 가장 정확한 것을 고르고,
+    만족하는 프로필이 없으면 가장 빠른 프로필을 고른다.
+
+    Args:
+        audio_paths: 측정에 사용할 오디오 파일 경로 목록
+        device: cpu 또는 cuda
+        target_rtf: 목표 실시간 배율 (기본값 ASR_TARGET_RTF 또는 0.3)
+        max_memory_mb: 메모리 상한 (기본값 ASR_MAX_MEMORY_MB, 없으면 제한 없음)
+        timeout: 프로필 하나의 측정 제한 시간(초) (기본값 ASR_CALIBRATION_TIMEOUT_SECONDS 또는 1800)
+
+    Returns:
+        캘리브레이션 결과 (파일로도 저장됨)
+    """
+    if target_rtf is None:
+        target_rtf = float(os.getenv("ASR_TARGET_RTF", "0.3"))
+    if max_memory_mb is None and os.getenv("ASR_MAX_MEMORY_MB"):
+        max_memory_mb = float(os.getenv("ASR_MAX_MEMORY_MB"))
+    if timeout is None:
+        timeout = float(os.getenv("ASR_CALIBRATION_TIMEOUT_SECONDS", "1800"))
+
+    # 프로필마다 새 프로세스에서 측정해야 메모리 측정이 서로 섞이지 않음
+    context = multiprocessing.get_context("spawn")
+    measurements = []
+    for name in ASR_PROFILES:
+        result_queue = context.Queue()
+        process = context.Process(target=_measure_profile, args=(name, audio_paths, device, result_queue))
+        process.start()
+        measurement = _wait_measurement(name, process, result_queue, timeout)
+        process.join()
+        measurements.append(measurement)
+        print(f"프로필 측정 완료: {measurement}")
+
+    valid = [m for m in measurements if "error" not in m and m["rtf"] is not None]
+    if not valid:
+        raise RuntimeError("측정에 성공한 ASR 프로필이 없습니다.")
+
+    best = None
+    for m in valid:
+        fits_memory = max_memory_mb is None or m["rss_mb"] is None or m["rss_mb"] <= max_memory_mb
+        if m["rtf"] <= target_rtf and fits_memory:
+            best = m["profile"]
+            break
+    if best is None:
+        best = min(valid, key=lambda m: m["rtf"])["profile"]
+
+    calibration = {
+        "best_profile": best,
+        "device": device,
+        "cpu_count": os.cpu_count(),
+        "target_rtf": target_rtf,
+        "max_memory_mb": max_memory_mb,
+        "measurements": measurements,
+        "calibrated_at": datetime.now().isoformat()
+    }
+
+    os.makedirs(os.path.dirname(CALIBRATION_FILE), exist_ok=True)
+    with open(CALIBRATION_FILE, "w", encoding="utf-8") as f:
+        json.dump(calibration, f, ensure_ascii=False, indent=2)
+    print(f"✅ 최적 ASR 프로필: {best} (저장: {CALIBRATION_FILE})")
+
+    return calibration
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.utils.asr_profile_util [cpu|cuda]
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    paths = [os.path.join(project_root, name) for name in CALIBRATION_AUDIO_FILES]
+    calibrate([path for path in paths if os.path.exists(path)], device=sys.argv[1] if len(sys.argv) > 1 else "cpu")
@@ -0,0 +1,81 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class BackgroundEventLoop:
+    """프로세스에 하나만 두는 장기 실행 asyncio 이벤트 루프
+
+    요청 스레드는 코루틴을 이 루프에 넣고 결과를 기다린다. 요청마다 루프나
+    스레드 풀을 새로 만들지 않고, 작업 이름별 세마포어로 동시 실행 수를 제한한다
+    (LLM_TASK_CONCURRENCY, 작업별 LLM_CONCURRENCY_<TASK>).
+    """
+
+    def __init__(self, default_concurrency: Optional[int] = None):
+        self.default_concurrency = default_concurrency or int(os.getenv("LLM_TASK_CONCURRENCY", "8"))
+        self.loop = asyncio.new_event_loop()
+        # 루프 스레드에서만 접근
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self._thread = threading.Thread(target=self._run, name="llm-event-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def concurrency(self, name: str) -> int:
+        """작업 이름별 최대 동시 실행 수"""
+        return int(os.getenv(f"LLM_CONCURRENCY_{name.upper()}", str(self.default_concurrency)))
+
+    def limit(self, name: str) -> asyncio.Semaphore:
+        """작업 이름별 동시 실행 제한 세마포어 (루프 안의 코루틴에서 호출)"""
+        semaphore = self._limits.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency(name))
+            self._limits[name] = semaphore
+        return semaphore
+
+    def submit(self, coro: Coroutine) -> Future:
+        """코루틴을 루프에 넣고 Future 반환 (Future.cancel() 로 코루틴 취소)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """코루틴을 루프에서 실행하고 결과를 기다림
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간(초) (넘으면 코루틴을 취소하고 TimeoutError)
+
+        Returns:
+            코루틴 결과
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+        except BaseException:
+            # 호출 스레드가 중단되면(예: 요청 취소) 루프의 작업도 취소
+            future.cancel()
+            raise
+
+
+_background_loop: Optional[BackgroundEventLoop] = None
+_background_loop_pid: Optional[int] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """프로세스 전체에서 공유하는 이벤트 루프 (fork 된 자식 프로세스에서는 새로 생성)"""
+    global _background_loop, _background_loop_pid
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop_pid != os.getpid():
+            _background_loop = BackgroundEventLoop()
+            _background_loop_pid = os.getpid()
+        return _background_loop
@@ -1,7 +1,12 @@
 import os
 import tempfile
+import ffmpeg
+import numpy as np
 from flask import request
-from typing import Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
+
+# WhisperX/pyannote가 기대하는 입력 형식 (16kHz 모노)
+SAMPLE_RATE = 16000
 
 def save_audio_file(file) -> Tuple[Optional[str], Optional[str], Optional[int]]:
     """업로드된 오디오 파일을 임시 파일로 저장
@@ -42,6 +47,236 @@ def cleanup_temp_file(file_path: str) -> None:
     except Exception:
         pass  # 파일 삭제 실패는 무시
 
+def decode_audio(file_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """오디오 파일을 한 번만 디코딩해 16kHz 모노 float32 파형으로 변환
+    
+    반환된 배열은 전사, 정렬, 화자 분리 단계에서 복사 없이 그대로 공유된다.
+    
+    Args:
+        file_path: 오디오 파일 경로
+        sample_rate: 리샘플링할 샘플레이트
+        
+    Returns:
+        [-1, 1] 범위의 float32 파형 (1차원, C-contiguous)
+    """
+    try:
+        out, _ = (
+            ffmpeg.input(file_path, threads=0)
+            .output("-", format="s16le", acodec="pcm_s16le", ac=1, ar=sample_rate)
+            .run(cmd=["ffmpeg", "-nostdin"], capture_stdout=True, capture_stderr=True)
+        )
+    except ffmpeg.Error as e:
+        raise RuntimeError(f"오디오 디코딩 실패: {e.stderr.decode(errors='ignore')}") from e
+
+    # int16 -> float32 변환 한 번으로 최종 버퍼 생성
+    waveform = np.frombuffer(out, np.int16).astype(np.float32)
+    waveform /= 32768.0
+    return waveform
+
+def frame_energy(waveform: np.ndarray, frame_size: int) -> np.ndarray:
+    """프레임 단위 RMS 에너지 계산 (마지막 불완전 프레임은 제외)
+    
+    Args:
+        waveform: 1차원 파형
+        frame_size: 프레임 길이 (샘플 수)
+        
+    Returns:
+        프레임별 RMS 에너지
+    """
+    n_frames = len(waveform) // frame_size
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = waveform[:n_frames * frame_size].reshape(n_frames, frame_size)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+def split_at_silence(waveform: np.ndarray,
+                     max_chunk_seconds: float = 30.0,
+                     min_chunk_seconds: float = 10.0,
+                     sample_rate: int = SAMPLE_RATE,
+                     frame_ms: int = 30) -> List[Tuple[int, int]]:
+    """긴 파형을 조용한 지점에서 잘라 구간 목록 생성
+    
+    각 구간은 min_chunk_seconds 이상 max_chunk_seconds 이하이며,
+    그 범위 안에서 에너지가 가장 낮은 프레임 경계에서 자른다.
+    
+    Args:
+        waveform: 16kHz 모노 파형
+        max_chunk_seconds: 구간 최대 길이
+        min_chunk_seconds: 구간 최소 길이
+        sample_rate: 샘플레이트
+        frame_ms: 에너지 계산 프레임 길이 (ms)
+        
+    Returns:
+        (시작 샘플, 끝 샘플) 목록
+    """
+    total = len(waveform)
+    max_len = int(max_chunk_seconds * sample_rate)
+    if total <= max_len:
+        return [(0, total)]
+
+    frame_size = int(sample_rate * frame_ms / 1000)
+    energy = frame_energy(waveform, frame_size)
+    min_frames = int(min_chunk_seconds * sample_rate) // frame_size
+    max_frames = max_len // frame_size
+
+    chunks = []
+    start_frame = 0
+    while total - start_frame * frame_size > max_len:
+        search = energy[start_frame + min_frames:start_frame + max_frames]
+        cut_frame = start_frame + min_frames + int(np.argmin(search)) if len(search) else start_frame + max_frames
+        chunks.append((start_frame * frame_size, cut_frame * frame_size))
+        start_frame = cut_frame
+    chunks.append((start_frame * frame_size, total))
+    return chunks
+
+class OffsetMap:
+    """전처리(무음 제거)된 오디오의 시간을 원본 오디오 시간으로 변환
+    
+    남긴 구간마다 (전처리 후 시작 시각, 원본 시작 시각)을 정렬된 배열로 보관하고
+    searchsorted 로 해당 구간을 찾아 변환한다.
+    """
+
+    def __init__(self, processed_starts: np.ndarray, original_starts: np.ndarray):
+        self.processed_starts = processed_starts
+        self.original_starts = original_starts
+
+    @classmethod
+    def identity(cls) -> "OffsetMap":
+        return cls(np.zeros(1), np.zeros(1))
+
+    def to_original(self, times):
+        """전처리 후 시각(초, 스칼라 또는 배열)을 원본 시각으로 변환"""
+        times = np.asarray(times, dtype=np.float64)
+        index = np.searchsorted(self.processed_starts, times, side="right") - 1
+        index = np.clip(index, 0, len(self.processed_starts) - 1)
+        return self.original_starts[index] + (times - self.processed_starts[index])
+
+def vad_frame_mask(intervals: List[Tuple[float, float]], n_frames: int, frame_seconds: float) -> np.ndarray:
+    """VAD 음성 구간(초) 목록을 프레임 단위 음성 여부 배열로 변환
+
+    Args:
+        intervals: (시작, 끝) 초 목록
+        n_frames: 프레임 수
+        frame_seconds: 프레임 길이 (초)
+
+    Returns:
+        프레임별 음성 여부 (구간과 조금이라도 겹치면 True)
+    """
+    mask = np.zeros(n_frames, dtype=bool)
+    for start, end in intervals:
+        first = max(int(start / frame_seconds), 0)
+        last = min(int(np.ceil(end / frame_seconds)), n_frames)
+        if last > first:
+            mask[first:last] = True
+    return mask
+
+def preprocess_audio(waveform: np.ndarray,
+                     min_silence_seconds: float = 1.0,
+                     keep_silence_seconds: float = 0.25,
+                     target_dbfs: float = -20.0,
+                     sample_rate: int = SAMPLE_RATE,
+                     frame_ms: int = 30,
+                     speech_intervals: Optional[Callable[[np.ndarray], List[Tuple[float, float]]]] = None) -> Tuple[np.ndarray, OffsetMap, Dict]:
+    """ASR 전 무음 제거 + 음량 정규화
+    
+    프레임 에너지로 음성/무음을 판단(잡음 바닥 기준 적응형 임계값)하고, speech_intervals
+    (VAD)가 있으면 VAD 도 음성으로 본 프레임만 음성으로 확정한다 (에너지가 높은 잡음/음악
+    구간도 제거). VAD 가 실패하면 에너지 기준만 쓴다.
+    min_silence_seconds 보다 긴 무음은 앞뒤 keep_silence_seconds 만 남기고 잘라낸다.
+    음성 구간의 RMS 가 target_dbfs 가 되도록 이득을 적용하되 클리핑은 막는다.
+    
+    Args:
+        waveform: 16kHz 모노 float32 파형
+        min_silence_seconds: 잘라낼 최소 무음 길이
+        keep_silence_seconds: 음성 앞뒤로 남길 무음 길이
+        target_dbfs: 목표 음량 (dBFS)
+        sample_rate: 샘플레이트
+        frame_ms: 에너지 계산 프레임 길이 (ms)
+        speech_intervals: 파형의 VAD 음성 구간 (시작, 끝) 초 목록을 반환하는 함수 (선택)
+        
+    Returns:
+        Tuple[전처리된 파형, 시간 변환 맵, 처리 리포트]
+    """
+    frame_size = int(sample_rate * frame_ms / 1000)
+    energy = frame_energy(waveform, frame_size)
+    original_seconds = len(waveform) / sample_rate
+    report = {
+        "original_seconds": round(original_seconds, 3),
+        "processed_seconds": round(original_seconds, 3),
+        "removed_seconds": 0.0,
+        "removed_ratio": 0.0,
+        "gain_db": 0.0,
+        "vad": False
+    }
+    if len(energy) == 0:
+        return waveform, OffsetMap.identity(), report
+
+    # 1. 에너지 기반 음성 판단 (잡음 바닥 + 10dB 를 -60 ~ -35dBFS 범위로 제한)
+    energy_db = 20 * np.log10(np.maximum(energy, 1e-10))
+    threshold = float(np.clip(np.percentile(energy_db, 10) + 10.0, -60.0, -35.0))
+    speech = energy_db > threshold
+
+    # 2. VAD 로 음성 프레임 확인 (에너지만 높은 잡음 구간 제외)
+    if speech_intervals is not None and speech.any():
+        try:
+            vad_mask = vad_frame_mask(speech_intervals(waveform), len(energy), frame_size / sample_rate)
+            speech &= vad_mask
+            report["vad"] = True
+        except Exception as e:
+            print(f"VAD 실패, 에너지 기준만 사용: {str(e)}")
+    if not speech.any():
+        # 음성으로 판단된 프레임이 없으면 잘라내지 않음
+        return waveform, OffsetMap.identity(), report
+    confirmed = speech.copy()
+
+    # 3. 음성 앞뒤 여유 프레임 확장 후, 긴 무음 구간만 제거 대상으로 표시
+    keep_frames = int(keep_silence_seconds * 1000 / frame_ms)
+    if keep_frames > 0:
+        kernel = np.ones(2 * keep_frames + 1, dtype=np.int32)
+        speech = np.convolve(speech.astype(np.int32), kernel, mode="same") > 0
+
+    bounds = np.flatnonzero(np.diff(np.concatenate(([1], speech.astype(np.int8), [1]))))
+    silence_starts, silence_ends = bounds[0::2], bounds[1::2]
+    min_frames = int(min_silence_seconds * 1000 / frame_ms)
+    long_silence = (silence_ends - silence_starts) >= min_frames
+    silence_starts, silence_ends = silence_starts[long_silence], silence_ends[long_silence]
+
+    if len(silence_starts) == 0:
+        processed = waveform
+        offset_map = OffsetMap.identity()
+    else:
+        keep = np.ones(len(energy), dtype=bool)
+        for start, end in zip(silence_starts, silence_ends):
+            keep[start:end] = False
+        # 마지막 불완전 프레임은 그대로 유지
+        sample_keep = np.ones(len(waveform), dtype=bool)
+        sample_keep[:len(keep) * frame_size] = np.repeat(keep, frame_size)
+        processed = waveform[sample_keep]
+
+        kept_bounds = np.flatnonzero(np.diff(np.concatenate(([0], sample_keep.astype(np.int8), [0]))))
+        kept_starts, kept_ends = kept_bounds[0::2], kept_bounds[1::2]
+        processed_starts = np.concatenate(([0], np.cumsum(kept_ends - kept_starts)[:-1]))
+        offset_map = OffsetMap(processed_starts / sample_rate, kept_starts / sample_rate)
+
+    # 4. 음성 구간 RMS 기준 음량 정규화 (피크가 1을 넘지 않도록 이득 제한)
+    speech_energy = energy[confirmed]
+    if len(speech_energy):
+        speech_rms = np.sqrt(np.mean(speech_energy ** 2))
+        gain = 10 ** (target_dbfs / 20) / max(speech_rms, 1e-10)
+        peak = float(np.max(np.abs(processed))) if len(processed) else 0.0
+        if peak > 0:
+            gain = min(gain, 0.99 / peak)
+        if abs(20 * np.log10(gain)) >= 0.5:
+            # 원본 파형은 다른 곳과 공유될 수 있으므로 새 배열로 계산
+            processed = (processed * np.float32(gain)).astype(np.float32, copy=False)
+            report["gain_db"] = round(float(20 * np.log10(gain)), 2)
+
+    processed_seconds = len(processed) / sample_rate
+    report["processed_seconds"] = round(processed_seconds, 3)
+    report["removed_seconds"] = round(original_seconds - processed_seconds, 3)
+    report["removed_ratio"] = round((original_seconds - processed_seconds) / original_seconds, 4) if original_seconds else 0.0
+    return processed, offset_map, report
+
 def validate_audio_file(audio_file) -> tuple:
     """오디오 파일을 검증하고 파일명과 확장자를 반환합니다."""
     if not audio_file:
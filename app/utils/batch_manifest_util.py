@@ -0,0 +1,184 @@
+import os
+import copy
+import json
+import threading
+from typing import Any, Dict, Iterable, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'batch_manifest.json')
+
+# get 이 결과 없음과 None 값을 구분하기 위한 표식
+MISSING = object()
+
+
+class BatchManifest:
+    """S3 전체 처리(/rag/*/all) 결과 매니페스트
+
+    S3 키별로 ETag 와 작업별 결과를 보관한다. ETag 가 같고 작업의 템플릿 버전도
+    같으면 저장된 결과를 쓰고, 파일이 바뀌었거나(ETag 변경) 프롬프트가 바뀌었으면
+    (템플릿 버전 변경) 결과 없음으로 보고 다시 처리한다.
+
+    저장 위치(BATCH_MANIFEST_BACKEND):
+        local: 로컬 JSON 파일 (BATCH_MANIFEST_PATH, 기본값)
+        s3: 같은 버킷의 사이드카 객체 (BATCH_MANIFEST_S3_KEY, 기본값 <S3_PREFIX>_batch_manifest.json)
+        off: 사용하지 않음
+    """
+
+    def __init__(self,
+                 backend: Optional[str] = None,
+                 path: Optional[str] = None,
+                 s3_client=None,
+                 bucket: Optional[str] = None,
+                 s3_key: Optional[str] = None):
+        self.backend = (backend or os.getenv("BATCH_MANIFEST_BACKEND", "local")).lower()
+        if self.backend not in ("local", "s3", "off"):
+            raise ValueError(f"지원하지 않는 BATCH_MANIFEST_BACKEND: {self.backend}")
+        self.path = path or os.getenv("BATCH_MANIFEST_PATH", DEFAULT_MANIFEST_PATH)
+        self.s3 = s3_client
+        self.bucket = bucket or os.getenv("S3_BUCKET")
+        self.s3_key = s3_key or os.getenv("BATCH_MANIFEST_S3_KEY", f"{os.getenv('S3_PREFIX', '')}_batch_manifest.json")
+
+        # {S3 키: {"etag", "results": {작업: {"version", "value"}}}}
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend != "off"
+
+    def _load(self) -> None:
+        """저장된 매니페스트를 처음 사용할 때 한 번 읽음 (잠금을 잡은 상태에서 호출)"""
+        if self._loaded or not self.enabled:
+            return
+        self._loaded = True
+        try:
+            if self.backend == "local":
+                if not os.path.exists(self.path):
+                    return
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                try:
+                    response = self.s3.get_object(Bucket=self.bucket, Key=self.s3_key)
+                except self.s3.exceptions.NoSuchKey:
+                    return
+                data = json.loads(response["Body"].read().decode("utf-8"))
+            self._entries = data.get("entries", {})
+        except Exception as e:
+            print(f"매니페스트 읽기 실패: {str(e)}")
+            self._entries = {}
+
+    def get(self, key: str, etag: str, task: str, version: str) -> Any:
+        """저장된 결과 조회
+
+        Args:
+            key: S3 키
+            etag: 현재 목록의 ETag
+            task: 작업 이름
+            version: 작업의 현재 템플릿 버전
+
+        Returns:
+            저장된 결과 (없거나 ETag/템플릿 버전이 다르면 MISSING)
+        """
+        if not self.enabled:
+            return MISSING
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None or entry["etag"] != etag:
+                return MISSING
+            result = entry["results"].get(task)
+            if result is None or result["version"] != version:
+                return MISSING
+            return copy.deepcopy(result["value"])
+
+    def put(self, key: str, etag: str, task: str, version: str, value: Any) -> None:
+        """작업 결과 저장 (ETag 가 바뀌었으면 이전 작업 결과는 모두 버림, 디스크 반영은 save)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None or entry["etag"] != etag:
+                entry = {"etag": etag, "results": {}}
+                self._entries[key] = entry
+            entry["results"][task] = {"version": version, "value": copy.deepcopy(value)}
+            self._dirty = True
+
+    def invalidate(self, task: Optional[str] = None, key: Optional[str] = None) -> int:
+        """저장된 결과 삭제
+
+        Args:
+            task: 이 작업의 결과만 삭제 (없으면 모든 작업)
+            key: 이 S3 키의 결과만 삭제 (없으면 모든 키)
+
+        Returns:
+            삭제한 결과 수
+        """
+        removed = 0
+        with self._lock:
+            self._load()
+            keys = [key] if key is not None else list(self._entries)
+            for entry_key in keys:
+                entry = self._entries.get(entry_key)
+                if entry is None:
+                    continue
+                tasks = [task] if task is not None else list(entry["results"])
+                for entry_task in tasks:
+                    if entry["results"].pop(entry_task, None) is not None:
+                        removed += 1
+                if not entry["results"]:
+                    del self._entries[entry_key]
+            if removed:
+                self._dirty = True
+        return removed
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """목록에 없는(삭제된) S3 키의 결과 삭제"""
+        keep = set(keys)
+        with self._lock:
+            self._load()
+            for key in [key for key in self._entries if key not in keep]:
+                del self._entries[key]
+                self._dirty = True
+
+    def save(self) -> None:
+        """바뀐 내용이 있으면 저장 (로컬 파일은 임시 파일에 쓴 뒤 교체)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            serialized = json.dumps({"entries": self._entries}, ensure_ascii=False)
+            self._dirty = False
+        try:
+            if self.backend == "local":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(serialized)
+                os.replace(temp_path, self.path)
+            else:
+                self.s3.put_object(
+                    Bucket=self.bucket,
+                    Key=self.s3_key,
+                    Body=serialized.encode("utf-8"),
+                    ContentType="application/json"
+                )
+        except Exception as e:
+            print(f"매니페스트 저장 실패: {str(e)}")
+            with self._lock:
+                self._dirty = True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._load()
+            return {
+                "backend": self.backend,
+                "entries": len(self._entries),
+                "results": sum(len(entry["results"]) for entry in self._entries.values())
+            }
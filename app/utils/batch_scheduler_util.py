@@ -0,0 +1,190 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, ContextManager, Dict, List, Optional
+import numpy as np
+import torch
+from faster_whisper.tokenizer import Tokenizer
+from whisperx.audio import SAMPLE_RATE
+from whisperx.vad import merge_chunks
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class WhisperBatchScheduler:
+    """여러 요청의 VAD 구간을 모아 Whisper 배치를 채워서 실행하는 스케줄러
+
+    각 요청은 자기 오디오의 VAD 구간을 log-mel 특징으로 만들어 큐에 넣고,
+    전용 추론 스레드가 최대 max_wait_ms 동안 구간을 모아 batch_size 만큼 채운 뒤
+    한 번에 디코딩하고 결과를 원래 요청으로 돌려준다.
+
+    whisperx/faster-whisper 의 내부 API(_vad_params, preprocess,
+    generate_segment_batched, Tokenizer)를 직접 쓰므로 requirements.txt 에 고정한
+    버전을 기준으로 한다. 생성 시 파이프라인에 필요한 속성이 없으면 RuntimeError 를
+    내서, 호출하는 쪽이 배치 없이 바로 전사하도록 되돌릴 수 있게 한다.
+    """
+
+    # (객체 경로, 속성) - 파이프라인에서 시작하는 내부 API 목록
+    REQUIRED_PIPELINE_ATTRS = (
+        ("pipeline", "vad_model"),
+        ("pipeline", "_vad_params"),
+        ("pipeline", "preprocess"),
+        ("pipeline", "options"),
+        ("pipeline.model", "generate_segment_batched"),
+        ("pipeline.model", "hf_tokenizer"),
+        ("pipeline.model.model", "is_multilingual"),
+    )
+
+    def __init__(self,
+                 acquire_pipeline: Callable[[], ContextManager],
+                 batch_size: int = 16,
+                 max_wait_ms: Optional[float] = None,
+                 chunk_size: int = 30):
+        # whisperx 파이프라인을 사용하는 동안 잡아두는 컨텍스트 (모델 수명 주기 관리자)
+        self.acquire_pipeline = acquire_pipeline
+        self.batch_size = batch_size
+        if max_wait_ms is None:
+            max_wait_ms = float(os.getenv("ASR_BATCH_MAX_WAIT_MS", "50"))
+        self.max_wait = max_wait_ms / 1000
+        self.chunk_size = chunk_size
+
+        self._queue: "queue.Queue[Dict]" = queue.Queue()
+        self._tokenizers: Dict[str, Tokenizer] = {}
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "segments": 0, "batches": 0}
+
+        # 설치된 whisperx 가 기대한 내부 API 를 갖고 있는지 먼저 확인 (없으면 예외)
+        with self.acquire_pipeline() as pipeline:
+            self.check_pipeline(pipeline)
+
+        self._worker = threading.Thread(target=self._run, name="whisper-batch", daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def check_pipeline(cls, pipeline) -> None:
+        """배치 처리에 쓰는 파이프라인 내부 API 확인
+
+        Args:
+            pipeline: whisperx 파이프라인
+
+        Raises:
+            RuntimeError: 필요한 속성이 없을 때 (whisperx/faster-whisper 버전 불일치)
+        """
+        objects = {"pipeline": pipeline}
+        objects["pipeline.model"] = getattr(pipeline, "model", None)
+        objects["pipeline.model.model"] = getattr(objects["pipeline.model"], "model", None)
+        missing = [f"{path}.{attr}" for path, attr in cls.REQUIRED_PIPELINE_ATTRS
+                   if not hasattr(objects[path], attr)]
+        if missing:
+            raise RuntimeError(f"지원하지 않는 whisperx 버전 (없는 속성: {', '.join(missing)})")
+
+    def _tokenizer(self, pipeline, language: str) -> Tokenizer:
+        tokenizer = self._tokenizers.get(language)
+        if tokenizer is None:
+            tokenizer = Tokenizer(
+                pipeline.model.hf_tokenizer,
+                pipeline.model.model.is_multilingual,
+                task="transcribe",
+                language=language,
+            )
+            self._tokenizers[language] = tokenizer
+        return tokenizer
+
+    def _vad_segments(self, pipeline, audio: np.ndarray) -> List[Dict]:
+        """whisperx 파이프라인과 같은 방식으로 VAD 구간 계산"""
+        vad_segments = pipeline.vad_model({
+            "waveform": torch.from_numpy(audio).unsqueeze(0),
+            "sample_rate": SAMPLE_RATE
+        })
+        return merge_chunks(
+            vad_segments,
+            self.chunk_size,
+            onset=pipeline._vad_params["vad_onset"],
+            offset=pipeline._vad_params["vad_offset"],
+        )
+
+    def transcribe(self, audio: np.ndarray, language: str = 'ko') -> Dict:
+        """오디오 전사 (다른 요청의 구간과 함께 배치 처리됨)
+
+        Args:
+            audio: 16kHz 모노 float32 파형
+            language: 언어 코드
+
+        Returns:
+            whisperx transcribe 와 같은 형식의 결과 {"segments", "language"}
+        """
+        futures = []
+        with self.acquire_pipeline() as pipeline:
+            vad_segments = self._vad_segments(pipeline, audio)
+            for seg in vad_segments:
+                f1 = int(seg['start'] * SAMPLE_RATE)
+                f2 = int(seg['end'] * SAMPLE_RATE)
+                features = pipeline.preprocess({'inputs': audio[f1:f2]})['inputs']
+                future = Future()
+                self._queue.put({"language": language, "features": features, "future": future})
+                futures.append(future)
+
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            self._stats["segments"] += len(vad_segments)
+
+        segments = []
+        for seg, future in zip(vad_segments, futures):
+            segments.append({
+                "text": future.result(),
+                "start": round(seg['start'], 3),
+                "end": round(seg['end'], 3)
+            })
+        return {"segments": segments, "language": language}
+
+    def _collect_batch(self) -> List[Dict]:
+        """첫 구간이 들어온 뒤 max_wait 동안 또는 배치가 찰 때까지 구간 수집"""
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(items) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self) -> None:
+        while True:
+            items = self._collect_batch()
+
+            # 언어가 같아야 같은 프롬프트로 배치 디코딩 가능
+            by_language: Dict[str, List[Dict]] = {}
+            for item in items:
+                by_language.setdefault(item["language"], []).append(item)
+
+            for language, group in by_language.items():
+                try:
+                    features = torch.stack([item["features"] for item in group])
+                    with self.acquire_pipeline() as pipeline:
+                        texts = pipeline.model.generate_segment_batched(
+                            features, self._tokenizer(pipeline, language), pipeline.options)
+                    for item, text in zip(group, texts):
+                        item["future"].set_result(text)
+                except Exception as e:
+                    print(f"배치 전사 실패: {str(e)}")
+                    for item in group:
+                        if not item["future"].done():
+                            item["future"].set_exception(e)
+
+                with self._stats_lock:
+                    self._stats["batches"] += 1
+
+    def stats(self) -> Dict:
+        """배치 처리 통계 (평균 배치 채움 정도 포함)"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_batch_size"] = round(stats["segments"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["batch_size"] = self.batch_size
+        stats["max_wait_ms"] = self.max_wait * 1000
+        return stats
@@ -0,0 +1,126 @@
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
+
+# 요청 속도 제한으로 보는 AWS 오류 코드
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+    "SlowDown"
+}
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """botocore ClientError 가 요청 속도 제한 오류인지 여부"""
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+class AdaptiveLimiter:
+    """속도 제한 오류에 맞춰 동시 실행 수를 조절하는 제한기 (AIMD)
+
+    속도 제한 오류가 나면 허용 동시 실행 수를 절반으로 줄이고, 현재 허용치만큼
+    연속으로 성공하면 하나씩 늘린다 (max_limit 까지).
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(max_limit, 1)
+        self.min_limit = max(min(min_limit, self.max_limit), 1)
+        self.limit = self.max_limit
+        self.in_flight = 0
+        self.throttled = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+    def call(self,
+             func: Callable[[], Any],
+             max_retries: int = 4,
+             base_delay: float = 1.0,
+             is_throttled: Callable[[Exception], bool] = is_throttling_error) -> Any:
+        """제한기 안에서 func 실행 (속도 제한 오류는 지수 백오프로 재시도)
+
+        Args:
+            func: 실행할 함수
+            max_retries: 속도 제한 오류 재시도 횟수
+            base_delay: 첫 재시도 대기 시간(초) (재시도마다 두 배 + 무작위 지연)
+            is_throttled: 속도 제한 오류 판별 함수
+
+        Returns:
+            func 결과 (재시도 후에도 실패하면 마지막 예외)
+        """
+        for attempt in range(max_retries + 1):
+            self.acquire()
+            try:
+                result = func()
+            except Exception as e:
+                throttled = is_throttled(e)
+                self.release(throttled=throttled)
+                if not throttled or attempt == max_retries:
+                    raise
+                time.sleep(base_delay * (2 ** attempt) * (1 + random.random()))
+                continue
+            self.release()
+            return result
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {"limit": self.limit, "max_limit": self.max_limit,
+                    "in_flight": self.in_flight, "throttled": self.throttled}
+
+
+def map_bounded(func: Callable[[Any], Any], items: Iterable, max_workers: int) -> Iterator[Any]:
+    """items 를 필요한 만큼만 읽으며 func 을 최대 max_workers 개 병렬 실행하고, 끝난 순서대로 결과 반환
+
+    func 은 예외를 내지 않아야 한다 (실패는 결과에 담아 반환). 소비하는 쪽이 중간에
+    멈추면(예: 클라이언트 연결 종료) 아직 시작하지 않은 작업은 취소된다.
+    """
+    iterator = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch")
+    pending = set()
+    exhausted = False
+
+    def fill():
+        nonlocal exhausted
+        # 목록 조회가 처리보다 너무 앞서지 않도록 작업 수의 두 배까지만 미리 넣음
+        while not exhausted and len(pending) < max_workers * 2:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                exhausted = True
+                return
+            pending.add(executor.submit(func, item))
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                yield future.result()
+            fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
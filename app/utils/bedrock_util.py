@@ -2,9 +2,15 @@
 
 import os
 import json
-from typing import List, Dict, Optional
+import time
+from functools import partial
+from typing import Any, Callable, Iterator, List, Dict, Optional, Tuple
 import boto3
 from dotenv import load_dotenv
+from app.utils.llm_cache_util import LLMResponseCache, MISS
+from app.utils.json_stream_util import IncrementalJSONParser, parse_llm_json
+from app.utils.batch_util import AdaptiveLimiter, map_bounded
+from app.utils.batch_manifest_util import BatchManifest, MISSING
 
 load_dotenv()
 
@@ -12,14 +18,24 @@ load_dotenv()
 class BedrockUtil:
     RELATIVE_DATE_TEMPLATE = "남은 기간 (가능한 경우 'YYYY-MM-DDTHH:mm:ss' 형식으로, 불가능한 경우 '3일 후', '1주일 후', '2개월 후' 등으로 표기)"
     
-    def __init__(self):
-        self.runtime = boto3.client(
+    # _call_claude 요청 형식 버전 (본문 형식이 바뀌면 올려서 캐시 무효화)
+    CALL_TEMPLATE_VERSION = "messages-v1"
+    # 요청에 temperature 를 지정하지 않으므로 모델 기본값(1.0) 기준으로 캐시 여부 판단
+    TEMPERATURE = 1.0
+
+    def __init__(self,
+                 runtime_client=None,
+                 s3_client=None,
+                 llm_cache: Optional[LLMResponseCache] = None,
+                 manifest: Optional[BatchManifest] = None):
+        # 서비스 컨테이너가 넘겨준 클라이언트가 있으면 공유 (없으면 새로 생성)
+        self.runtime = runtime_client or boto3.client(
             "bedrock-runtime",
             region_name=os.getenv("AWS_REGION"),
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
         )
-        self.s3 = boto3.client(
+        self.s3 = s3_client or boto3.client(
             "s3",
             region_name=os.getenv("AWS_REGION"),
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
@@ -28,30 +44,112 @@ class BedrockUtil:
         self.model_id = os.getenv("BEDROCK_MODEL_ID")
         self.bucket = os.getenv("S3_BUCKET")
         self.prefix = os.getenv("S3_PREFIX", "")
-
-    def _call_claude(self, prompt: str) -> str:
-        body = {
+        self.llm_cache = llm_cache or LLMResponseCache()
+
+        # S3 전체 처리 설정
+        self.batch_max_workers = int(os.getenv("BATCH_MAX_WORKERS", "8"))
+        self.batch_max_retries = int(os.getenv("BATCH_MAX_RETRIES", "4"))
+        self.batch_retry_delay = float(os.getenv("BATCH_RETRY_BASE_SECONDS", "1.0"))
+        self.listing_ttl = float(os.getenv("BATCH_LISTING_TTL_SECONDS", "60"))
+        self.claude_limiter = AdaptiveLimiter(int(os.getenv("BEDROCK_MAX_CONCURRENCY", "8")))
+        # (조회 시각, 파일 목록)
+        self._listing: Optional[Tuple[float, List[Dict]]] = None
+        # S3 키 + ETag 별로 이전 결과를 보관해 바뀐 파일만 다시 처리
+        self.manifest = manifest or BatchManifest(s3_client=self.s3, bucket=self.bucket)
+        self._task_versions: Dict[str, str] = {}
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        if not self.llm_cache.cacheable(self.TEMPERATURE):
+            return None
+        return self.llm_cache.make_key(self.model_id, self.CALL_TEMPLATE_VERSION, prompt, self.TEMPERATURE)
+
+    @staticmethod
+    def _request_body(prompt: str) -> str:
+        return json.dumps({
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": 1024,
             "messages": [
                 {"role": "user", "content": prompt}
             ]
-        }
+        })
+
+    def _call_claude(self, prompt: str, parse: Callable[[str], Any] = parse_llm_json) -> Any:
+        """Claude 호출 후 응답 텍스트를 parse 로 변환
+
+        parse 에 성공한 응답만 캐시하므로 형식이 잘못된 응답이 캐시에서 재사용되지 않는다
+        (캐시된 응답의 변환이 실패하면 캐시가 없는 것으로 보고 다시 호출).
+
+        Args:
+            prompt: 프롬프트
+            parse: 응답 텍스트 변환/검증 함수 (실패 시 예외, 기본값 parse_llm_json)
+
+        Returns:
+            parse 결과
+        """
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = self.llm_cache.get(cache_key)
+            if cached is not MISS:
+                try:
+                    return parse(cached)
+                except Exception as e:
+                    print(f"캐시된 Claude 응답 변환 실패, 다시 호출: {str(e)}")
 
         response = self.runtime.invoke_model(
             modelId=self.model_id,
-            body=json.dumps(body),
+            body=self._request_body(prompt),
             contentType="application/json",
             accept="application/json"
         )
 
         result = json.loads(response["body"].read())
-        return result["content"][0]["text"]
-    
+        text = result["content"][0]["text"]
+        value = parse(text)
+        if cache_key is not None:
+            self.llm_cache.put(cache_key, text)
+        return value
+
+    def _stream_claude(self, prompt: str, parse: Callable[[str], Any] = parse_llm_json) -> Iterator[str]:
+        """invoke_model_with_response_stream 으로 응답 텍스트를 조각 단위로 반환
+
+        캐시에 있으면 캐시된 응답을 한 조각으로 반환하고, 끝까지 받아 parse 에 성공한
+        응답만 캐시한다.
+        """
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = self.llm_cache.get(cache_key)
+            if cached is not MISS:
+                yield cached
+                return
+
+        response = self.runtime.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=self._request_body(prompt),
+            contentType="application/json",
+            accept="application/json"
+        )
+
+        parts = []
+        for event in response["body"]:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            payload = json.loads(chunk["bytes"])
+            if payload.get("type") == "content_block_delta" and payload["delta"].get("type") == "text_delta":
+                parts.append(payload["delta"]["text"])
+                yield payload["delta"]["text"]
+            elif payload.get("type") == "message_stop" and cache_key is not None:
+                text = "".join(parts)
+                try:
+                    parse(text)
+                except Exception as e:
+                    print(f"Claude 응답 변환 실패, 캐시하지 않음: {str(e)}")
+                    continue
+                self.llm_cache.put(cache_key, text)
 
     # ✅ 단일 텍스트 처리
-    def summarize_meeting(self, text: str) -> Dict:
-        prompt = f"""
+    def _summary_prompt(self, text: str) -> str:
+        return f"""
         <system>
         너는 회의 요약 전문가야. 다음 회의 내용을 요약해서 반드시 예시로 든 JSON 형식으로 정리해줘.
         </system>
@@ -64,15 +162,16 @@ class BedrockUtil:
         }}
         </user>
         """
+
+    def summarize_meeting(self, text: str) -> Dict:
         try:
-            result = self._call_claude(prompt)
-            return json.loads(result)
+            return self._call_claude(self._summary_prompt(text), parse=partial(self._parse_task_result, "summary"))
         except Exception as e:
             print("요약 실패:", e)
             return {"subject": "", "summary": "요약 실패"}
 
-    def extract_todos(self, text: str, meeting_date: Optional[str] = None) -> List[Dict]:
-        prompt = f"""
+    def _todos_prompt(self, text: str, meeting_date: Optional[str] = None) -> str:
+        return f"""
         <system>
         너는 회의 분석 전문가야. 아래 회의에서 할 일을 반드시 예시로 든 JSON 배열로 추출해줘.
         언제까지 특정 업무를 수행하겠다는 내용이 할 일이야.
@@ -92,15 +191,16 @@ class BedrockUtil:
         ]
         </user>
         """
+
+    def extract_todos(self, text: str, meeting_date: Optional[str] = None) -> List[Dict]:
         try:
-            result = self._call_claude(prompt)
-            return json.loads(result)
+            return self._call_claude(self._todos_prompt(text, meeting_date), parse=partial(self._parse_task_result, "todos"))
         except Exception as e:
             print("할 일 추출 실패:", e)
             return []
 
-    def extract_schedule(self, text: str, meeting_date: Optional[str] = None) -> List[Dict]:
-        prompt = f"""
+    def _schedule_prompt(self, text: str, meeting_date: Optional[str] = None) -> str:
+        return f"""
         <system>
         너는 일정 추출 전문가야. 회의에서 날짜나 일정을 반드시 예시로 든 JSON으로 정리해줘.
         현재 회의 날짜는 {meeting_date}이다.
@@ -120,90 +220,227 @@ class BedrockUtil:
         ]
         </user>
         """
+
+    def extract_schedule(self, text: str, meeting_date: Optional[str] = None) -> List[Dict]:
         try:
-            result = self._call_claude(prompt)
-            return json.loads(result)
+            return self._call_claude(self._schedule_prompt(text, meeting_date), parse=partial(self._parse_task_result, "schedules"))
         except Exception as e:
             print("일정 추출 실패:", e)
             return []
 
-    # ✅ S3 전체 처리
-    def _load_text_files_from_s3(self) -> List[Dict]:
-        response = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=self.prefix)
-        results = []
-        for obj in response.get("Contents", []):
-            key = obj["Key"]
-            if not key.endswith(".txt"):
-                continue
-            s3_obj = self.s3.get_object(Bucket=self.bucket, Key=key)
-            text = s3_obj["Body"].read().decode("utf-8")
-            results.append({"key": key, "text": text})
-        return results
+    def run_task(self,
+                 task: str,
+                 text: str,
+                 meeting_date: Optional[str] = None,
+                 validate: Optional[Callable[[Any], Any]] = None) -> Any:
+        """요약/할 일/일정 추출 하나를 실행 (실패 시 예외 전파)
+
+        Args:
+            task: summary, todos, schedules 중 하나
+            text: 회의 텍스트
+            meeting_date: 회의 날짜 (todos, schedules)
+            validate: JSON 으로 변환한 응답의 검증 함수 (없으면 작업별 형식 검사, 통과한 응답만 캐시)
+
+        Returns:
+            JSON 으로 변환된 응답
+        """
+        if validate is None:
+            parse = partial(self._parse_task_result, task)
+        else:
+            def parse(reply: str) -> Any:
+                return validate(parse_llm_json(reply))
+        return self._call_claude(self._task_prompt(task, text, meeting_date), parse=parse)
+
+    def stream_task(self, task: str, text: str, meeting_date: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """요약/할 일/일정 추출을 스트리밍으로 실행
+
+        Args:
+            task: summary, todos, schedules 중 하나
+            text: 회의 텍스트
+            meeting_date: 회의 날짜 (todos, schedules)
+
+        Returns:
+            (이벤트, 데이터) 이터레이터
+            - ("token", 응답 텍스트 조각)
+            - ("item", 완성된 할 일/일정 항목) (todos, schedules)
+            - ("result", 최종 결과) (파싱 실패 시 비동기 API 와 같은 기본값)
+        """
+        parser = IncrementalJSONParser()
+        try:
+            prompt = self._task_prompt(task, text, meeting_date)
+            for chunk in self._stream_claude(prompt, parse=partial(self._parse_task_result, task)):
+                yield "token", chunk
+                if task != "summary":
+                    for item in parser.feed(chunk):
+                        yield "item", item
+            yield "result", parser.result()
+        except Exception as e:
+            print(f"{task} 스트리밍 실패:", e)
+            # 끝까지 받지 못했어도 이미 완성된 할 일/일정 항목은 유지
+            yield "result", parser.items if task != "summary" else self._task_default(task)
 
-    def summarize_all_files(self) -> List[Dict]:
-        files = self._load_text_files_from_s3()
-        results = []
+    # ✅ S3 전체 처리
+    def _iter_text_files(self) -> Iterator[Dict]:
+        """버킷의 .txt 파일 목록을 페이지 단위로 필요한 만큼만 조회
 
-        for f in files:
-            summary = self.summarize_meeting(f["text"])
+        끝까지 조회한 목록은 BATCH_LISTING_TTL_SECONDS 동안 재사용한다
+        (요약/할 일/일정 전체 API 가 같은 목록을 공유).
 
-            # 📌 등록일 가져오기
-            head = self.s3.head_object(Bucket=self.bucket, Key=f["key"])
-            uploaded_at = head["LastModified"].strftime("%Y-%m-%d")
+        Returns:
+            {"key", "etag", "uploaded_at"} 이터레이터 (uploaded_at 은 목록의 LastModified, YYYY-MM-DD)
+        """
+        now = time.time()
+        listing = self._listing
+        if listing is not None and now - listing[0] < self.listing_ttl:
+            yield from listing[1]
+            return
+
+        entries = []
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith(".txt"):
+                    continue
+                entry = {
+                    "key": obj["Key"],
+                    "etag": obj.get("ETag", ""),
+                    "uploaded_at": obj["LastModified"].strftime("%Y-%m-%d")
+                }
+                entries.append(entry)
+                yield entry
+        self._listing = (now, entries)
+
+    def _task_prompt(self, task: str, text: str, meeting_date: Optional[str] = None) -> str:
+        if task == "summary":
+            return self._summary_prompt(text)
+        if task == "todos":
+            return self._todos_prompt(text, meeting_date)
+        return self._schedule_prompt(text, meeting_date)
+
+    def task_version(self, task: str) -> str:
+        """작업의 템플릿 버전 (프롬프트/모델/요청 형식이 바뀌면 달라져 매니페스트 결과가 무효화됨)"""
+        version = self._task_versions.get(task)
+        if version is None:
+            template = json.dumps([self.model_id, self.CALL_TEMPLATE_VERSION, self._task_prompt(task, "")])
+            version = self.llm_cache.template_version(template)
+            self._task_versions[task] = version
+        return version
+
+    @staticmethod
+    def _parse_task_result(task: str, text: str) -> Any:
+        """작업 응답 텍스트를 JSON 으로 변환 (요약은 dict, 할 일/일정은 list 가 아니면 ValueError)"""
+        value = parse_llm_json(text)
+        if not isinstance(value, dict if task == "summary" else list):
+            raise ValueError(f"응답 JSON 형식이 다름: {type(value).__name__}")
+        return value
+
+    @staticmethod
+    def _task_default(task: str) -> Any:
+        return {"subject": "", "summary": "요약 실패"} if task == "summary" else []
+
+    def _process_file(self, indexed_entry: Tuple[int, Dict], tasks: Tuple[str, ...]) -> Dict:
+        """파일 하나를 내려받아 작업별로 Claude 호출 (실패는 결과에 담아 반환)
+
+        매니페스트에 같은 ETag/템플릿 버전의 결과가 있는 작업은 다시 호출하지 않고,
+        모든 작업의 결과가 있으면 파일도 내려받지 않는다.
+        """
+        index, entry = indexed_entry
+        result = {"index": index, "file": entry["key"], "cached": []}
+        pending = []
+        for task in tasks:
+            cached = self.manifest.get(entry["key"], entry["etag"], task, self.task_version(task))
+            if cached is MISSING:
+                pending.append(task)
+            else:
+                result[task] = cached
+                result["cached"].append(task)
+        if not pending:
+            return result
 
-            # 📌 요약 안에도 넣고 싶다면 여기에 추가 가능
-            summary["start"] = uploaded_at  # Optional
+        try:
+            s3_obj = self.s3.get_object(Bucket=self.bucket, Key=entry["key"])
+            text = s3_obj["Body"].read().decode("utf-8")
+        except Exception as e:
+            print(f"S3 파일 읽기 실패 ({entry['key']}):", e)
+            result["error"] = str(e)
+            return result
+
+        for task in pending:
+            prompt = self._task_prompt(task, text)
+            succeeded = False
+            try:
+                value = self.claude_limiter.call(
+                    lambda: self._call_claude(prompt, parse=partial(self._parse_task_result, task)),
+                    max_retries=self.batch_max_retries,
+                    base_delay=self.batch_retry_delay
+                )
+                succeeded = True
+            except Exception as e:
+                print(f"{task} 실패 ({entry['key']}):", e)
+                value = self._task_default(task)
+
+            # 등록일을 기본 시작일로 사용
+            if task == "summary":
+                value["start"] = entry["uploaded_at"]
+            else:
+                for item in value:
+                    if isinstance(item, dict) and not item.get("start"):
+                        item["start"] = entry["uploaded_at"]
+            result[task] = value
+            # 실패한 결과는 저장하지 않아 다음 요청에서 다시 시도
+            if succeeded:
+                self.manifest.put(entry["key"], entry["etag"], task, self.task_version(task), value)
+        return result
+
+    def iter_batch(self, tasks: Tuple[str, ...] = ("summary", "todos", "schedules")) -> Iterator[Dict]:
+        """버킷의 모든 .txt 파일에 작업을 실행하고, 파일별 결과를 끝나는 순서대로 반환
+
+        파일 목록은 필요한 만큼만 조회하고, 파일마다 한 번만 내려받아 여러 작업에 쓴다.
+        파일은 BATCH_MAX_WORKERS 개까지 병렬로 처리하고, Claude 호출 동시 실행 수는
+        속도 제한 오류에 맞춰 조절한다 (BEDROCK_MAX_CONCURRENCY 까지).
+        새로 나오거나 바뀐 파일만 Claude 로 보내고, 나머지는 매니페스트 결과를 쓴다.
+
+        Args:
+            tasks: summary, todos, schedules 중 실행할 작업
+
+        Returns:
+            {"index", "file", "cached", 작업 이름: 결과} 이터레이터
+            (cached 는 매니페스트에서 가져온 작업 목록, 파일을 읽지 못하면 "error")
+        """
+        seen = []
 
-            results.append({
-                "file": f["key"],
-                "summary": summary
-            })
+        def entries():
+            for entry in self._iter_text_files():
+                seen.append(entry["key"])
+                yield entry
 
-        return results
+        completed = False
+        try:
+            yield from map_bounded(
+                lambda indexed_entry: self._process_file(indexed_entry, tasks),
+                enumerate(entries()),
+                self.batch_max_workers
+            )
+            completed = True
+        finally:
+            # 끝까지 조회했으면 버킷에서 삭제된 파일의 결과도 정리
+            if completed:
+                self.manifest.retain(seen)
+            self.manifest.save()
+
+    def _collect_batch(self, task: str) -> List[Dict]:
+        """iter_batch 결과를 목록 순서대로 모음 (읽지 못한 파일 제외)"""
+        results = sorted(
+            (result for result in self.iter_batch((task,)) if "error" not in result),
+            key=lambda result: result["index"]
+        )
+        return [{"file": result["file"], task: result[task]} for result in results]
 
+    def summarize_all_files(self) -> List[Dict]:
+        return self._collect_batch("summary")
 
     def generate_all_todos(self) -> List[Dict]:
-     files = self._load_text_files_from_s3()
-     results = []
-
-     for f in files:
-         todos = self.extract_todos(f["text"])
-
-
-         head = self.s3.head_object(Bucket=self.bucket, Key=f["key"])
-         uploaded_at = head["LastModified"].strftime("%Y-%m-%d")
-
-
-         for todo in todos:
-             if not todo.get("start"):
-                 todo["start"] = uploaded_at
-
-         results.append({
-             "file": f["key"],
-             "todos": todos
-         })
-
-     return results
-
-
+        return self._collect_batch("todos")
 
     def generate_all_schedules(self) -> List[Dict]:
-      files = self._load_text_files_from_s3()
-      results = []
-
-      for f in files:
-          schedules = self.extract_schedule(f["text"])
-
-          head = self.s3.head_object(Bucket=self.bucket, Key=f["key"])
-          uploaded_at = head["LastModified"].strftime("%Y-%m-%d")
-
-          for sch in schedules:
-              if not sch.get("start"):
-                  sch["start"] = uploaded_at
-
-          results.append({
-              "file": f["key"],
-              "schedules": schedules
-          })
-
-      return results
+        return self._collect_batch("schedules")
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -6,9 +6,13 @@ from openai import OpenAI
 load_dotenv()
 
 class EmbeddingUtil:
-    def __init__(self):
-        """OpenAI 클라이언트 초기화"""
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def __init__(self, client: Optional[OpenAI] = None):
+        """OpenAI 클라이언트 초기화
+
+        Args:
+            client: 공유할 OpenAI 클라이언트 (없으면 새로 생성)
+        """
+        self.client = client or OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.model = "text-embedding-ada-002"
         
     def get_embeddings(self, text: str) -> List[float]:
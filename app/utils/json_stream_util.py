@@ -0,0 +1,108 @@
+import json
+from typing import Any, List, Optional
+
+
+class IncrementalJSONParser:
+    """LLM 이 토큰 단위로 내보내는 JSON 을 받으면서 완성된 항목을 바로 꺼내는 파서
+
+    배열의 원소인 객체(예: [{...}, {...}] 또는 {"items": [{...}]} 의 각 항목)는
+    닫는 괄호가 들어오는 즉시 반환한다. 문자열 안의 괄호와 이스케이프는 무시하고,
+    첫 괄호 앞의 텍스트(예: 마크다운 코드 블록 표시)는 건너뛴다.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._position = 0
+        # 열린 괄호 스택 ("{" 또는 "[")
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._root_start: Optional[int] = None
+        self._root_end: Optional[int] = None
+        # 배열 원소인 객체의 시작 위치와 그 객체가 열린 깊이
+        self._item_start: Optional[int] = None
+        self._item_depth = 0
+        self.items: List[Any] = []
+
+    def feed(self, chunk: str) -> List[Any]:
+        """텍스트 조각 추가
+
+        Args:
+            chunk: LLM 이 새로 내보낸 텍스트
+
+        Returns:
+            이번 조각으로 완성된 배열 항목 목록
+        """
+        self.buffer += chunk
+        completed = []
+        while self._position < len(self.buffer):
+            index = self._position
+            char = self.buffer[index]
+            self._position += 1
+
+            if self._root_end is not None:
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if not self._stack and char not in "[{":
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if not self._stack:
+                    self._root_start = index
+                if char == "{" and self._item_start is None and self._stack and self._stack[-1] == "[":
+                    self._item_start = index
+                    self._item_depth = len(self._stack)
+                self._stack.append(char)
+            elif char in "]}":
+                self._stack.pop()
+                if char == "}" and self._item_start is not None and len(self._stack) == self._item_depth:
+                    try:
+                        item = json.loads(self.buffer[self._item_start:index + 1])
+                        self.items.append(item)
+                        completed.append(item)
+                    except json.JSONDecodeError as e:
+                        print(f"스트리밍 JSON 항목 파싱 실패: {str(e)}")
+                    self._item_start = None
+                if not self._stack:
+                    self._root_end = index + 1
+        return completed
+
+    @property
+    def complete(self) -> bool:
+        """최상위 JSON 값이 닫혔는지 여부"""
+        return self._root_end is not None
+
+    def result(self) -> Any:
+        """최상위 JSON 값 전체 (아직 닫히지 않았거나 형식이 잘못되면 ValueError)"""
+        if self._root_end is None:
+            raise ValueError("JSON 이 아직 완성되지 않음")
+        return json.loads(self.buffer[self._root_start:self._root_end])
+
+
+def parse_llm_json(text: str) -> Any:
+    """LLM 응답 문자열을 JSON 으로 변환 (OpenAI/Bedrock 응답 공통)
+
+    마크다운 코드 블록이나 JSON 앞뒤의 설명 문장이 있어도 첫 번째 JSON 값만 꺼낸다.
+
+    Args:
+        text: LLM 응답 문자열
+
+    Returns:
+        JSON 값 (JSON 을 찾지 못하면 ValueError)
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    parser = IncrementalJSONParser()
+    parser.feed(text)
+    return parser.result()
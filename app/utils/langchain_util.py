@@ -1,51 +1,426 @@
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI  # GPT 사용
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
 import json
 import os
+import re
+import threading
+from difflib import SequenceMatcher
+import tiktoken
 from dotenv import load_dotenv
 from app.templates.schedule import SCHEDULE_TEMPLATE
 from app.templates.todo import TODO_TEMPLATE
-from app.templates.meeting import SUMMARIZE_MEETING_TEMPLATE
+from app.templates.meeting import SUMMARIZE_MEETING_TEMPLATE, REDUCE_SUMMARY_TEMPLATE
+from app.templates.extraction import MEETING_EXTRACTION_TEMPLATE, MEETING_EXTRACTION_SCHEMA
+from app.utils.transcript_util import Transcript
+from app.utils.llm_cache_util import LLMResponseCache, MISS
+from app.utils.json_stream_util import parse_llm_json
 
 # .env 파일 로드
 load_dotenv()
 
+# 작업 이름 (작업별 모델 설정 키: LLM_MODEL_<TASK>, LLM_TEMPERATURE_<TASK>)
+LLM_TASKS = ("summarize", "schedule", "todos", "chunks", "extract", "reduce")
+
+# 같은 항목으로 볼 텍스트 유사도 (정규화한 텍스트 기준)
+DUPLICATE_SIMILARITY = 0.85
+
+
+class PromptBudgetError(ValueError):
+    """프롬프트가 토큰 예산(LLM_PROMPT_MAX_TOKENS)을 넘어 LLM 을 호출하지 않음"""
+
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "null": type(None)
+}
+
+def validate_json_schema(value, schema: Dict, path: str = "$") -> None:
+    """JSON 스키마(object/array/string/null, required, additionalProperties) 검증
+
+    Raises:
+        ValueError: 스키마와 맞지 않는 경우 (위치 포함)
+    """
+    types = schema.get("type")
+    if types is not None:
+        types = types if isinstance(types, list) else [types]
+        if not any(isinstance(value, _JSON_TYPES[name]) for name in types):
+            raise ValueError(f"{path}: {'/'.join(types)} 형식이어야 합니다")
+
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", []):
+            if key not in value:
+                raise ValueError(f"{path}.{key}: 필수 값이 없습니다")
+        if schema.get("additionalProperties") is False:
+            extra = set(value) - set(properties)
+            if extra:
+                raise ValueError(f"{path}: 허용되지 않은 필드 {sorted(extra)}")
+        for key, sub_schema in properties.items():
+            if key in value:
+                validate_json_schema(value[key], sub_schema, f"{path}.{key}")
+    elif isinstance(value, list) and "items" in schema:
+        for index, item in enumerate(value):
+            validate_json_schema(item, schema["items"], f"{path}[{index}]")
+
+def _normalize_item_text(text: Optional[str]) -> str:
+    return re.sub(r"[\W_]+", "", (text or "").lower())
+
+def merge_extracted_items(item_lists: List[List[Dict]]) -> List[Dict]:
+    """구간별로 추출한 할 일/일정 목록을 합치고 중복 제거
+
+    텍스트가 같거나 매우 비슷하고(DUPLICATE_SIMILARITY) 시작/종료 값이 충돌하지
+    않으면 같은 항목으로 보고, 먼저 나온 항목에 빠진 값만 채운다.
+
+    Args:
+        item_lists: 구간 순서대로 나열한 항목 목록들
+
+    Returns:
+        중복이 제거된 항목 목록 (처음 나온 순서 유지)
+    """
+    merged: List[Dict] = []
+    keys: List[str] = []
+    for items in item_lists:
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            key = _normalize_item_text(item.get("text"))
+            duplicate = None
+            for index, existing in enumerate(merged):
+                if keys[index] != key and SequenceMatcher(None, keys[index], key).ratio() < DUPLICATE_SIMILARITY:
+                    continue
+                conflict = any(
+                    existing.get(field) and item.get(field) and existing[field] != item[field]
+                    for field in ("start", "end")
+                )
+                if not conflict:
+                    duplicate = existing
+                    break
+            if duplicate is None:
+                merged.append(dict(item))
+                keys.append(key)
+            else:
+                for field, value in item.items():
+                    if duplicate.get(field) is None and value is not None:
+                        duplicate[field] = value
+    return merged
+
 class LangChainUtil:
     RELATIVE_DATE_TEMPLATE = "남은 기간 (가능한 경우 'YYYY-MM-DDTHH:mm:ss' 형식으로, 불가능한 경우 '3일 후', '1주일 후', '2개월 후' 등으로 표기)"
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4o",
-            temperature=0.7,
-            openai_api_key=os.getenv('OPENAI_API_KEY')
-        )
+    def __init__(self,
+                 http_client=None,
+                 model_configs: Optional[Dict[str, Dict]] = None,
+                 llm_cache: Optional[LLMResponseCache] = None,
+                 http_async_client=None):
+        """LangChain 유틸 초기화
+
+        Args:
+            http_client: 서비스 컨테이너가 공유하는 httpx 클라이언트 (없으면 기본 클라이언트)
+            http_async_client: ainvoke 용 httpx 비동기 클라이언트 (없으면 기본 클라이언트)
+            model_configs: 작업별 모델 설정 {작업 이름: {"model", "temperature"}} ("default" 는 공통 설정)
+            llm_cache: 공유할 LLM 응답 캐시 (없으면 새로 생성)
+        """
+        self.http_client = http_client
+        self.http_async_client = http_async_client
+        self.llm_cache = llm_cache or LLMResponseCache()
+
+        # 공통 설정 + 환경 변수의 작업별 설정 + 인자로 받은 설정 순서로 덮어씀
+        self.model_configs = {
+            "default": {
+                "model": os.getenv("LLM_MODEL", "gpt-4o"),
+                "temperature": float(os.getenv("LLM_TEMPERATURE", "0.7"))
+            }
+        }
+        for task in LLM_TASKS:
+            config = {}
+            if os.getenv(f"LLM_MODEL_{task.upper()}"):
+                config["model"] = os.getenv(f"LLM_MODEL_{task.upper()}")
+            if os.getenv(f"LLM_TEMPERATURE_{task.upper()}"):
+                config["temperature"] = float(os.getenv(f"LLM_TEMPERATURE_{task.upper()}"))
+            if config:
+                self.model_configs[task] = config
+        for task, config in (model_configs or {}).items():
+            self.model_configs.setdefault(task, {}).update(config)
+
+        # (모델, temperature) -> LLM, (템플릿, 모델, temperature, 스키마) -> 체인
+        self._llms: Dict[tuple, ChatOpenAI] = {}
+        self._chains: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, object] = {}
+
+        self.llm = self.get_llm()
         self.output_parser = StrOutputParser()
 
-    def _remove_markdown_code_block(self, text: str) -> str:
-        #마크다운 코드 블록을 제거합니다.
-        text = text.strip()
-        text = text.split("\n", 1)[1]
-        if text.endswith("```"):
-            text = text.rsplit("\n", 1)[0]
-        return text.strip()
+    def model_config(self, task: Optional[str] = None) -> Dict:
+        """작업에 적용되는 모델 설정 (공통 설정 위에 작업별 설정을 덮어씀)"""
+        config = dict(self.model_configs["default"])
+        config.update(self.model_configs.get(task, {}))
+        return config
+
+    def get_llm(self, task: Optional[str] = None) -> ChatOpenAI:
+        """작업에 맞는 LLM 조회 (같은 모델 설정이면 인스턴스 공유)"""
+        config = self.model_config(task)
+        key = (config["model"], config["temperature"])
+        with self._lock:
+            llm = self._llms.get(key)
+            if llm is None:
+                llm = ChatOpenAI(
+                    model=config["model"],
+                    temperature=config["temperature"],
+                    openai_api_key=os.getenv('OPENAI_API_KEY'),
+                    http_client=self.http_client,
+                    http_async_client=self.http_async_client
+                )
+                self._llms[key] = llm
+            return llm
+
+    def create_chain(self, template: str, task: Optional[str] = None, schema: Optional[Dict] = None):
+        """템플릿 체인 조회 (템플릿/모델 설정별로 한 번만 만들고 재사용)
+
+        Args:
+            template: 프롬프트 템플릿
+            task: 작업 이름 (작업별 모델 설정 적용)
+            schema: 구조화된 출력 JSON 스키마 (없으면 문자열 출력)
+
+        Returns:
+            invoke 가능한 체인 (여러 스레드에서 동시에 사용해도 안전)
+        """
+        config = self.model_config(task)
+        key = (template, config["model"], config["temperature"], schema["title"] if schema else None)
+        chain = self._chains.get(key)
+        if chain is not None:
+            return chain
 
-    def create_chain(self, template: str):
+        llm = self.get_llm(task)
         prompt = ChatPromptTemplate.from_template(template)
-        return prompt | self.llm | self.output_parser
+        if schema is None:
+            chain = prompt | llm | self.output_parser
+        else:
+            # OpenAI structured output 으로 스키마에 맞는 JSON 만 생성하도록 강제
+            chain = prompt | llm.with_structured_output(schema, method="json_schema", strict=True)
+
+        with self._lock:
+            return self._chains.setdefault(key, chain)
+
+    def _parse_json(self, result: str) -> Any:
+        """LLM 문자열 응답을 JSON 으로 변환 (마크다운 코드 블록 제거)"""
+        return parse_llm_json(result)
+
+    def invoke_chain(self,
+                     template: str,
+                     variables: Dict,
+                     task: Optional[str] = None,
+                     schema: Optional[Dict] = None,
+                     parse: Optional[Callable[[Any], Any]] = None) -> Any:
+        """체인 실행 (같은 모델/템플릿/입력이면 LLM 응답 캐시 사용)
+
+        Args:
+            template: 프롬프트 템플릿
+            variables: 템플릿 변수
+            task: 작업 이름 (작업별 모델 설정 적용)
+            schema: 구조화된 출력 JSON 스키마
+            parse: 응답 변환 함수 (변환에 성공한 결과만 캐시)
+
+        Returns:
+            (변환된) LLM 응답
+        """
+        cache_key, cached = self._cache_lookup(template, variables, task, schema)
+        if cached is not MISS:
+            return cached
+
+        result = self.create_chain(template, task=task, schema=schema).invoke(variables)
+        if parse is not None:
+            result = parse(result)
+        if cache_key is not None:
+            self.llm_cache.put(cache_key, result)
+        return result
+
+    async def ainvoke_chain(self,
+                            template: str,
+                            variables: Dict,
+                            task: Optional[str] = None,
+                            schema: Optional[Dict] = None,
+                            parse: Optional[Callable[[Any], Any]] = None) -> Any:
+        """invoke_chain 의 비동기 버전 (체인의 ainvoke 사용, 취소 시 HTTP 요청도 중단)
+
+        캐시 조회/저장(SQLite)은 공유 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+        """
+        cache_key, cached = await asyncio.to_thread(self._cache_lookup, template, variables, task, schema)
+        if cached is not MISS:
+            return cached
 
-    def _format_transcript(self, transcript: Dict) -> str:
+        result = await self.create_chain(template, task=task, schema=schema).ainvoke(variables)
+        if parse is not None:
+            result = parse(result)
+        if cache_key is not None:
+            await asyncio.to_thread(self.llm_cache.put, cache_key, result)
+        return result
+
+    def _cache_lookup(self, template: str, variables: Dict, task: Optional[str], schema: Optional[Dict]) -> Tuple[Optional[str], Any]:
+        """(캐시 키, 캐시된 응답 또는 MISS) 조회 (캐시할 수 없는 호출이면 키는 None)"""
+        config = self.model_config(task)
+        if not self.llm_cache.cacheable(config["temperature"]):
+            return None, MISS
+        template_version = self.llm_cache.template_version(template + json.dumps(schema, sort_keys=True))
+        prompt = json.dumps(variables, sort_keys=True, ensure_ascii=False, default=str)
+        cache_key = self.llm_cache.make_key(config["model"], template_version, prompt, config["temperature"])
+        return cache_key, self.llm_cache.get(cache_key)
+
+    def _task_request(self, task: str, transcript: Union[Transcript, Dict, List[str]], meeting_date: Optional[str] = None) -> Dict:
+        """회의록 추출 작업(summarize/schedule/todos/extract)의 체인 호출 인자
+
+        프롬프트가 토큰 예산을 넘으면 LLM 을 호출하기 전에 PromptBudgetError 를 낸다.
+        """
+        variables = {"transcript": self._format_transcript(transcript)}
+        if task != "summarize":
+            variables["meeting_date"] = meeting_date
+            variables["relative_date_template"] = self.RELATIVE_DATE_TEMPLATE
+
+        if task == "extract":
+            def validate(result: Dict) -> Dict:
+                validate_json_schema(result, MEETING_EXTRACTION_SCHEMA)
+                return result
+            request = {"template": MEETING_EXTRACTION_TEMPLATE, "variables": variables, "task": task,
+                       "schema": MEETING_EXTRACTION_SCHEMA, "parse": validate}
+        else:
+            templates = {
+                "summarize": SUMMARIZE_MEETING_TEMPLATE,
+                "schedule": SCHEDULE_TEMPLATE,
+                "todos": TODO_TEMPLATE
+            }
+            request = {"template": templates[task], "variables": variables, "task": task, "parse": self._parse_json}
+
+        self.check_prompt_budget(request["template"].format(**variables), task)
+        return request
+
+    def check_prompt_budget(self, prompt: str, task: Optional[str] = None) -> int:
+        """프롬프트 토큰 수가 예산(LLM_PROMPT_MAX_TOKENS, 기본값 100000) 안인지 확인
+
+        Args:
+            prompt: 보낼 프롬프트 전체
+            task: 토크나이저를 고를 작업 이름
+
+        Returns:
+            프롬프트 토큰 수 (예산을 넘으면 PromptBudgetError)
+        """
+        max_tokens = int(os.getenv("LLM_PROMPT_MAX_TOKENS", "100000"))
+        tokens = self.count_tokens(prompt, task)
+        if tokens > max_tokens:
+            raise PromptBudgetError(f"{task or 'default'} 프롬프트 {tokens} 토큰이 예산 {max_tokens} 토큰을 넘음")
+        return tokens
+
+    async def arun_task(self,
+                        task: str,
+                        transcript: Union[Transcript, Dict, str],
+                        meeting_date: Optional[str] = None,
+                        validate: Optional[Callable[[Any], Any]] = None) -> Any:
+        """회의록 추출 작업을 비동기로 실행 (실패 시 예외 전파)
+
+        Args:
+            task: summarize, schedule, todos, extract 중 하나
+            transcript: 회의록 (Transcript, {"segments": [...]} 또는 회의 텍스트)
+            meeting_date: 회의 날짜 (summarize 제외)
+            validate: JSON 으로 변환한 응답의 추가 검증 함수 (통과한 응답만 캐시)
+
+        Returns:
+            JSON 으로 변환된 LLM 응답
+        """
+        request = self._task_request(task, transcript, meeting_date)
+        if validate is not None:
+            parse = request["parse"]
+            request["parse"] = lambda result: validate(parse(result))
+        return await self.ainvoke_chain(**request)
+
+    def count_tokens(self, text: str, task: Optional[str] = None) -> int:
+        """작업 모델의 토크나이저 기준 토큰 수"""
+        model = self.model_config(task)["model"]
+        encoding = self._encodings.get(model)
+        if encoding is None:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+            self._encodings[model] = encoding
+        return len(encoding.encode(text))
+
+    def split_transcript(self,
+                         transcript: Union[Transcript, Dict],
+                         max_tokens: Optional[int] = None,
+                         task: Optional[str] = None) -> List[List[str]]:
+        """회의록을 토큰 예산 안의 구간(줄 목록)으로 분할
+
+        프롬프트와 같은 형식(Transcript.prompt_turns)의 발화 턴 경계에서 자르고,
+        한 턴이 예산보다 길면 그 턴만 세그먼트 경계에서 자른다.
+
+        Args:
+            transcript: 회의록 (Transcript 또는 {"segments": [...]})
+            max_tokens: 구간당 최대 토큰 수 (기본값 LLM_WINDOW_TOKENS 또는 6000)
+            task: 토크나이저를 고를 작업 이름
+
+        Returns:
+            구간별 "화자: 내용" 줄 목록 (회의록 전체가 예산 안이면 구간 하나)
+        """
+        if max_tokens is None:
+            max_tokens = int(os.getenv("LLM_WINDOW_TOKENS", "6000"))
+        if not isinstance(transcript, Transcript):
+            transcript = Transcript.from_segments(transcript["segments"])
+        windows: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+
+        def flush():
+            nonlocal current, current_tokens
+            if current:
+                windows.append(current)
+            current, current_tokens = [], 0
+
+        for alias, texts in transcript.prompt_turns():
+            line = f"{alias}: {' '.join(texts)}"
+            line_tokens = self.count_tokens(line, task) + 1
+            if current_tokens + line_tokens > max_tokens:
+                flush()
+            if line_tokens <= max_tokens:
+                current.append(line)
+                current_tokens += line_tokens
+                continue
+            # 예산보다 긴 턴은 세그먼트 경계에서 자름
+            for text in texts:
+                line = f"{alias}: {text}"
+                line_tokens = self.count_tokens(line, task) + 1
+                if current_tokens + line_tokens > max_tokens:
+                    flush()
+                current.append(line)
+                current_tokens += line_tokens
+        flush()
+        return windows
+
+    async def areduce_summaries(self, summaries: List[Dict]) -> Dict:
+        """구간별 요약을 하나의 요약으로 압축 (실패 시 예외 전파)"""
+        return await self.ainvoke_chain(
+            REDUCE_SUMMARY_TEMPLATE,
+            {"summaries": json.dumps(summaries, ensure_ascii=False)},
+            task="reduce",
+            parse=self._parse_json
+        )
+
+    def _format_transcript(self, transcript: Union[Transcript, Dict, List[str], str]) -> str:
         """Whisper 결과를
-        SPEAKER_1: ㅎㅇ
-        SPEAKER_2: ㅇㅎ
-        형식으로 변환."""
-        formatted_text = []
-        for segment in transcript["segments"]:
-            speaker = segment["speaker"]
-            text = segment["text"]
-            formatted_text.append(f"{speaker}: {text}")
-        return formatted_text
+        A: ㅎㅇ
+        B: ㅇㅎ
+        형식의 문자열로 변환. (같은 화자의 연속 발화는 한 줄로 합치고 ASR 잡음은 제거,
+        split_transcript 로 나눈 줄 목록이면 그대로 이어 붙이고, 문자열이면 그대로 사용)"""
+        if isinstance(transcript, str):
+            return transcript
+        if isinstance(transcript, list):
+            return "\n".join(transcript)
+        if not isinstance(transcript, Transcript):
+            transcript = Transcript.from_segments(transcript["segments"])
+        return transcript.format_prompt()
 
     def create_contextual_chunks(self, segments: List[Dict]) -> List[Dict]:
         """회의 세그먼트를 문맥 기반으로 청크로 분리
@@ -95,12 +470,9 @@ class LangChainUtil:
             ]}}
             """
             
-            chain = self.create_chain(template)
-            result = chain.invoke({
+            chunk_info = self.invoke_chain(template, {
                 "transcript": "\n".join(seg["text"] for seg in formatted_segments)
-            })
-            
-            chunk_info = json.loads(result)
+            }, task="chunks", parse=json.loads)
             
             chunks = []
             for chunk in chunk_info:
@@ -138,17 +510,9 @@ class LangChainUtil:
                 }
             }]
 
-    def summarize_meeting(self, transcript: Dict) -> Dict:
+    def summarize_meeting(self, transcript: Union[Transcript, Dict]) -> Dict:
         try:
-            formatted_transcript = self._format_transcript(transcript)
-            
-            chain = self.create_chain(SUMMARIZE_MEETING_TEMPLATE)
-            
-            result = chain.invoke({"transcript": formatted_transcript})
-
-            if result.strip().startswith("```"):
-                result = self._remove_markdown_code_block(result)
-            parsed_result = json.loads(result)
+            parsed_result = self.invoke_chain(**self._task_request("summarize", transcript))
 
             return parsed_result
        
@@ -164,21 +528,10 @@ class LangChainUtil:
                 "summary": "회의 내용을 요약하는데 실패했습니다."
             }
 
-    def extract_schedule(self, transcript: Dict, meeting_date: str) -> List[Dict]:
+    def extract_schedule(self, transcript: Union[Transcript, Dict], meeting_date: str) -> List[Dict]:
         """회의에서 논의된 일정을 추출합니다."""
         try:
-            formatted_transcript = self._format_transcript(transcript)
-            
-            chain = self.create_chain(SCHEDULE_TEMPLATE)
-            result = chain.invoke({
-                "transcript": formatted_transcript,
-                "meeting_date": meeting_date,
-                "relative_date_template": self.RELATIVE_DATE_TEMPLATE
-            })
-            
-            if result.strip().startswith("```"):
-                result = self._remove_markdown_code_block(result)
-            parsed_result = json.loads(result)
+            parsed_result = self.invoke_chain(**self._task_request("schedule", transcript, meeting_date))
             
             return parsed_result
                 
@@ -190,21 +543,10 @@ class LangChainUtil:
             print(f"스택 트레이스: {traceback.format_exc()}")
             return []
 
-    def extract_todos(self, transcript: Dict, meeting_date: str) -> List[Dict]:
+    def extract_todos(self, transcript: Union[Transcript, Dict], meeting_date: str) -> List[Dict]:
         """회의에서 논의된 할 일을 추출합니다."""
         try:
-            formatted_transcript = self._format_transcript(transcript)
-
-            chain = self.create_chain(TODO_TEMPLATE)
-            result = chain.invoke({
-                "transcript": formatted_transcript,
-                "meeting_date": meeting_date,
-                "relative_date_template": self.RELATIVE_DATE_TEMPLATE
-            })
-            
-            if result.strip().startswith("```"):
-                result = self._remove_markdown_code_block(result)
-            parsed_result = json.loads(result)
+            parsed_result = self.invoke_chain(**self._task_request("todos", transcript, meeting_date))
             
             return parsed_result
                 
@@ -214,4 +556,4 @@ class LangChainUtil:
             print(f"에러 내용: {str(e)}")
             import traceback
             print(f"스택 트레이스: {traceback.format_exc()}")
-            return [] 
\ No newline at end of file
+            return []
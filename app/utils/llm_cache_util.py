@@ -0,0 +1,210 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_CACHE_DB = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'llm_cache.sqlite3')
+
+# get 이 캐시 미스와 None 값을 구분하기 위한 표식
+MISS = object()
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시 (메모리 LRU + SQLite)
+
+    키는 모델, 템플릿 버전, 정규화한 프롬프트 해시, temperature 로 만든다.
+    메모리에 최근 항목을 두고, 없으면 SQLite 에서 찾는다. SQLite 항목은 TTL 이
+    지나면 만료되고, 전체 크기가 상한을 넘으면 오래 사용하지 않은 것부터 삭제된다.
+    temperature 가 0 이 아닌 호출은 LLM_CACHE_NONZERO_TEMPERATURE 를 켠 경우에만 캐시한다.
+    """
+
+    def __init__(self,
+                 db_path: Optional[str] = None,
+                 memory_items: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 max_size_mb: Optional[float] = None,
+                 cache_nonzero_temperature: Optional[bool] = None):
+        self.db_path = db_path or os.getenv("LLM_CACHE_DB", DEFAULT_CACHE_DB)
+        self.memory_items = memory_items if memory_items is not None else int(os.getenv("LLM_CACHE_MEMORY_ITEMS", "256"))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+        if max_size_mb is None:
+            max_size_mb = float(os.getenv("LLM_CACHE_MAX_MB", "100"))
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        if cache_nonzero_temperature is None:
+            cache_nonzero_temperature = os.getenv("LLM_CACHE_NONZERO_TEMPERATURE", "false").lower() in ("1", "true", "yes")
+        self.cache_nonzero_temperature = cache_nonzero_temperature
+        self.enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "puts": 0, "evictions": 0, "expired": 0}
+
+        self._db = None
+        if self.enabled:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)")
+            self._db.commit()
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """공백 차이만 있는 프롬프트를 같은 것으로 보도록 정규화"""
+        return " ".join(prompt.split())
+
+    @classmethod
+    def make_key(cls, model: str, template_version: str, prompt: str, temperature: float) -> str:
+        """캐시 키 생성
+
+        Args:
+            model: 모델 이름/ID
+            template_version: 템플릿 버전 (템플릿이 바뀌면 달라지는 값)
+            prompt: 프롬프트 (또는 템플릿 변수를 직렬화한 문자열)
+            temperature: 샘플링 temperature
+
+        Returns:
+            캐시 키
+        """
+        prompt_hash = hashlib.sha256(cls.normalize_prompt(prompt).encode("utf-8")).hexdigest()
+        raw = json.dumps([model, template_version, prompt_hash, float(temperature)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def template_version(template: str) -> str:
+        """템플릿 내용으로 만든 버전 값"""
+        return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+    def cacheable(self, temperature: Optional[float]) -> bool:
+        """이 temperature 의 호출을 캐시할 수 있는지 여부"""
+        if not self.enabled:
+            return False
+        return temperature == 0 or self.cache_nonzero_temperature
+
+    def _remember(self, key: str, serialized: str, expires_at: float) -> None:
+        """메모리 LRU 에 저장 (잠금을 잡은 상태에서 호출)
+
+        호출한 쪽이 결과를 수정해도 캐시가 바뀌지 않도록 직렬화된 값을 보관한다.
+        """
+        self._memory[key] = (serialized, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Any:
+        """캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 응답 (없거나 만료되었으면 MISS)
+        """
+        if not self.enabled:
+            return MISS
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                serialized, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return json.loads(serialized)
+                del self._memory[key]
+
+            try:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] + self.ttl_seconds <= now:
+                    self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._stats["expired"] += 1
+                    row = None
+                if row is None:
+                    self._stats["misses"] += 1
+                    return MISS
+                self._db.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._db.commit()
+                value = json.loads(row[0])
+            except Exception as e:
+                print(f"LLM 캐시 읽기 실패: {str(e)}")
+                self._stats["misses"] += 1
+                return MISS
+
+            self._remember(key, row[0], row[1] + self.ttl_seconds)
+            self._stats["disk_hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """캐시 저장 후 크기 상한에 맞게 정리
+
+        Args:
+            key: 캐시 키
+            value: LLM 응답 (JSON 직렬화 가능해야 함)
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        try:
+            serialized = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"LLM 캐시 저장 실패 (직렬화): {str(e)}")
+            return
+
+        with self._lock:
+            self._remember(key, serialized, now + self.ttl_seconds)
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, serialized, len(serialized.encode("utf-8")), now, now)
+                )
+                self._evict_if_needed(now)
+                self._db.commit()
+                self._stats["puts"] += 1
+            except Exception as e:
+                print(f"LLM 캐시 저장 실패: {str(e)}")
+
+    def _evict_if_needed(self, now: float) -> None:
+        """만료 항목 삭제 후, 전체 크기가 상한을 넘으면 오래 사용하지 않은 항목부터 삭제 (잠금을 잡은 상태에서 호출)"""
+        expired = self._db.execute("DELETE FROM llm_cache WHERE created_at <= ?", (now - self.ttl_seconds,)).rowcount
+        self._stats["expired"] += max(expired, 0)
+
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM llm_cache ORDER BY accessed_at").fetchall():
+            if total <= self.max_size_bytes:
+                break
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            total -= size
+            self._stats["evictions"] += 1
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_items"] = len(self._memory)
+            if self._db is not None:
+                row = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+                stats["disk_items"], stats["disk_bytes"] = row
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["enabled"] = self.enabled
+        stats["cache_nonzero_temperature"] = self.cache_nonzero_temperature
+        return stats
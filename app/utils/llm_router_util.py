@@ -0,0 +1,280 @@
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+import numpy as np
+from dotenv import load_dotenv
+from app.utils.async_loop_util import get_background_loop
+from app.utils.json_stream_util import parse_llm_json
+
+load_dotenv()
+
+# 라우터 작업 이름 (rag 텍스트 API 와 같음)
+ROUTER_TASKS = ("summary", "todos", "schedules")
+
+
+def normalize_task_result(task: str, value: Any) -> Any:
+    """공급자마다 다른 응답 형태를 하나로 맞춤 (요약은 dict, 할 일/일정은 항목 목록)"""
+    if task == "summary":
+        if not isinstance(value, dict):
+            raise ValueError(f"요약 응답 형식이 다름: {type(value).__name__}")
+        return value
+    if isinstance(value, dict) and isinstance(value.get("items"), list):
+        value = value["items"]
+    if not isinstance(value, list):
+        raise ValueError(f"{task} 응답 형식이 다름: {type(value).__name__}")
+    return value
+
+
+def _task_validator(task: str):
+    """라우터가 변환할 수 있는 응답만 캐시되도록 검증 (캐시에는 원래 형태 그대로 저장)"""
+    def validate(value: Any) -> Any:
+        normalize_task_result(task, value)
+        return value
+    return validate
+
+
+class OpenAIProvider:
+    """LangChainUtil(GPT) 공급자 (응답 캐시 사용, ainvoke 를 쓰므로 취소하면 HTTP 요청도 중단)"""
+
+    name = "openai"
+    LANGCHAIN_TASKS = {"summary": "summarize", "todos": "todos", "schedules": "schedule"}
+
+    def __init__(self, langchain_util):
+        self.langchain_util = langchain_util
+
+    async def complete(self, task: str, text: str, meeting_date: Optional[str] = None) -> Any:
+        return await self.langchain_util.arun_task(
+            self.LANGCHAIN_TASKS[task], text, meeting_date, validate=_task_validator(task))
+
+
+class BedrockProvider:
+    """BedrockUtil(Claude) 공급자 (응답 캐시 사용, boto3 가 동기 방식이라 스레드에서 실행, 취소 시 결과만 버림)"""
+
+    name = "bedrock"
+
+    def __init__(self, bedrock_util):
+        self.bedrock_util = bedrock_util
+
+    async def complete(self, task: str, text: str, meeting_date: Optional[str] = None) -> Any:
+        return await asyncio.to_thread(
+            self.bedrock_util.run_task, task, text, meeting_date, _task_validator(task))
+
+
+class LatencyTracker:
+    """공급자별 최근 호출의 지연 시간과 성공/실패 기록"""
+
+    def __init__(self, window: int):
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)
+        self.calls = 0
+
+    def record(self, latency: float, succeeded: bool) -> None:
+        self.calls += 1
+        self.outcomes.append(succeeded)
+        if succeeded:
+            self.latencies.append(latency)
+
+    def record_cancelled(self, latency: float) -> None:
+        """헤지에 져 취소된 요청의 경과 시간 기록 (실제 지연 시간의 하한이므로 지연 시간에만 추가)"""
+        self.calls += 1
+        self.latencies.append(latency)
+
+    @property
+    def samples(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def attempts(self) -> int:
+        """성공/실패가 확정된 최근 호출 수"""
+        return len(self.outcomes)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return float(np.percentile(np.fromiter(self.latencies, dtype=np.float64), percent))
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1.0 - sum(self.outcomes) / len(self.outcomes)
+
+
+class LLMRouter:
+    """지연 시간/오류율 기반 LLM 공급자 라우터 (선택적 헤지 요청)
+
+    작업마다 최근 p50 지연 시간과 오류율로 가장 좋은 공급자를 고른다. 기록이 부족한
+    공급자는 먼저 시도해 기록을 쌓는다. 헤지를 켜면(LLM_HEDGE_ENABLED) 첫 요청이
+    그 공급자의 p95 지연 시간 안에 끝나지 않을 때 다음 공급자에도 요청을 보내고,
+    먼저 성공한 응답을 쓰며 나머지 요청은 취소한다. 첫 요청이 실패하면 기다리지
+    않고 바로 다음 공급자로 넘어간다. 두 공급자의 응답은 같은 파서(parse_llm_json)로 변환한다.
+    """
+
+    def __init__(self,
+                 providers: List,
+                 hedge: Optional[bool] = None,
+                 hedge_percentile: Optional[float] = None,
+                 window: Optional[int] = None,
+                 event_loop=None):
+        """
+        Args:
+            providers: complete(task, text, meeting_date) 코루틴을 가진 공급자 목록 (앞쪽이 기본 우선순위,
+                응답 문자열이나 JSON 으로 변환된 값을 반환)
+            hedge: 헤지 요청 사용 여부 (기본값 LLM_HEDGE_ENABLED)
+            hedge_percentile: 헤지 지연 기준 백분위 (기본값 LLM_HEDGE_PERCENTILE 또는 95)
+            window: 공급자별로 기록할 최근 호출 수 (기본값 LLM_ROUTER_WINDOW 또는 200)
+            event_loop: 동기 run 이 쓸 BackgroundEventLoop (없으면 공유 루프)
+        """
+        if not providers:
+            raise ValueError("LLM 공급자가 하나 이상 필요합니다.")
+        self.providers = {provider.name: provider for provider in providers}
+        if hedge is None:
+            hedge = os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile or float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+        # 기록이 부족할 때의 헤지 지연과 최소 헤지 지연(초)
+        self.hedge_default_delay = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY_SECONDS", "5"))
+        self.hedge_min_delay = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "0.2"))
+        self.min_samples = int(os.getenv("LLM_ROUTER_MIN_SAMPLES", "20"))
+        # 오류율 1 당 점수(지연 시간)에 곱하는 가중치
+        self.error_penalty = float(os.getenv("LLM_ROUTER_ERROR_PENALTY", "10"))
+        window = window or int(os.getenv("LLM_ROUTER_WINDOW", "200"))
+        self.trackers = {(name, task): LatencyTracker(window) for name in self.providers for task in ROUTER_TASKS}
+        self.event_loop = event_loop or get_background_loop()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hedges": 0, "hedge_wins": 0, "failovers": 0, "failures": 0}
+
+    def _score(self, name: str, task: str) -> float:
+        tracker = self.trackers[(name, task)]
+        penalty = 1 + self.error_penalty * tracker.error_rate()
+        if tracker.attempts < self.min_samples:
+            # 기록이 부족하면 먼저 시도 (실패가 많을수록 뒤로, 같으면 공급자 순서)
+            return -1.0 / penalty
+        p50 = tracker.percentile(50)
+        if p50 is None:
+            # 최근 호출이 모두 실패
+            return float("inf")
+        return p50 * penalty
+
+    def rank(self, task: str) -> List[str]:
+        """작업에 쓸 공급자 순서 (점수가 낮을수록 앞)"""
+        with self._lock:
+            order = list(self.providers)
+            return sorted(order, key=lambda name: (self._score(name, task), order.index(name)))
+
+    def hedge_delay(self, name: str, task: str) -> float:
+        """헤지 요청을 보내기 전 기다릴 시간 (공급자 지연 시간의 p95 기준)"""
+        with self._lock:
+            tracker = self.trackers[(name, task)]
+            if tracker.attempts < self.min_samples or tracker.samples == 0:
+                return self.hedge_default_delay
+            return max(tracker.percentile(self.hedge_percentile), self.hedge_min_delay)
+
+    def _record(self, name: str, task: str, latency: float, succeeded: bool) -> None:
+        with self._lock:
+            self.trackers[(name, task)].record(latency, succeeded)
+
+    def _record_cancelled(self, name: str, task: str, latency: float) -> None:
+        with self._lock:
+            self.trackers[(name, task)].record_cancelled(latency)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    async def _attempt(self, name: str, task: str, text: str, meeting_date: Optional[str]) -> Any:
+        """공급자 하나로 실행하고 응답을 변환 (변환 실패도 그 공급자의 실패로 기록)"""
+        started = time.perf_counter()
+        try:
+            raw = await self.providers[name].complete(task, text, meeting_date)
+            result = normalize_task_result(task, parse_llm_json(raw) if isinstance(raw, str) else raw)
+        except asyncio.CancelledError:
+            # 취소된 요청은 arun 에서 필요한 경우(헤지에 진 첫 요청)만 기록
+            raise
+        except Exception:
+            self._record(name, task, time.perf_counter() - started, False)
+            raise
+        self._record(name, task, time.perf_counter() - started, True)
+        return result
+
+    async def arun(self, task: str, text: str, meeting_date: Optional[str] = None) -> Any:
+        """작업 실행 (공유 이벤트 루프 안에서 호출)
+
+        Args:
+            task: summary, todos, schedules 중 하나
+            text: 회의 텍스트
+            meeting_date: 회의 날짜 (todos, schedules)
+
+        Returns:
+            변환된 결과 (요약 dict 또는 항목 목록, 모든 공급자가 실패하면 마지막 예외)
+        """
+        self._count("requests")
+        candidates = self.rank(task)
+        running: Dict[asyncio.Task, str] = {}
+        hedged = set()
+        last_error: Optional[BaseException] = None
+
+        def launch() -> Optional[asyncio.Task]:
+            if not candidates:
+                return None
+            name = candidates.pop(0)
+            attempt = asyncio.ensure_future(self._attempt(name, task, text, meeting_date))
+            running[attempt] = name
+            return attempt
+
+        primary_started = time.perf_counter()
+        primary = launch()
+        try:
+            while running:
+                timeout = None
+                if self.hedge and candidates and len(running) == 1 and primary in running:
+                    timeout = self.hedge_delay(running[primary], task)
+                done, _ = await asyncio.wait(list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # p95 안에 끝나지 않음: 다음 공급자에 헤지 요청
+                    self._count("hedges")
+                    hedged.add(launch())
+                    continue
+
+                for attempt in done:
+                    name = running.pop(attempt)
+                    if attempt.exception() is None:
+                        if attempt in hedged:
+                            self._count("hedge_wins")
+                        return attempt.result()
+                    last_error = attempt.exception()
+                    print(f"LLM 공급자 {name} 실패 ({task}): {str(last_error)}")
+                if not running and launch() is not None:
+                    self._count("failovers")
+        finally:
+            for attempt, name in running.items():
+                attempt.cancel()
+                if attempt is primary and hedged:
+                    # 헤지에 져 취소된 첫 요청의 경과 시간을 하한으로 기록 (빼면 p95 가 점점 줄어듦)
+                    self._record_cancelled(name, task, time.perf_counter() - primary_started)
+
+        self._count("failures")
+        raise last_error or RuntimeError(f"{task}: 사용할 LLM 공급자가 없습니다.")
+
+    def run(self, task: str, text: str, meeting_date: Optional[str] = None, timeout: Optional[float] = None) -> Any:
+        """arun 을 공유 이벤트 루프에서 실행하고 결과를 기다림 (요청 스레드에서 호출)"""
+        return self.event_loop.run(self.arun(task, text, meeting_date), timeout=timeout)
+
+    def stats(self) -> Dict:
+        """공급자별 지연 시간 백분위/오류율과 헤지 통계"""
+        with self._lock:
+            providers = {}
+            for (name, task), tracker in self.trackers.items():
+                if not tracker.calls:
+                    continue
+                p50, p95 = tracker.percentile(50), tracker.percentile(95)
+                providers.setdefault(name, {})[task] = {
+                    "calls": tracker.calls,
+                    "p50": round(p50, 3) if p50 is not None else None,
+                    "p95": round(p95, 3) if p95 is not None else None,
+                    "error_rate": round(tracker.error_rate(), 4)
+                }
+            return {**self._stats, "hedge": self.hedge, "providers": providers}
@@ -0,0 +1,37 @@
+import os
+import sys
+from typing import Optional
+
+
+def get_rss_mb() -> Optional[float]:
+    """현재 프로세스의 RSS(MB)
+
+    psutil 이 있으면 사용하고, 없으면 리눅스의 /proc 정보를 읽는다.
+    둘 다 불가능하면 None.
+    """
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS(MB) (Windows 에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 는 바이트, 리눅스는 KB 단위
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
@@ -0,0 +1,249 @@
+import gc
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+from app.utils.memory_util import get_rss_mb
+
+load_dotenv()
+
+
+class ModelLifecycleManager:
+    """모델 수명 주기 관리자
+
+    모델을 처음 사용할 때 로드하고, 일정 시간 사용하지 않거나 프로세스 RSS 가
+    워터마크를 넘으면 사용 중이 아닌 모델부터(LRU) 내린다. 내린 모델은 다음
+    사용 시 투명하게 다시 로드된다. 로드/해제 횟수와 시간을 지표로 남긴다.
+
+    워터마크 해제는 RSS 가 하한 워터마크 아래로 내려갈 때까지 진행하고, 해제한
+    뒤에는 쿨다운 동안 다시 해제하지 않는다. 해제 직후 요청이 모델을 다시 올려도
+    바로 다음 점검에서 또 내리는 로드/해제 반복을 막기 위함이다.
+    """
+
+    def __init__(self,
+                 idle_seconds: Optional[float] = None,
+                 rss_watermark_mb: Optional[float] = None,
+                 check_interval: Optional[float] = None,
+                 rss_low_watermark_mb: Optional[float] = None,
+                 watermark_cooldown: Optional[float] = None):
+        # 0 이면 해당 기준으로는 내리지 않음
+        self.idle_seconds = idle_seconds if idle_seconds is not None else float(os.getenv("MODEL_IDLE_UNLOAD_SECONDS", "0"))
+        self.rss_watermark_mb = rss_watermark_mb if rss_watermark_mb is not None else float(os.getenv("MODEL_RSS_WATERMARK_MB", "0"))
+        self.check_interval = check_interval or float(os.getenv("MODEL_LIFECYCLE_CHECK_SECONDS", "30"))
+        # 하한 워터마크 (기본: 워터마크의 90%) 아래로 내려갈 때까지 해제
+        if rss_low_watermark_mb is None:
+            rss_low_watermark_mb = float(os.getenv("MODEL_RSS_LOW_WATERMARK_MB", "0")) or self.rss_watermark_mb * 0.9
+        self.rss_low_watermark_mb = min(rss_low_watermark_mb, self.rss_watermark_mb)
+        # 워터마크 해제 후 다시 해제하지 않는 시간 (기본: 점검 주기 10회)
+        self.watermark_cooldown = watermark_cooldown if watermark_cooldown is not None else float(
+            os.getenv("MODEL_WATERMARK_COOLDOWN_SECONDS", str(self.check_interval * 10)))
+        self._watermark_cooldown_until = 0.0
+
+        self._entries: Dict[str, Dict] = {}
+        self._caches: Dict[str, Callable[[], None]] = {}
+        self._lock = threading.Lock()
+        self._metrics = {
+            "loads": 0,
+            "load_time": 0.0,
+            "unloads_idle": 0,
+            "unloads_watermark": 0,
+            "unloads_manual": 0,
+            "cache_clears": 0,
+            "watermark_skips": 0
+        }
+
+        self._reaper = None
+        if self.idle_seconds > 0 or self.rss_watermark_mb > 0:
+            self._reaper = threading.Thread(target=self._reap_loop, name="model-reaper", daemon=True)
+            self._reaper.start()
+
+    def register(self,
+                 name: str,
+                 loader: Callable[[], Any],
+                 unloader: Optional[Callable[[Any], None]] = None) -> None:
+        """모델 등록 (로드는 처음 사용할 때)
+
+        Args:
+            name: 모델 이름
+            loader: 모델을 로드해서 반환하는 함수
+            unloader: 모델을 내릴 때 추가로 정리할 함수 (선택)
+        """
+        with self._lock:
+            self._entries[name] = {
+                "loader": loader,
+                "unloader": unloader,
+                "model": None,
+                "in_use": 0,
+                "last_used": 0.0,
+                "load_lock": threading.Lock(),
+                "loads": 0
+            }
+
+    def register_cache(self, name: str, clear: Callable[[], None]) -> None:
+        """메모리 압박 시 비울 수 있는 캐시 등록 (예: 정렬 모델 캐시)"""
+        with self._lock:
+            self._caches[name] = clear
+
+    def _load(self, name: str, entry: Dict) -> Any:
+        with entry["load_lock"]:
+            if entry["model"] is not None:
+                return entry["model"]
+            started = time.perf_counter()
+            model = entry["loader"]()
+            load_time = time.perf_counter() - started
+            with self._lock:
+                entry["model"] = model
+                entry["loads"] += 1
+                # 미리 로드한 모델이 첫 요청 전에 유휴 해제되지 않도록 로드 시각부터 유휴 시간 계산
+                entry["last_used"] = time.time()
+                self._metrics["loads"] += 1
+                self._metrics["load_time"] += load_time
+            print(f"모델 로드: {name} ({load_time:.2f}s)")
+            return model
+
+    def preload(self, names: List[str]) -> None:
+        """지정한 모델을 미리 로드 (실패 시 예외 전파)"""
+        for name in names:
+            self._load(name, self._entries[name])
+
+    @contextmanager
+    def acquire(self, name: str) -> Iterator[Any]:
+        """모델 사용 (사용 중인 동안에는 내려가지 않음)
+
+        Args:
+            name: 모델 이름
+
+        Yields:
+            로드된 모델
+        """
+        entry = self._entries[name]
+        with self._lock:
+            entry["in_use"] += 1
+        try:
+            model = entry["model"]
+            if model is None:
+                model = self._load(name, entry)
+            yield model
+        finally:
+            with self._lock:
+                entry["in_use"] -= 1
+                entry["last_used"] = time.time()
+
+    def _unload(self, name: str, entry: Dict, reason: str) -> bool:
+        """사용 중이 아닌 모델 해제 (잠금을 잡은 상태에서 호출)"""
+        if entry["model"] is None or entry["in_use"] > 0:
+            return False
+        model = entry["model"]
+        entry["model"] = None
+        if entry["unloader"] is not None:
+            try:
+                entry["unloader"](model)
+            except Exception as e:
+                print(f"모델 정리 실패 ({name}): {e}")
+        self._metrics[f"unloads_{reason}"] += 1
+        print(f"모델 해제 ({reason}): {name}")
+        return True
+
+    @staticmethod
+    def _release_memory() -> None:
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def _reap_loop(self) -> None:
+        while True:
+            time.sleep(self.check_interval)
+            try:
+                self.reap()
+            except Exception as e:
+                print(f"모델 해제 점검 실패: {e}")
+
+    def reap(self) -> None:
+        """유휴 시간/메모리 워터마크 기준으로 모델 해제"""
+        released = False
+        now = time.time()
+
+        if self.idle_seconds > 0:
+            with self._lock:
+                for name, entry in self._entries.items():
+                    if entry["model"] is not None and now - entry["last_used"] > self.idle_seconds:
+                        released = self._unload(name, entry, "idle") or released
+            if released:
+                self._release_memory()
+
+        if self.rss_watermark_mb > 0:
+            rss = get_rss_mb()
+            if rss is None or rss <= self.rss_watermark_mb:
+                return
+
+            # 직전 해제 후 쿨다운 중이면 다시 올라온 모델을 바로 내리지 않음
+            if time.time() < self._watermark_cooldown_until:
+                with self._lock:
+                    self._metrics["watermark_skips"] += 1
+                print(f"워터마크 초과 (RSS {rss:.0f}MB) - 해제 쿨다운 중이라 건너뜀")
+                return
+
+            # 캐시를 먼저 비우고, 그래도 하한을 넘으면 오래 안 쓴 모델부터 해제
+            with self._lock:
+                caches = list(self._caches.items())
+            for name, clear in caches:
+                clear()
+                with self._lock:
+                    self._metrics["cache_clears"] += 1
+            self._release_memory()
+
+            evicted = False
+            while True:
+                rss = get_rss_mb()
+                if rss is None or rss <= self.rss_low_watermark_mb:
+                    break
+                with self._lock:
+                    candidates = sorted(
+                        (entry["last_used"], name) for name, entry in self._entries.items()
+                        if entry["model"] is not None and entry["in_use"] == 0
+                    )
+                    if not candidates:
+                        break
+                    _, name = candidates[0]
+                    evicted = self._unload(name, self._entries[name], "watermark") or evicted
+                self._release_memory()
+
+            if evicted:
+                self._watermark_cooldown_until = time.time() + self.watermark_cooldown
+
+    def unload_all(self) -> None:
+        """사용 중이 아닌 모델 전체 해제"""
+        with self._lock:
+            for name, entry in self._entries.items():
+                self._unload(name, entry, "manual")
+        self._release_memory()
+
+    def is_loaded(self, name: str) -> bool:
+        return self._entries[name]["model"] is not None
+
+    def metrics(self) -> Dict:
+        """로드/해제 지표와 모델별 상태"""
+        with self._lock:
+            models = {
+                name: {
+                    "loaded": entry["model"] is not None,
+                    "in_use": entry["in_use"],
+                    "loads": entry["loads"],
+                    "idle_seconds": round(time.time() - entry["last_used"], 1) if entry["last_used"] else None
+                }
+                for name, entry in self._entries.items()
+            }
+            metrics = dict(self._metrics)
+        metrics["load_time"] = round(metrics["load_time"], 3)
+        metrics["rss_mb"] = get_rss_mb()
+        metrics["idle_unload_seconds"] = self.idle_seconds
+        metrics["rss_watermark_mb"] = self.rss_watermark_mb
+        metrics["rss_low_watermark_mb"] = self.rss_low_watermark_mb
+        metrics["models"] = models
+        return metrics
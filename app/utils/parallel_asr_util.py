@@ -0,0 +1,142 @@
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import numpy as np
+from dotenv import load_dotenv
+from app.utils.audio_utils import split_at_silence, SAMPLE_RATE
+
+load_dotenv()
+
+# 워커 프로세스마다 하나씩 들고 있는 Whisper 모델
+_worker_model = None
+
+
+def _init_worker(model_name: str, compute_type: str, threads: int) -> None:
+    """워커 프로세스 초기화: 고정된 스레드 수로 자체 모델 로드"""
+    global _worker_model
+    import torch
+    import whisperx
+
+    torch.set_num_threads(threads)
+    _worker_model = whisperx.load_model(model_name, "cpu", compute_type=compute_type, threads=threads)
+
+
+def _transcribe_chunk(chunk: np.ndarray, offset: float, language: str, batch_size: int) -> List[Dict]:
+    """구간 하나를 전사하고 타임스탬프를 원본 오디오 기준으로 보정"""
+    result = _worker_model.transcribe(chunk, batch_size=batch_size, language=language)
+    return [
+        {
+            "text": segment["text"],
+            "start": round(segment["start"] + offset, 3),
+            "end": round(segment["end"] + offset, 3)
+        }
+        for segment in result["segments"]
+    ]
+
+
+def _worker_pid(hold_seconds: float) -> int:
+    """예열 확인용: 워커를 잠시 점유한 뒤 프로세스 ID 반환"""
+    time.sleep(hold_seconds)
+    return os.getpid()
+
+
+class ParallelTranscriber:
+    """긴 녹음을 조용한 지점에서 나눠 여러 워커 프로세스로 동시에 전사 (CPU 전용)
+
+    워커 스레드 수의 기본값은 워커와 동시에 도는 메인 프로세스 스레드(reserved_threads,
+    화자 분리)를 뺀 나머지 코어를 워커 수로 나눈 값이다 (최소 1). 워커마다 모델을 따로
+    올리므로 메모리는 워커 수만큼 더 든다.
+    """
+
+    def __init__(self,
+                 model_name: str,
+                 compute_type: str,
+                 num_workers: Optional[int] = None,
+                 threads_per_worker: Optional[int] = None,
+                 chunk_seconds: Optional[float] = None,
+                 batch_size: int = 16,
+                 reserved_threads: int = 0):
+        """
+        Args:
+            model_name: Whisper 모델 이름
+            compute_type: 연산 타입
+            num_workers: 워커 프로세스 수 (기본값 LONG_AUDIO_WORKERS 또는 코어 수 / 4)
+            threads_per_worker: 워커별 스레드 수 (기본값 LONG_AUDIO_THREADS_PER_WORKER 또는 남은 코어 / 워커 수)
+            chunk_seconds: 구간 최대 길이(초) (기본값 LONG_AUDIO_CHUNK_SECONDS 또는 300)
+            batch_size: 전사 배치 크기
+            reserved_threads: 워커와 동시에 도는 메인 프로세스 스레드 수 (화자 분리)
+        """
+        cpu_count = os.cpu_count() or 1
+        self.model_name = model_name
+        self.compute_type = compute_type
+        self.num_workers = num_workers or int(os.getenv("LONG_AUDIO_WORKERS", max(1, cpu_count // 4)))
+        # 메인 프로세스 스레드와 합쳐 코어 수를 넘지 않도록 남은 코어만 나눔
+        available = max(1, cpu_count - reserved_threads)
+        self.threads_per_worker = threads_per_worker or int(
+            os.getenv("LONG_AUDIO_THREADS_PER_WORKER", max(1, available // self.num_workers)))
+        self.chunk_seconds = chunk_seconds or float(os.getenv("LONG_AUDIO_CHUNK_SECONDS", "300"))
+        self.batch_size = batch_size
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 워커 모델 로드는 첫 사용 시 한 번만 (spawn: torch/CUDA 상태를 fork 하지 않음)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.compute_type, self.threads_per_worker)
+            )
+        return self._executor
+
+    def warm_up(self, timeout: float = 600.0) -> int:
+        """모든 워커 프로세스를 띄우고 각 워커의 모델 로드가 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            준비된 워커 수
+        """
+        executor = self._get_executor()
+        ready = set()
+        deadline = time.monotonic() + timeout
+        # 워커 수만큼 작업을 동시에 넣어 모든 워커를 띄우고, 응답한 워커가 다 모일 때까지 반복
+        while len(ready) < self.num_workers and time.monotonic() < deadline:
+            futures = [executor.submit(_worker_pid, 0.2) for _ in range(self.num_workers)]
+            ready.update(future.result() for future in futures)
+        return len(ready)
+
+    def transcribe(self, waveform: np.ndarray, language: str = 'ko') -> Dict:
+        """파형을 나눠 병렬 전사한 뒤 시간순으로 합침
+
+        Args:
+            waveform: 16kHz 모노 float32 파형
+            language: 언어 코드
+
+        Returns:
+            whisperx transcribe 와 같은 형식의 결과 {"segments", "language"}
+        """
+        windows = split_at_silence(
+            waveform,
+            max_chunk_seconds=self.chunk_seconds,
+            min_chunk_seconds=self.chunk_seconds / 2
+        )
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_transcribe_chunk, waveform[start:end], start / SAMPLE_RATE, language, self.batch_size)
+            for start, end in windows
+        ]
+
+        segments = []
+        for future in futures:
+            segments.extend(future.result())
+        segments.sort(key=lambda segment: segment["start"])
+        return {"segments": segments, "language": language}
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -9,8 +9,13 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class S3Util:
-    def __init__(self):
-        self.s3 = boto3.client(
+    def __init__(self, s3_client=None):
+        """S3 유틸 초기화
+
+        Args:
+            s3_client: 공유할 boto3 S3 클라이언트 (없으면 새로 생성)
+        """
+        self.s3 = s3_client or boto3.client(
             "s3",
             region_name=os.getenv("AWS_REGION"),
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
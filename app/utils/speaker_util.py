@@ -0,0 +1,131 @@
+from typing import Dict, List, Tuple
+import numpy as np
+
+# 누적합 오차보다 작은 겹침 차이는 같은 것으로 본다 (겹침 없음/동률 판정)
+OVERLAP_EPSILON = 1e-9
+
+
+class SpeakerTimeline:
+    """화자 분리 결과를 화자별 정렬된 구간 배열로 보관하고 구간별 화자를 계산
+
+    화자 k 의 구간들과 [0, x] 의 겹침 합 F_k(x) 를 정렬된 시작/끝 배열의
+    searchsorted 와 누적합으로 구하면, 임의 구간 [s, e] 와의 겹침 합은
+    F_k(e) - F_k(s) 가 된다. 질의 Q 개, 화자 구간 N 개, 화자 K 명일 때
+    O((N + Q) log N * K) 로 whisperx.assign_word_speakers 와 같은 결과를 낸다.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, speakers: np.ndarray):
+        # 화자 이름 순으로 정렬 (겹침이 같으면 이름이 앞선 화자 선택)
+        self.speakers = sorted(set(speakers.tolist()))
+        self._tables = []
+        for speaker in self.speakers:
+            mask = speakers == speaker
+            sorted_starts = np.sort(starts[mask])
+            sorted_ends = np.sort(ends[mask])
+            self._tables.append((
+                sorted_starts,
+                np.concatenate(([0.0], np.cumsum(sorted_starts))),
+                sorted_ends,
+                np.concatenate(([0.0], np.cumsum(sorted_ends)))
+            ))
+
+    @classmethod
+    def from_diarization(cls, diarize_segments) -> "SpeakerTimeline":
+        """화자 분리 결과(DataFrame 또는 dict 목록)로 생성"""
+        if isinstance(diarize_segments, list):
+            starts = np.array([seg["start"] for seg in diarize_segments], dtype=np.float64)
+            ends = np.array([seg["end"] for seg in diarize_segments], dtype=np.float64)
+            speakers = np.array([seg["speaker"] for seg in diarize_segments], dtype=object)
+        else:
+            starts = diarize_segments["start"].to_numpy(dtype=np.float64)
+            ends = diarize_segments["end"].to_numpy(dtype=np.float64)
+            speakers = diarize_segments["speaker"].to_numpy(dtype=object)
+        return cls(starts, ends, speakers)
+
+    @staticmethod
+    def _covered(table: Tuple[np.ndarray, ...], x: np.ndarray) -> np.ndarray:
+        """F(x): 화자 구간들과 (-inf, x] 의 겹침 합"""
+        sorted_starts, start_prefix, sorted_ends, end_prefix = table
+        n_started = np.searchsorted(sorted_starts, x, side="right")
+        n_ended = np.searchsorted(sorted_ends, x, side="right")
+        started = n_started * x - start_prefix[n_started]
+        ended = n_ended * x - end_prefix[n_ended]
+        return started - ended
+
+    @staticmethod
+    def _signed_overlap(table: Tuple[np.ndarray, ...], starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """화자 구간별 min(끝) - max(시작) 의 합 (겹치지 않는 구간은 음수로 더해짐)"""
+        sorted_starts, start_prefix, sorted_ends, end_prefix = table
+        n = len(sorted_starts)
+        n_ended = np.searchsorted(sorted_ends, ends, side="right")
+        n_started = np.searchsorted(sorted_starts, starts, side="right")
+        min_ends = end_prefix[n_ended] + ends * (n - n_ended)
+        max_starts = starts * n_started + (start_prefix[n] - start_prefix[n_started])
+        return min_ends - max_starts
+
+    def assign(self, starts: np.ndarray, ends: np.ndarray, fill_nearest: bool = False) -> np.ndarray:
+        """구간별로 가장 많이 겹치는 화자 인덱스 계산
+
+        Args:
+            starts: 질의 구간 시작 시각 배열
+            ends: 질의 구간 종료 시각 배열
+            fill_nearest: True 면 겹치지 않는 구간까지 포함한 교집합 합이 가장 큰
+                화자를 지정 (whisperx 의 fill_nearest 와 동일)
+
+        Returns:
+            self.speakers 인덱스 배열 (겹치는 화자가 없으면 -1)
+        """
+        if fill_nearest:
+            best_overlap = np.full(len(starts), -np.inf)
+        else:
+            best_overlap = np.zeros(len(starts))
+        best_index = np.full(len(starts), -1, dtype=np.int64)
+        for index, table in enumerate(self._tables):
+            if fill_nearest:
+                overlap = self._signed_overlap(table, starts, ends)
+            else:
+                overlap = self._covered(table, ends) - self._covered(table, starts)
+            better = overlap > best_overlap + OVERLAP_EPSILON
+            best_overlap[better] = overlap[better]
+            best_index[better] = index
+        return best_index
+
+
+def assign_word_speakers(diarize_segments, transcript_result: Dict, fill_nearest: bool = False) -> Dict:
+    """세그먼트와 단어에 화자 지정 (whisperx.assign_word_speakers 대체)
+
+    겹치는 화자 구간이 없는 세그먼트/단어(fill_nearest=False), 시각 정보가 없는
+    단어에는 speaker 를 넣지 않는다 (whisperx 와 동일).
+
+    Args:
+        diarize_segments: 화자 분리 결과 (start, end, speaker 컬럼의 DataFrame 또는 dict 목록)
+        transcript_result: {"segments": [...]} 형식의 전사 결과 (제자리에서 수정)
+        fill_nearest: 겹치는 화자가 없어도 가장 가까운 화자를 지정할지 여부
+
+    Returns:
+        화자가 지정된 transcript_result
+    """
+    timeline = SpeakerTimeline.from_diarization(diarize_segments)
+    if not timeline.speakers:
+        return transcript_result
+
+    # 세그먼트와 단어를 한 번에 질의
+    targets: List[Dict] = []
+    starts: List[float] = []
+    ends: List[float] = []
+    for seg in transcript_result["segments"]:
+        targets.append(seg)
+        starts.append(seg["start"])
+        ends.append(seg["end"])
+        for word in seg.get("words", []):
+            if "start" in word:
+                targets.append(word)
+                starts.append(word["start"])
+                ends.append(word["end"])
+
+    indices = timeline.assign(np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64), fill_nearest)
+    for target, index in zip(targets, indices.tolist()):
+        if index >= 0:
+            target["speaker"] = timeline.speakers[index]
+
+    return transcript_result
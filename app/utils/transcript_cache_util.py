@@ -0,0 +1,143 @@
+import os
+import json
+import hashlib
+import threading
+from typing import Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'transcripts')
+
+
+class TranscriptCache:
+    """오디오 해시 기반 전사 결과 디스크 캐시
+
+    키는 오디오 바이트의 SHA-256 과 모델/설정 값으로 만들고,
+    전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다(LRU).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: Optional[float] = None):
+        self.cache_dir = cache_dir or os.getenv("TRANSCRIPT_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if max_size_mb is None:
+            max_size_mb = float(os.getenv("TRANSCRIPT_CACHE_MAX_MB", "500"))
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = os.getenv("TRANSCRIPT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """파일 내용의 SHA-256 해시 계산"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(audio_hash: str, config: Dict) -> str:
+        """오디오 해시와 모델/설정으로 캐시 키 생성
+
+        Args:
+            audio_hash: 오디오 바이트 해시
+            config: 전사 결과에 영향을 주는 모델/설정 값
+
+        Returns:
+            캐시 키
+        """
+        config_json = json.dumps(config, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(f"{audio_hash}:{config_json}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 (적중 시 LRU 순서 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 전사 결과 또는 None
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            # 마지막 사용 시각을 수정 시각으로 기록
+            os.utime(path, None)
+        except FileNotFoundError:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        except Exception as e:
+            print(f"전사 캐시 읽기 실패: {str(e)}")
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self._stats["hits"] += 1
+        return value
+
+    def put(self, key: str, value: Dict) -> None:
+        """캐시 저장 후 크기 상한에 맞게 정리
+
+        Args:
+            key: 캐시 키
+            value: 전사 결과 (JSON 직렬화 가능해야 함)
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"전사 캐시 저장 실패: {str(e)}")
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            return
+
+        self._evict_if_needed()
+
+    def _evict_if_needed(self) -> None:
+        """전체 크기가 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    total -= size
+                    self._stats["evictions"] += 1
+                except FileNotFoundError:
+                    continue
+
+    def stats(self) -> Dict:
+        """캐시 적중/삭제 통계"""
+        with self._lock:
+            return dict(self._stats)
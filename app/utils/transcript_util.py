@@ -0,0 +1,272 @@
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import re
+import numpy as np
+
+# 세그먼트/단어에서 배열로 보관하는 필드 (그 밖의 필드는 extras 에 그대로 보관)
+SEGMENT_FIELDS = ("start", "end", "text", "words", "speaker")
+WORD_FIELDS = ("word", "start", "end", "score", "speaker")
+NO_SPEAKER = -1
+# 화자가 없는 세그먼트의 프롬프트용 약칭
+UNKNOWN_ALIAS = "?"
+
+# 단독으로 쓰인 간투사 (뒤의 쉼표/말줄임표까지 제거)
+_FILLER_PATTERN = re.compile(r"(?<!\S)(?:음+|어+|으+|흠+|에+|um+|uh+|hmm+)(?=[\s,.?!…]|$)[,.…]*", re.IGNORECASE)
+# 대괄호/괄호로 표시된 비언어 소리와 음표 (예: [음악], (웃음), ♪)
+_NON_SPEECH_PATTERN = re.compile(r"\[[^\]]*\]|\((?:웃음|박수|음악|기침|침묵|잡음)[^)]*\)|[♪♬]+")
+# 세 번 이상 연속 반복된 맞장구/간투사 (예: "네 네 네 네" -> "네")
+# 숫자나 일반 단어의 반복("1 1 1 2")은 실제 발화일 수 있으므로 그대로 둠
+_REPEAT_PATTERN = re.compile(r"(?<!\S)(네|예|응|어|음|아|yes|yeah|ok|okay)(?:\s+\1(?!\S)){2,}", re.IGNORECASE)
+_REPEAT_PUNCTUATION_PATTERN = re.compile(r"([,.?!…])\1+")
+# 무음 구간에서 Whisper 가 만들어 내는 문장 (세그먼트 전체가 일치할 때만 제거)
+_HALLUCINATION_PATTERN = re.compile(
+    r"(?:시청해\s*주셔서\s*감사합니다|구독과\s*좋아요.*|자막\s*(?:제공|제작).*|MBC\s*뉴스.*)[.!]?"
+)
+
+
+def clean_asr_text(text: str) -> str:
+    """간투사, 비언어 소리 표시, 반복 단어 등 ASR 잡음 제거 (세그먼트 전체가 잡음이면 빈 문자열)"""
+    text = _NON_SPEECH_PATTERN.sub(" ", text)
+    text = _FILLER_PATTERN.sub(" ", text)
+    text = _REPEAT_PATTERN.sub(r"\1", text)
+    text = _REPEAT_PUNCTUATION_PATTERN.sub(r"\1", text)
+    text = " ".join(text.split()).strip(" ,")
+    if _HALLUCINATION_PATTERN.fullmatch(text):
+        return ""
+    return text
+
+
+def speaker_alias(code: int) -> str:
+    """화자 코드의 프롬프트용 약칭 (A, B, ..., Z, S27, ...)"""
+    if code == NO_SPEAKER:
+        return UNKNOWN_ALIAS
+    return chr(ord("A") + code) if code < 26 else f"S{code + 1}"
+
+
+class _TextBuffer:
+    """여러 문자열을 하나의 버퍼와 오프셋 배열로 보관"""
+
+    __slots__ = ("buffer", "offsets")
+
+    def __init__(self, texts: List[str]):
+        self.buffer = "".join(texts)
+        self.offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        if texts:
+            np.cumsum([len(text) for text in texts], out=self.offsets[1:])
+
+    def __getitem__(self, index: int) -> str:
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]]
+
+
+class SegmentView:
+    """Transcript 안의 세그먼트 하나를 가리키는 뷰 (값을 복사하지 않음)"""
+
+    __slots__ = ("transcript", "index")
+
+    def __init__(self, transcript: "Transcript", index: int):
+        self.transcript = transcript
+        self.index = index
+
+    @property
+    def start(self) -> float:
+        return float(self.transcript.starts[self.index])
+
+    @property
+    def end(self) -> float:
+        return float(self.transcript.ends[self.index])
+
+    @property
+    def text(self) -> str:
+        return self.transcript.texts[self.index]
+
+    @property
+    def speaker(self) -> Optional[str]:
+        return self.transcript.speaker_name(self.transcript.speaker_codes[self.index])
+
+
+class Transcript:
+    """배열 기반 회의록
+
+    세그먼트/단어의 시작·끝 시각은 float 배열, 화자는 작은 정수 코드(이름은
+    speakers 에 한 번만 보관), 텍스트는 하나의 버퍼와 오프셋으로 보관한다.
+    단어 타임스탬프도 함께 보관하며, from_segments / to_segments 로 기존
+    JSON 형식(dict 목록)과 손실 없이 변환된다.
+    """
+
+    def __init__(self, segments: List[Dict]):
+        """dict 세그먼트 목록으로 생성 (from_segments 와 동일)"""
+        self.speakers: List[str] = []
+        self._speaker_codes: Dict[str, int] = {}
+
+        count = len(segments)
+        # words 키가 있던 세그먼트 (없던 세그먼트는 to_segments 에서도 words 를 넣지 않음)
+        self.has_words = np.zeros(count, dtype=bool)
+        self.starts = np.empty(count, dtype=np.float64)
+        self.ends = np.empty(count, dtype=np.float64)
+        self.speaker_codes = np.empty(count, dtype=np.int16)
+        self.word_offsets = np.zeros(count + 1, dtype=np.int64)
+        # 배열로 보관하지 않는 필드 {인덱스: {필드: 값}} (대부분 비어 있음)
+        self.extras: Dict[int, Dict] = {}
+        self.word_extras: Dict[int, Dict] = {}
+
+        texts = []
+        word_texts = []
+        word_starts = []
+        word_ends = []
+        word_scores = []
+        word_speakers = []
+        for i, segment in enumerate(segments):
+            self.starts[i] = segment["start"]
+            self.ends[i] = segment["end"]
+            self.speaker_codes[i] = self._intern(segment.get("speaker"))
+            texts.append(segment["text"])
+            extra = {key: value for key, value in segment.items() if key not in SEGMENT_FIELDS}
+            # speaker 키가 None 으로 있던 경우는 배열로 구분되지 않으므로 extras 에 보관
+            if "speaker" in segment and segment["speaker"] is None:
+                extra["speaker"] = None
+            if extra:
+                self.extras[i] = extra
+
+            self.has_words[i] = "words" in segment
+            words = segment.get("words", [])
+            for word in words:
+                word_extra = {key: value for key, value in word.items() if key not in WORD_FIELDS}
+                if "speaker" in word and word["speaker"] is None:
+                    word_extra["speaker"] = None
+                if word_extra:
+                    self.word_extras[len(word_texts)] = word_extra
+                word_texts.append(word.get("word", ""))
+                word_starts.append(word.get("start", np.nan))
+                word_ends.append(word.get("end", np.nan))
+                word_scores.append(word.get("score", np.nan))
+                word_speakers.append(self._intern(word.get("speaker")))
+            self.word_offsets[i + 1] = self.word_offsets[i] + len(words)
+
+        self.texts = _TextBuffer(texts)
+        self.word_texts = _TextBuffer(word_texts)
+        self.word_starts = np.array(word_starts, dtype=np.float64)
+        self.word_ends = np.array(word_ends, dtype=np.float64)
+        self.word_scores = np.array(word_scores, dtype=np.float64)
+        self.word_speaker_codes = np.array(word_speakers, dtype=np.int16)
+
+    @classmethod
+    def from_segments(cls, segments: List[Dict]) -> "Transcript":
+        """기존 JSON 형식의 세그먼트 목록에서 생성
+
+        Args:
+            segments: {"start", "end", "text", "speaker", "words"?} 형식의 세그먼트 목록
+
+        Returns:
+            Transcript
+        """
+        return cls(segments)
+
+    def _intern(self, speaker: Optional[str]) -> int:
+        if speaker is None:
+            return NO_SPEAKER
+        code = self._speaker_codes.get(speaker)
+        if code is None:
+            code = len(self.speakers)
+            self.speakers.append(speaker)
+            self._speaker_codes[speaker] = code
+        return code
+
+    def speaker_name(self, code: int) -> Optional[str]:
+        return None if code == NO_SPEAKER else self.speakers[code]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> SegmentView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return SegmentView(self, index)
+
+    def __iter__(self) -> Iterator[SegmentView]:
+        for index in range(len(self)):
+            yield SegmentView(self, index)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.word_starts)
+
+    def remap_times(self, func: Callable[[np.ndarray], np.ndarray], decimals: int = 3) -> "Transcript":
+        """세그먼트/단어 시각 전체를 한 번에 변환 (예: OffsetMap.to_original, 제자리 수정)"""
+        self.starts = np.round(func(self.starts), decimals)
+        self.ends = np.round(func(self.ends), decimals)
+        for name in ("word_starts", "word_ends"):
+            times = getattr(self, name)
+            known = ~np.isnan(times)
+            if known.any():
+                times[known] = np.round(func(times[known]), decimals)
+        return self
+
+    def prompt_turns(self, clean: bool = True) -> List[Tuple[str, List[str]]]:
+        """LLM 프롬프트용 발화 턴 목록
+
+        화자 이름은 처음 등장한 순서대로 A, B, ... 약칭으로 바꾸고, 같은 화자의
+        연속 세그먼트는 한 턴으로 합친다. clean 이면 ASR 잡음을 지우고 비게 된
+        세그먼트는 빼므로, 그 양옆의 같은 화자 턴도 하나로 합쳐진다.
+
+        Args:
+            clean: clean_asr_text 적용 여부
+
+        Returns:
+            [(화자 약칭, 세그먼트 텍스트 목록)] 목록
+        """
+        turns: List[Tuple[str, List[str]]] = []
+        previous_code = None
+        for index, code in enumerate(self.speaker_codes.tolist()):
+            text = self.texts[index]
+            text = clean_asr_text(text) if clean else text.strip()
+            if not text:
+                continue
+            if code != previous_code:
+                turns.append((speaker_alias(code), []))
+                previous_code = code
+            turns[-1][1].append(text)
+        return turns
+
+    def format_prompt(self, clean: bool = True) -> str:
+        """"약칭: 턴 텍스트" 줄을 이은 프롬프트용 문자열 (prompt_turns 참고)"""
+        return "\n".join(f"{alias}: {' '.join(texts)}" for alias, texts in self.prompt_turns(clean))
+
+    def _word_dict(self, index: int) -> Dict:
+        word = {"word": self.word_texts[index]}
+        for field, values in (("start", self.word_starts), ("end", self.word_ends), ("score", self.word_scores)):
+            value = values[index]
+            if not np.isnan(value):
+                word[field] = float(value)
+        speaker = self.speaker_name(self.word_speaker_codes[index])
+        if speaker is not None:
+            word["speaker"] = speaker
+        word.update(self.word_extras.get(index, {}))
+        return word
+
+    def to_segments(self, include_words: bool = False) -> List[Dict]:
+        """기존 JSON 형식의 세그먼트 목록으로 변환
+
+        Args:
+            include_words: 단어 타임스탬프(words) 포함 여부 (API 응답에는 포함하지 않음)
+
+        Returns:
+            세그먼트 목록
+        """
+        starts = self.starts.tolist()
+        ends = self.ends.tolist()
+        codes = self.speaker_codes.tolist()
+        offsets = self.word_offsets.tolist()
+        has_words = self.has_words.tolist()
+
+        segments = []
+        for i in range(len(self)):
+            segment = {"start": starts[i], "end": ends[i], "text": self.texts[i]}
+            if include_words and has_words[i]:
+                segment["words"] = [self._word_dict(w) for w in range(offsets[i], offsets[i + 1])]
+            speaker = self.speaker_name(codes[i])
+            if speaker is not None:
+                segment["speaker"] = speaker
+            segment.update(self.extras.get(i, {}))
+            segments.append(segment)
+        return segments
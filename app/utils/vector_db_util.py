@@ -7,16 +7,22 @@ from datetime import datetime
 load_dotenv()
 
 class VectorDBUtil:
-    def __init__(self):
-        """Pinecone 벡터 DB 초기화"""
+    def __init__(self, pool_threads: Optional[int] = None):
+        """Pinecone 벡터 DB 초기화
+
+        Args:
+            pool_threads: 인덱스 HTTP 커넥션 풀 크기 (기본값 PINECONE_POOL_THREADS 또는 4)
+        """
         api_key = os.getenv("PINECONE_API_KEY")
         index_name = os.getenv("PINECONE_INDEX_NAME")
+        if pool_threads is None:
+            pool_threads = int(os.getenv("PINECONE_POOL_THREADS", "4"))
         
         # Pinecone 클라이언트 초기화
         self.pc = Pinecone(api_key=api_key)
         
             
-        self.index = self.pc.Index(index_name)
+        self.index = self.pc.Index(index_name, pool_threads=pool_threads)
         
     def store_vectors(self, 
                      vectors: List[Dict],
@@ -1,9 +1,20 @@
 import whisperx
 import torch
-from typing import Dict, List
+import numpy as np
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from whisperx.diarize import DiarizationPipeline
+from whisperx.vad import merge_chunks
 import os
 from dotenv import load_dotenv
+from app.utils.align_cache_util import AlignModelCache
+from app.utils.batch_scheduler_util import WhisperBatchScheduler
+from app.utils.parallel_asr_util import ParallelTranscriber
+from app.utils.audio_utils import decode_audio, split_at_silence, SAMPLE_RATE
+from app.utils.asr_profile_util import ASR_PROFILES, get_profile, resolve_default_profile
+from app.utils.model_lifecycle_util import ModelLifecycleManager
+from app.utils.speaker_util import assign_word_speakers
 
 # Load environment variables
 load_dotenv()
@@ -14,32 +25,313 @@ class WhisperUtil:
         print(f"CUDA 사용 가능 여부: {torch.cuda.is_available()}")
         print(f"선택된 device: {self.device}")
         
-        hf_token = os.getenv('HF_TOKEN')
-        try:
-            self.model = whisperx.load_model("base", self.device, compute_type="float32")
-            self.diarize_model = DiarizationPipeline(use_auth_token=hf_token, device=self.device)
-        except Exception as e:
-            print(f"GPU 모델 로딩 실패, CPU로 전환: {e}")
-            self.device = 'cpu'
-            self.model = whisperx.load_model("base", self.device, compute_type="float32")
-            self.diarize_model = DiarizationPipeline(use_auth_token=hf_token, device=self.device)
+        # 실행 모드 및 스레드 예산 (parallel: 전사+정렬과 화자 분리를 동시에 수행)
+        cpu_count = os.cpu_count() or 1
+        self.pipeline_mode = os.getenv("PIPELINE_MODE", "parallel")
+        self.asr_threads = int(os.getenv("ASR_CPU_THREADS", max(1, cpu_count // 2)))
+        self.diarize_threads = int(os.getenv("DIARIZE_TORCH_THREADS", max(1, cpu_count - self.asr_threads)))
+        # Whisper(CTranslate2)는 모델 로드 시 asr_threads 를 따로 쓰고, torch 스레드 수는
+        # 프로세스 전체 설정이라 요청마다 바꾸지 않고 여기서 한 번만 정함 (화자 분리/정렬이 사용)
+        torch.set_num_threads(self.diarize_threads)
+
+        # ASR 프로필 (ASR_PROFILE 환경 변수 > 캘리브레이션 결과 > balanced)
+        self.default_profile = resolve_default_profile()
+        profile = get_profile(self.default_profile)
+        self.model_name = profile["model"]
+        self.compute_type = profile["compute_type"]
+        self.batch_size = profile["batch_size"]
+        print(f"기본 ASR 프로필: {self.default_profile} ({self.model_name}, {self.compute_type})")
+
+        # 모델은 수명 주기 관리자가 필요할 때 로드하고, 유휴/메모리 기준으로 내림
+        self.hf_token = os.getenv('HF_TOKEN')
+        self.models = ModelLifecycleManager()
+        for profile_name in ASR_PROFILES:
+            self.models.register(self._asr_model_key(profile_name), lambda name=profile_name: self._load_asr_model(name))
+        self.models.register("diarize", self._load_diarize_model)
+
+        preload = [self._asr_model_key(self.default_profile), "diarize"]
+        if os.getenv("MODEL_PRELOAD", "true").lower() in ("1", "true", "yes"):
+            try:
+                self.models.preload(preload)
+            except Exception as e:
+                print(f"GPU 모델 로딩 실패, CPU로 전환: {e}")
+                self.device = 'cpu'
+                self.models.unload_all()
+                self.models.preload(preload)
+
+        # 여러 요청의 VAD 구간을 모아 배치를 채우는 공용 추론 스케줄러
+        self.batch_scheduler = None
+        if os.getenv("ASR_BATCH_SCHEDULER", "false").lower() in ("1", "true", "yes"):
+            try:
+                self.batch_scheduler = WhisperBatchScheduler(
+                    lambda: self.models.acquire(self._asr_model_key(self.default_profile)),
+                    batch_size=self.batch_size)
+            except Exception as e:
+                # 설치된 whisperx 와 내부 API 가 맞지 않으면 배치 없이 바로 전사
+                print(f"배치 스케줄러 사용 불가, 요청별 전사로 전환: {e}")
+
+        # 긴 녹음은 CPU에서 여러 워커 프로세스로 나눠 전사 (LONG_AUDIO_THRESHOLD_SECONDS 이상)
+        # 워커마다 Whisper 모델을 하나씩 더 올리므로(기본 코어 수 / 4 개) 메모리가 충분할 때만
+        # LONG_AUDIO_PARALLEL=true 로 켠다
+        self.long_audio_threshold = float(os.getenv("LONG_AUDIO_THRESHOLD_SECONDS", "1200"))
+        self.parallel_transcriber = None
+        if self.device == 'cpu' and os.getenv("LONG_AUDIO_PARALLEL", "false").lower() in ("1", "true", "yes"):
+            # 워커가 메인 프로세스 전사를 대신하므로 동시에 도는 화자 분리 스레드만 남겨 둠
+            self.parallel_transcriber = ParallelTranscriber(
+                self.model_name, self.compute_type, batch_size=self.batch_size,
+                reserved_threads=self.diarize_threads)
+
+        # 화자 분리 전용 워커 (DIARIZE_CONCURRENCY, 기본값 1)
+        # 화자 분리 모델 하나와 torch 스레드 풀을 모든 요청이 함께 쓰므로, 동시 실행 수를
+        # 늘려도 처리량은 코어 수 이상으로 늘지 않고 요청별 지연만 길어진다. 기본값 1 은
+        # 동시 요청의 화자 분리를 차례로 처리(대기 시간 증가)하는 대신 코어 경합을 막는다.
+        self.diarize_concurrency = int(os.getenv("DIARIZE_CONCURRENCY", "1"))
+        self._diarize_executor = ThreadPoolExecutor(max_workers=self.diarize_concurrency, thread_name_prefix="diarize")
+
+        # 정렬 모델은 언어별로 캐시해서 재사용
+        self.align_cache = AlignModelCache(device=self.device)
+        self.models.register_cache("align", self.align_cache.clear)
+        preload_languages = [lang.strip() for lang in os.getenv("ALIGN_MODEL_PRELOAD", "ko").split(",") if lang.strip()]
+        self.align_cache.preload(preload_languages)
     
-    def transcribe(self, audio_path: str) -> Dict:
-        result = self.model.transcribe(
-            audio_path,
-            batch_size=16,
-            language='ko',
-        )
-        align_model, metadata = whisperx.load_align_model(language_code="ko", device=self.device)
-        result = whisperx.align(result["segments"], align_model, metadata, audio_path, self.device)
+    @staticmethod
+    def _as_waveform(audio: Union[str, np.ndarray]) -> np.ndarray:
+        """파일 경로면 한 번 디코딩하고, 파형이면 복사 없이 그대로 사용"""
+        if isinstance(audio, str):
+            return decode_audio(audio)
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    @staticmethod
+    def _asr_model_key(profile_name: str) -> str:
+        return f"asr:{profile_name}"
+
+    def _load_asr_model(self, profile_name: str):
+        """프로필별 Whisper 모델 로드"""
+        profile = get_profile(profile_name)
+        return whisperx.load_model(
+            profile["model"], self.device, compute_type=profile["compute_type"], threads=self.asr_threads)
+
+    def _load_diarize_model(self) -> DiarizationPipeline:
+        """pyannote 화자 분리 파이프라인 로드"""
+        return DiarizationPipeline(use_auth_token=self.hf_token, device=self.device)
+
+    def _asr(self, waveform: np.ndarray, language: str, profile: Optional[str] = None) -> Dict:
+        """Whisper 전사 (긴 녹음은 프로세스 풀, 스케줄러가 켜져 있으면 요청 간 배치로 처리)
+
+        프로세스 풀(ParallelTranscriber)과 배치 스케줄러(WhisperBatchScheduler)는 기본
+        프로필 모델로만 동작한다. 기본이 아닌 프로필을 요청별로 지정하면 둘 다 거치지
+        않고 해당 프로필 모델로 한 번에 전사하므로, 긴 녹음도 단일 프로세스에서 처리된다.
+        """
+        if profile is not None and profile != self.default_profile:
+            # 요청별로 지정한 프로필은 해당 프로필 모델로 바로 전사 (병렬/배치 처리 없음)
+            with self.models.acquire(self._asr_model_key(profile)) as model:
+                return model.transcribe(
+                    waveform,
+                    batch_size=get_profile(profile)["batch_size"],
+                    language=language,
+                )
+        if self.parallel_transcriber is not None and len(waveform) / SAMPLE_RATE >= self.long_audio_threshold:
+            return self.parallel_transcriber.transcribe(waveform, language)
+        if self.batch_scheduler is not None:
+            return self.batch_scheduler.transcribe(waveform, language)
+        with self.models.acquire(self._asr_model_key(self.default_profile)) as model:
+            return model.transcribe(
+                waveform,
+                batch_size=self.batch_size,
+                language=language,
+            )
+
+    def transcribe(self, audio: Union[str, np.ndarray], language: str = 'ko', profile: Optional[str] = None) -> Dict:
+        """WhisperX 전사 + 단어 단위 정렬
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz 모노 float32 파형
+            language: 언어 코드
+            profile: ASR 프로필 이름 (None 이면 기본 프로필, 기본이 아니면 병렬/배치 처리 없이 전사)
+
+        Returns:
+            정렬된 전사 결과
+        """
+        waveform = self._as_waveform(audio)
+        result = self._asr(waveform, language, profile)
+        align_model, metadata, cache_info = self.align_cache.get(language)
+        result = whisperx.align(result["segments"], align_model, metadata, waveform, self.device)
+        result["align_cache"] = cache_info
 
         return result
 
-    def diarize(self, audio_path: str) -> List[Dict]:
+    def cache_config(self, language: str = 'ko', profile: Optional[str] = None) -> Dict:
+        """전사 결과에 영향을 주는 모델/설정 값 (전사 캐시 키에 사용)"""
+        asr_profile = get_profile(profile or self.default_profile)
+        return {
+            "asr_model": asr_profile["model"],
+            "compute_type": asr_profile["compute_type"],
+            "language": language,
+            "align": True,
+            "diarization": "pyannote/speaker-diarization-3.1",
+            "whisperx_version": getattr(whisperx, "__version__", "unknown")
+        }
+
+    def model_stats(self) -> Dict:
+        """모델 캐시 통계 조회"""
+        stats = {
+            "asr_profile": self.default_profile,
+            "models": self.models.metrics(),
+            "align_models": self.align_cache.stats()
+        }
+        if self.batch_scheduler is not None:
+            stats["batch_scheduler"] = self.batch_scheduler.stats()
+        return stats
+
+    def speech_intervals(self, waveform: np.ndarray) -> List[Tuple[float, float]]:
+        """기본 ASR 파이프라인에 이미 로드된 VAD 로 음성 구간 계산 (전처리 무음 제거 확인용)
+
+        Args:
+            waveform: 16kHz 모노 float32 파형
+
+        Returns:
+            (시작, 끝) 초 목록
+        """
+        with self.models.acquire(self._asr_model_key(self.default_profile)) as pipeline:
+            vad_params = getattr(pipeline, "_vad_params", {})
+            vad_segments = pipeline.vad_model({
+                "waveform": torch.from_numpy(waveform).unsqueeze(0),
+                "sample_rate": SAMPLE_RATE
+            })
+            chunks = merge_chunks(
+                vad_segments,
+                30,
+                onset=vad_params.get("vad_onset", 0.5),
+                offset=vad_params.get("vad_offset", 0.363),
+            )
+        # merge_chunks 가 묶은 구간 안의 개별 음성 구간
+        return [(start, end) for chunk in chunks for start, end in chunk["segments"]]
+
+    def diarize(self, audio: Union[str, np.ndarray]) -> List[Dict]:
         """WhisperX로 화자 분리 수행"""
-        diarize_segments = self.diarize_model(audio_path)
+        with self.models.acquire("diarize") as diarize_model:
+            diarize_segments = diarize_model(self._as_waveform(audio))
         return diarize_segments
 
+    @staticmethod
+    def _timed(func, *args) -> Tuple[object, float]:
+        """실행하고 소요 시간을 함께 반환 (스레드 수는 __init__ 에서 정한 예산을 그대로 사용)"""
+        started = time.perf_counter()
+        result = func(*args)
+        return result, time.perf_counter() - started
+
+    def transcribe_and_diarize(self,
+                               audio: Union[str, np.ndarray],
+                               language: str = 'ko',
+                               profile: Optional[str] = None) -> Tuple[Dict, List[Dict], Dict]:
+        """전사+정렬과 화자 분리 수행
+
+        parallel 모드에서는 화자 분리를 전용 워커 스레드에서 돌리고, 전사+정렬은
+        호출 스레드에서 동시에 수행한다. 두 결과는 integrate_segments 에서만 합쳐진다.
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz 모노 float32 파형
+            language: 언어 코드
+            profile: ASR 프로필 이름 (None 이면 기본 프로필)
+
+        Returns:
+            Tuple[전사 결과, 화자 분리 결과, 단계별 소요 시간]
+        """
+        waveform = self._as_waveform(audio)
+
+        if self.pipeline_mode != "parallel":
+            whisper_result, transcribe_time = self._timed(self.transcribe, waveform, language, profile)
+            diarize_segments, diarize_time = self._timed(self.diarize, waveform)
+            return whisper_result, diarize_segments, {"transcribe": transcribe_time, "diarize": diarize_time}
+
+        diarize_future = self._diarize_executor.submit(self._timed, self.diarize, waveform)
+        try:
+            whisper_result, transcribe_time = self._timed(self.transcribe, waveform, language, profile)
+        except BaseException:
+            # 전사 예외를 그대로 전달 (아직 시작하지 않은 화자 분리는 취소하고, 실행 중이면 결과를 버림)
+            diarize_future.cancel()
+            raise
+        diarize_segments, diarize_time = diarize_future.result()
+
+        return whisper_result, diarize_segments, {"transcribe": transcribe_time, "diarize": diarize_time}
+
+    @staticmethod
+    def _shift_segments(segments: List[Dict], offset: float) -> List[Dict]:
+        """구간 기준 타임스탬프를 원본 오디오 기준으로 이동 (단어 타임스탬프 포함)"""
+        for segment in segments:
+            segment["start"] = round(segment["start"] + offset, 3)
+            segment["end"] = round(segment["end"] + offset, 3)
+            for word in segment.get("words", []):
+                if "start" in word:
+                    word["start"] = round(word["start"] + offset, 3)
+                if "end" in word:
+                    word["end"] = round(word["end"] + offset, 3)
+        return segments
+
+    def transcribe_stream(self,
+                          audio: Union[str, np.ndarray],
+                          language: str = 'ko',
+                          window_seconds: float = 30.0) -> Iterator[Tuple[str, Dict]]:
+        """긴 오디오를 조용한 지점에서 나눠 구간별로 전사하고 결과를 바로 내보냄
+
+        화자 분리는 전체 파형에 대해 백그라운드에서 수행하고,
+        모든 구간이 끝난 뒤 화자 라벨을 붙인 최종 세그먼트를 내보낸다.
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz 모노 float32 파형
+            language: 언어 코드
+            window_seconds: 구간 최대 길이 (초)
+
+        Yields:
+            (이벤트 이름, 데이터) - "segments", "speakers", "done"
+        """
+        started = time.perf_counter()
+        waveform = self._as_waveform(audio)
+        diarize_future = self._diarize_executor.submit(self._timed, self.diarize, waveform)
+
+        try:
+            align_model, metadata, _ = self.align_cache.get(language)
+            windows = split_at_silence(waveform, max_chunk_seconds=window_seconds)
+            all_segments = []
+            time_to_first_segment = None
+
+            for index, (start, end) in enumerate(windows):
+                # 슬라이스는 복사 없이 원본 파형을 참조
+                chunk = waveform[start:end]
+                result = self._asr(chunk, language)
+                if not result["segments"]:
+                    continue
+
+                aligned = whisperx.align(result["segments"], align_model, metadata, chunk, self.device)
+                segments = self._shift_segments(aligned["segments"], start / SAMPLE_RATE)
+                all_segments.extend(segments)
+
+                if time_to_first_segment is None:
+                    time_to_first_segment = time.perf_counter() - started
+                yield "segments", {
+                    "window": index,
+                    "total_windows": len(windows),
+                    "segments": [
+                        {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+                        for seg in segments
+                    ]
+                }
+        except BaseException:
+            # SSE 연결 종료(GeneratorExit)나 전사 실패 시 화자 분리를 기다리지 않음
+            # (시작 전이면 취소, 실행 중이면 워커에서 끝나고 결과는 버려짐)
+            diarize_future.cancel()
+            raise
+        diarize_segments, diarize_time = diarize_future.result()
+
+        # 화자 분리가 끝나면 전체 세그먼트에 화자 라벨을 다시 붙임
+        integrated = self.integrate_segments({"segments": all_segments}, diarize_segments)
+        yield "speakers", {"segments": self.remove_words_from_segments(integrated["segments"])}
+        yield "done", {
+            "time_to_first_segment": round(time_to_first_segment, 3) if time_to_first_segment is not None else None,
+            "diarize": round(diarize_time, 3),
+            "total": round(time.perf_counter() - started, 3)
+        }
+
     def integrate_segments(self, whisper_result: Dict, diarize_segments: List[Dict]) -> Dict:
         """Whisper 결과와 화자 분리 결과 통합
         
@@ -51,7 +343,7 @@ class WhisperUtil:
             통합된 세그먼트 목록
         """
         print("integrate_segments 호출")
-        integrated_result = whisperx.assign_word_speakers(diarize_segments, whisper_result)
+        integrated_result = assign_word_speakers(diarize_segments, whisper_result)
         return {
             "segments": integrated_result["segments"]
         }
@@ -0,0 +1,53 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+ROLE_SETS = [
+    ["agent"],
+    ["rag"],
+    ["asr"],
+    ["asr", "rag", "agent"],
+]
+
+# 새 인터프리터에서 앱을 만들고 시작 시간, RSS, 무거운 모듈 로드 여부를 출력
+CHILD_SCRIPT = """
+import sys, time, json
+started = time.perf_counter()
+from app import create_app
+create_app(roles={roles!r})
+elapsed = time.perf_counter() - started
+from app.utils.memory_util import get_rss_mb
+print(json.dumps({{
+    "startup_seconds": round(elapsed, 3),
+    "rss_mb": round(get_rss_mb() or 0, 1),
+    "torch_loaded": "torch" in sys.modules,
+    "whisperx_loaded": "whisperx" in sys.modules
+}}))
+"""
+
+
+def bench_roles(roles) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT.format(roles=roles)],
+        cwd=project_root,
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr else "unknown"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    for roles in ROLE_SETS:
+        result = bench_roles(roles)
+        print(f"{','.join(roles):<16} {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+import numpy as np
+from app.utils.audio_utils import decode_audio
+
+AUDIO_FILES = ["moat1.mp3", "aod.mp3"]
+REPEAT = 3
+
+
+def _load_audio_legacy(path: str) -> np.ndarray:
+    """기존 경로: whisperx가 단계마다 내부적으로 호출하던 load_audio"""
+    try:
+        from whisperx.audio import load_audio
+    except ImportError:
+        return decode_audio(path)
+    return load_audio(path)
+
+
+def bench_file(path: str) -> None:
+    before_times = []
+    after_times = []
+
+    for _ in range(REPEAT):
+        # 이전: transcribe, align, diarize 가 각각 파일을 디코딩 (3회)
+        started = time.perf_counter()
+        for _ in range(3):
+            _load_audio_legacy(path)
+        before_times.append(time.perf_counter() - started)
+
+        # 이후: 한 번 디코딩한 파형을 세 단계가 공유
+        started = time.perf_counter()
+        waveform = decode_audio(path)
+        shared = np.ascontiguousarray(waveform, dtype=np.float32)
+        after_times.append(time.perf_counter() - started)
+
+    assert np.shares_memory(waveform, shared), "파형이 복사되었습니다"
+
+    duration = len(waveform) / 16000
+    before = min(before_times)
+    after = min(after_times)
+    print(f"{Path(path).name}: 길이 {duration:.1f}s")
+    print(f"  이전 (3회 디코딩): {before:.3f}s")
+    print(f"  이후 (1회 디코딩): {after:.3f}s  ({before / after:.1f}x)")
+
+
+def main():
+    for name in AUDIO_FILES:
+        path = str(Path(project_root) / name)
+        if not Path(path).exists():
+            print(f"❌ 파일 없음: {path}")
+            continue
+        bench_file(path)
+
+
+if __name__ == "__main__":
+    main()
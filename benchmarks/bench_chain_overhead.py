@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+# 체인 생성만 측정하므로 실제 API 호출은 없음 (ChatOpenAI 생성에 키 값만 필요)
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from langchain_core.prompts import ChatPromptTemplate
+from app.templates import SUMMARIZE_MEETING_TEMPLATE, SCHEDULE_TEMPLATE, TODO_TEMPLATE
+from app.utils.langchain_util import LangChainUtil
+
+ITERATIONS = 2000
+TASK_TEMPLATES = [
+    ("summarize", SUMMARIZE_MEETING_TEMPLATE),
+    ("schedule", SCHEDULE_TEMPLATE),
+    ("todos", TODO_TEMPLATE)
+]
+
+
+def bench(label: str, build) -> None:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for task, template in TASK_TEMPLATES:
+            build(task, template)
+    elapsed = time.perf_counter() - started
+    per_call_us = elapsed / (ITERATIONS * len(TASK_TEMPLATES)) * 1e6
+    print(f"{label:<28} {per_call_us:8.1f} us/call")
+
+
+def main():
+    langchain_util = LangChainUtil()
+
+    # 기존: 호출마다 템플릿 파싱 + 파이프라인 생성
+    bench("rebuild per call (before)",
+          lambda task, template: ChatPromptTemplate.from_template(template) | langchain_util.llm | langchain_util.output_parser)
+
+    # 변경: 템플릿/모델 설정별로 한 번 만든 체인 재사용
+    bench("chain registry (after)",
+          lambda task, template: langchain_util.create_chain(template, task=task))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import os
+import sys
+import json
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+import tiktoken
+from langchain_core.callbacks import get_usage_metadata_callback
+from app.templates import (
+    RELATIVE_DATE_TEMPLATE,
+    SUMMARIZE_MEETING_TEMPLATE,
+    SCHEDULE_TEMPLATE,
+    TODO_TEMPLATE,
+    MEETING_EXTRACTION_TEMPLATE
+)
+from app.utils.transcript_util import Transcript
+
+MEETING_DATE = "2025-01-15"
+
+
+def load_transcript(path: str) -> Transcript:
+    """API 응답(meetingTranscript) 또는 세그먼트 목록 JSON 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("meetingTranscript") or data["segments"]
+    return Transcript.from_segments(data)
+
+
+def synthetic_transcript(turns: int = 600) -> Transcript:
+    lines = [
+        "다음 주 화요일까지 배포 일정 확정해서 공유해 주세요.",
+        "네, 금요일 오후 3시에 본사 회의실에서 리뷰 회의 하겠습니다.",
+        "QA 결과는 이번 주 안에 정리해서 올리겠습니다.",
+        "예산 관련해서는 다음 달 초에 다시 논의하죠."
+    ]
+    return Transcript.from_segments([
+        {"start": i * 5.0, "end": i * 5.0 + 4.5, "text": lines[i % len(lines)], "speaker": f"SPEAKER_{i % 3:02d}"}
+        for i in range(turns)
+    ])
+
+
+def prompt_tokens(transcript: Transcript) -> dict:
+    """각 방식이 보내는 프롬프트의 입력 토큰 수 (gpt-4o 토크나이저 기준)"""
+    encoding = tiktoken.encoding_for_model("gpt-4o")
+    variables = {
+        "transcript": transcript.format_prompt(),
+        "meeting_date": MEETING_DATE,
+        "relative_date_template": RELATIVE_DATE_TEMPLATE
+    }
+    count = lambda template: len(encoding.encode(template.format(**variables)))
+    return {
+        "fanout": sum(count(template) for template in (SUMMARIZE_MEETING_TEMPLATE, SCHEDULE_TEMPLATE, TODO_TEMPLATE)),
+        "combined": count(MEETING_EXTRACTION_TEMPLATE)
+    }
+
+
+def run_mode(transcript: Transcript, mode: str) -> dict:
+    """실제 LLM 을 호출해 방식별 소요 시간과 사용 토큰 측정"""
+    from app.services.api_service import ConcurrentProcessor
+    from app.utils.date_util import DateUtil
+    from app.utils.langchain_util import LangChainUtil
+
+    processor = ConcurrentProcessor(LangChainUtil(), DateUtil(), mode=mode)
+    with get_usage_metadata_callback() as usage:
+        started = time.perf_counter()
+        results = processor.process_all(transcript, MEETING_DATE)
+        elapsed = time.perf_counter() - started
+
+    totals = {"input_tokens": 0, "output_tokens": 0}
+    for metadata in usage.usage_metadata.values():
+        totals["input_tokens"] += metadata.get("input_tokens", 0)
+        totals["output_tokens"] += metadata.get("output_tokens", 0)
+    return {
+        "wall_seconds": round(elapsed, 2),
+        **totals,
+        "todos": len(results["todos"].get("items", [])),
+        "schedule": len(results["schedule"].get("items", []))
+    }
+
+
+def main():
+    # 사용법: python benchmarks/bench_llm_extraction.py [회의록 JSON]
+    transcript = load_transcript(sys.argv[1]) if len(sys.argv) > 1 else synthetic_transcript()
+    print(f"세그먼트 {len(transcript)}개")
+    print(f"프롬프트 입력 토큰: {prompt_tokens(transcript)}")
+
+    if not os.getenv("OPENAI_API_KEY"):
+        print("OPENAI_API_KEY 가 없어 실제 호출 측정은 건너뜁니다.")
+        return
+    for mode in ("fanout", "combined"):
+        print(f"{mode}: {run_mode(transcript, mode)}")
+
+
+if __name__ == "__main__":
+    main()
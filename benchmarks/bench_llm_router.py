@@ -0,0 +1,105 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+import numpy as np
+
+# 짧은 측정에 맞춘 라우터 설정
+os.environ.setdefault("LLM_ROUTER_MIN_SAMPLES", "10")
+os.environ.setdefault("LLM_HEDGE_DEFAULT_DELAY_SECONDS", "0.2")
+os.environ.setdefault("LLM_HEDGE_MIN_DELAY_SECONDS", "0.02")
+
+from app.utils.llm_router_util import LLMRouter
+
+REQUESTS = 400
+CONCURRENCY = 10
+
+
+class FakeProvider:
+    """지연 시간과 느린 응답/오류를 주입하는 로컬 가짜 공급자"""
+
+    def __init__(self, name: str, median: float, slow_rate: float, slow_latency: float,
+                 error_rate: float = 0.0, fenced: bool = False, seed: int = 0):
+        self.name = name
+        self.median = median
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.fenced = fenced
+        self.random = random.Random(seed)
+        self.cancelled = 0
+
+    async def complete(self, task, text, meeting_date=None):
+        latency = self.median * self.random.lognormvariate(0, 0.25)
+        if self.random.random() < self.slow_rate:
+            latency = self.slow_latency
+        failed = self.random.random() < self.error_rate
+        try:
+            await asyncio.sleep(latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if failed:
+            raise RuntimeError(f"{self.name} 503")
+        value = {"items": [{"text": "배포 일정 공유", "start": None, "end": None}]}
+        text = json.dumps(value, ensure_ascii=False)
+        # 공급자마다 다른 응답 형태(코드 블록)도 같은 파서로 처리되는지 확인
+        return f"```json\n{text}\n```" if self.fenced else text
+
+
+def make_providers(seed: int):
+    # openai: 평소에 빠르지만 느려지는 구간에서 15% 요청이 0.6초
+    # bedrock: 조금 느리지만 안정적
+    return [
+        FakeProvider("openai", median=0.05, slow_rate=0.15, slow_latency=0.6, error_rate=0.01, seed=seed),
+        FakeProvider("bedrock", median=0.07, slow_rate=0.02, slow_latency=0.6, fenced=True, seed=seed + 1)
+    ]
+
+
+def measure(label: str, providers, hedge: bool) -> None:
+    router = LLMRouter(providers, hedge=hedge)
+    latencies = []
+
+    async def one():
+        started = time.perf_counter()
+        try:
+            await router.arun("todos", "회의 내용")
+        except Exception:
+            pass
+        latencies.append(time.perf_counter() - started)
+
+    async def main():
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def limited():
+            async with semaphore:
+                await one()
+        await asyncio.gather(*(limited() for _ in range(REQUESTS)))
+
+    router.event_loop.run(main())
+    stats = router.stats()
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{label}: p50 {p50:.3f}s, p95 {p95:.3f}s, p99 {p99:.3f}s, "
+          f"hedges {stats['hedges']}, hedge wins {stats['hedge_wins']}, failovers {stats['failovers']}, "
+          f"failures {stats['failures']}, cancelled {sum(p.cancelled for p in providers)}")
+    for name, tasks in stats["providers"].items():
+        print(f"  {name}: {tasks['todos']}")
+
+
+def main():
+    # 사용법: python benchmarks/bench_llm_router.py
+    measure("openai only", make_providers(0)[:1], hedge=False)
+    measure("router", make_providers(0), hedge=False)
+    measure("router + hedge", make_providers(0), hedge=True)
+
+
+if __name__ == "__main__":
+    main()
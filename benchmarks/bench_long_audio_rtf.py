@@ -0,0 +1,66 @@
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+import numpy as np
+from app.utils.audio_utils import decode_audio, SAMPLE_RATE
+from app.utils.parallel_asr_util import ParallelTranscriber
+
+AUDIO_FILES = ["moat1.mp3", "aod.mp3", "moat8.mp3", "moat9.mp3"]
+# 긴 회의를 흉내내기 위해 번들 파일들을 이어 붙일 최소 길이 (초)
+TARGET_SECONDS = 20 * 60
+
+
+def build_long_waveform() -> np.ndarray:
+    waveforms = []
+    for name in AUDIO_FILES:
+        path = Path(project_root) / name
+        if path.exists():
+            waveforms.append(decode_audio(str(path)))
+    if not waveforms:
+        raise FileNotFoundError("번들 MP3 파일을 찾을 수 없습니다.")
+
+    total = []
+    total_len = 0
+    while total_len < TARGET_SECONDS * SAMPLE_RATE:
+        for waveform in waveforms:
+            total.append(waveform)
+            total_len += len(waveform)
+    return np.concatenate(total)
+
+
+def main():
+    import whisperx
+
+    waveform = build_long_waveform()
+    duration = len(waveform) / SAMPLE_RATE
+    print(f"테스트 오디오 길이: {duration / 60:.1f}분")
+
+    # 단일 호출 경로
+    model = whisperx.load_model("base", "cpu", compute_type="float32")
+    started = time.perf_counter()
+    single = model.transcribe(waveform, batch_size=16, language="ko")
+    single_time = time.perf_counter() - started
+    print(f"단일 호출: {single_time:.1f}s (RTF {single_time / duration:.3f}, 세그먼트 {len(single['segments'])}개)")
+
+    # 프로세스 풀 경로 (모델 로드 시간은 제외하기 위해 모든 워커를 예열)
+    transcriber = ParallelTranscriber("base", "float32")
+    transcriber.warm_up()
+    started = time.perf_counter()
+    parallel = transcriber.transcribe(waveform)
+    parallel_time = time.perf_counter() - started
+    transcriber.shutdown()
+    print(f"프로세스 풀 ({transcriber.num_workers}워커 x {transcriber.threads_per_worker}스레드): "
+          f"{parallel_time:.1f}s (RTF {parallel_time / duration:.3f}, 세그먼트 {len(parallel['segments'])}개)")
+
+    starts = [segment["start"] for segment in parallel["segments"]]
+    assert starts == sorted(starts), "세그먼트가 시간순이 아닙니다"
+    print(f"✅ 속도 향상: {single_time / parallel_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+import tiktoken
+from app.templates import (
+    RELATIVE_DATE_TEMPLATE,
+    SUMMARIZE_MEETING_TEMPLATE,
+    SCHEDULE_TEMPLATE,
+    TODO_TEMPLATE,
+    MEETING_EXTRACTION_TEMPLATE
+)
+from app.utils.transcript_util import Transcript
+
+MEETING_DATE = "2025-01-15"
+TEMPLATES = {
+    "summarize": SUMMARIZE_MEETING_TEMPLATE,
+    "schedule": SCHEDULE_TEMPLATE,
+    "todos": TODO_TEMPLATE,
+    "extract": MEETING_EXTRACTION_TEMPLATE
+}
+
+
+def load_transcript(path: str, whisper_util=None) -> Transcript:
+    """오디오 파일은 전사+화자 분리, JSON 파일은 API 응답(meetingTranscript) 또는 세그먼트 목록으로 로드"""
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("meetingTranscript") or data["segments"]
+        return Transcript.from_segments(data)
+
+    whisper_result, diarize_segments, _ = whisper_util.transcribe_and_diarize(path)
+    return Transcript.from_segments(whisper_util.integrate_segments(whisper_result, diarize_segments)["segments"])
+
+
+def synthetic_transcript(turns: int = 600) -> Transcript:
+    lines = [
+        " 음, 다음 주 화요일까지 배포 일정 확정해서 공유해 주세요.",
+        " 네 네 네 알겠습니다.",
+        " 어... 금요일 오후 3시에 본사 회의실에서 리뷰 회의 하겠습니다.",
+        " QA 결과는 이번 주 안에 정리해서 올리겠습니다.",
+        " [음악]"
+    ]
+    return Transcript.from_segments([
+        {"start": i * 5.0, "end": i * 5.0 + 4.5, "text": lines[i % len(lines)], "speaker": f"SPEAKER_{(i // 2) % 3:02d}"}
+        for i in range(turns)
+    ])
+
+
+def list_repr(transcript: Transcript) -> str:
+    """이전 형식: "화자: 텍스트" 줄 목록을 그대로 문자열로 만든 것"""
+    return str([f"{seg.get('speaker', 'Unknown')}: {seg['text']}" for seg in transcript.to_segments()])
+
+
+def prompt_tokens(transcript: Transcript) -> dict:
+    """추출 호출별 입력 토큰 수: 이전 형식(줄 목록의 repr) 대비 압축 형식 (gpt-4o 토크나이저 기준)"""
+    encoding = tiktoken.encoding_for_model("gpt-4o")
+    formats = {
+        "list_repr": list_repr(transcript),
+        "compact": transcript.format_prompt()
+    }
+    results = {}
+    for task, template in TEMPLATES.items():
+        counts = {
+            name: len(encoding.encode(template.format(
+                transcript=text,
+                meeting_date=MEETING_DATE,
+                relative_date_template=RELATIVE_DATE_TEMPLATE
+            )))
+            for name, text in formats.items()
+        }
+        counts["reduction"] = f"{1 - counts['compact'] / counts['list_repr']:.1%}"
+        results[task] = counts
+    return results
+
+
+def main():
+    # 사용법: python benchmarks/bench_prompt_tokens.py [오디오 또는 회의록 JSON 파일 ...]
+    # (인자가 없으면 저장소의 mp3 녹음 파일, whisperx 가 없으면 합성 회의록 사용)
+    paths = sys.argv[1:] or sorted(str(path) for path in Path(project_root).glob("*.mp3"))
+    transcripts = []
+    whisper_util = None
+    for path in paths:
+        if not path.endswith(".json") and whisper_util is None:
+            try:
+                from app.utils.whisper_util import WhisperUtil
+            except ImportError as e:
+                print(f"{path}: 전사 불가 ({str(e)}), 합성 회의록으로 대체합니다.")
+                break
+            whisper_util = WhisperUtil()
+        transcripts.append((path, load_transcript(path, whisper_util)))
+    if not transcripts:
+        transcripts.append(("synthetic", synthetic_transcript()))
+
+    for name, transcript in transcripts:
+        print(f"{name}: 세그먼트 {len(transcript)}개")
+        for task, counts in prompt_tokens(transcript).items():
+            print(f"  {task}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+# 캐시가 결과를 바꾸지 않도록 끄고, 재시도 대기 시간은 짧게 측정
+os.environ["LLM_CACHE_ENABLED"] = "false"
+os.environ.setdefault("BATCH_RETRY_BASE_SECONDS", "0.05")
+# 매니페스트는 임시 파일에 저장
+os.environ["BATCH_MANIFEST_PATH"] = os.path.join(tempfile.mkdtemp(), "batch_manifest.json")
+
+from app.utils.bedrock_util import BedrockUtil
+
+FILE_COUNT = 1200
+PAGE_SIZE = 1000
+S3_DELAY_SECONDS = 0.002
+CLAUDE_DELAY_SECONDS = 0.01
+# 가짜 Bedrock 이 동시에 받아 주는 호출 수 (넘으면 ThrottlingException)
+CLAUDE_CAPACITY = 6
+
+
+class FakeClientError(Exception):
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeBody:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def read(self):
+        return self.data
+
+
+class FakeS3:
+    def __init__(self, file_count: int):
+        self.keys = [f"meetings/{i:05d}.txt" for i in range(file_count)]
+        self.etags = {key: '"v1"' for key in self.keys}
+        self.calls = {"list": 0, "get": 0, "head": 0}
+
+    def _object(self, key):
+        return {"Key": key, "ETag": self.etags[key], "LastModified": datetime(2025, 1, 15)}
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):
+        self.calls["list"] += 1
+        start = int(ContinuationToken or 0)
+        page = {"Contents": [self._object(key) for key in self.keys[start:start + PAGE_SIZE]]}
+        if start + PAGE_SIZE < len(self.keys):
+            page["NextContinuationToken"] = str(start + PAGE_SIZE)
+        return page
+
+    def get_paginator(self, name):
+        s3 = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                token = None
+                while True:
+                    page = s3.list_objects_v2(Bucket, Prefix, token)
+                    yield page
+                    token = page.get("NextContinuationToken")
+                    if token is None:
+                        return
+        return Paginator()
+
+    def get_object(self, Bucket, Key):
+        self.calls["get"] += 1
+        time.sleep(S3_DELAY_SECONDS)
+        return {"Body": FakeBody(f"{Key} 회의 내용".encode("utf-8"))}
+
+    def head_object(self, Bucket, Key):
+        self.calls["head"] += 1
+        time.sleep(S3_DELAY_SECONDS)
+        return self._object(Key)
+
+
+class FakeRuntime:
+    def __init__(self):
+        self.in_flight = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def invoke_model(self, **kwargs):
+        with self._lock:
+            if self.in_flight >= CLAUDE_CAPACITY:
+                self.throttled += 1
+                raise FakeClientError("ThrottlingException")
+            self.in_flight += 1
+        try:
+            time.sleep(CLAUDE_DELAY_SECONDS)
+            prompt = json.loads(kwargs["body"])["messages"][0]["content"]
+            if "요약" in prompt:
+                value = {"subject": "주제", "summary": "요약"}
+            else:
+                value = [{"text": "할 일", "start": None, "end": None}]
+            text = json.dumps(value, ensure_ascii=False)
+            return {"body": FakeBody(json.dumps({"content": [{"text": text}]}).encode("utf-8"))}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def legacy_summarize_all(bedrock_util: BedrockUtil) -> list:
+    """이전 구현: 페이지 하나만 조회, 파일을 모두 내려받은 뒤 하나씩 호출, 파일마다 head_object"""
+    response = bedrock_util.s3.list_objects_v2(Bucket=bedrock_util.bucket, Prefix=bedrock_util.prefix)
+    files = []
+    for obj in response.get("Contents", []):
+        text = bedrock_util.s3.get_object(Bucket=bedrock_util.bucket, Key=obj["Key"])["Body"].read().decode("utf-8")
+        files.append({"key": obj["Key"], "text": text})
+    results = []
+    for f in files:
+        summary = bedrock_util.summarize_meeting(f["text"])
+        head = bedrock_util.s3.head_object(Bucket=bedrock_util.bucket, Key=f["key"])
+        summary["start"] = head["LastModified"].strftime("%Y-%m-%d")
+        results.append({"file": f["key"], "summary": summary})
+    return results
+
+
+def make_util(s3=None):
+    s3, runtime = s3 or FakeS3(FILE_COUNT), FakeRuntime()
+    return BedrockUtil(runtime_client=runtime, s3_client=s3), s3, runtime
+
+
+def main():
+    # 사용법: python benchmarks/bench_rag_batch.py
+    bedrock_util, s3, runtime = make_util()
+    started = time.perf_counter()
+    legacy = legacy_summarize_all(bedrock_util)
+    print(f"legacy: {len(legacy)}/{FILE_COUNT} files, {time.perf_counter() - started:.2f}s, "
+          f"s3 calls {s3.calls}, throttled {runtime.throttled}")
+
+    os.environ["BATCH_MANIFEST_BACKEND"] = "off"
+    bedrock_util, s3, runtime = make_util()
+    started = time.perf_counter()
+    first = None
+    count = 0
+    for result in bedrock_util.iter_batch(("summary",)):
+        if first is None:
+            first = time.perf_counter() - started
+        count += 1
+    print(f"batch: {count}/{FILE_COUNT} files, {time.perf_counter() - started:.2f}s, first result {first:.3f}s, "
+          f"s3 calls {s3.calls}, throttled {runtime.throttled}, limiter {bedrock_util.claude_limiter.stats()}")
+
+    # 같은 목록을 다른 작업이 재사용
+    list_calls = s3.calls["list"]
+    started = time.perf_counter()
+    todos = bedrock_util.generate_all_todos()
+    print(f"todos after summary: {len(todos)} files, {time.perf_counter() - started:.2f}s, "
+          f"extra list calls {s3.calls['list'] - list_calls}")
+
+    # 매니페스트: 첫 실행 후 10개 파일만 바꾸고 새 프로세스처럼 다시 실행
+    os.environ["BATCH_MANIFEST_BACKEND"] = "local"
+    s3 = FakeS3(FILE_COUNT)
+    for label in ("manifest cold", "manifest warm (10 changed)"):
+        bedrock_util, s3, runtime = make_util(s3)
+        before = dict(s3.calls)
+        started = time.perf_counter()
+        results = list(bedrock_util.iter_batch())
+        cached = sum(1 for result in results if len(result["cached"]) == 3)
+        print(f"{label}: {len(results)} files, {time.perf_counter() - started:.2f}s, "
+              f"fully cached {cached}, get_object {s3.calls['get'] - before['get']}")
+        for key in s3.keys[:10]:
+            s3.etags[key] = '"v2"'
+
+
+if __name__ == "__main__":
+    main()
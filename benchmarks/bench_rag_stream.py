@@ -0,0 +1,93 @@
+import os
+import sys
+import json
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+# 캐시가 결과를 바꾸지 않도록 끄고 측정
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.utils.bedrock_util import BedrockUtil
+
+TOKEN_DELAY_SECONDS = 0.02
+CHARS_PER_TOKEN = 4
+
+
+def fake_response(item_count: int) -> str:
+    items = [
+        {"text": f"배포 일정 공유 {i}", "start": None, "end": f"2025-01-{20 + i % 9:02d}"}
+        for i in range(item_count)
+    ]
+    return json.dumps(items, ensure_ascii=False, indent=2)
+
+
+class FakeBedrockRuntime:
+    """토큰마다 일정 시간이 걸리는 로컬 가짜 Bedrock 런타임"""
+
+    def __init__(self, text: str, token_delay: float = TOKEN_DELAY_SECONDS):
+        self.tokens = [text[i:i + CHARS_PER_TOKEN] for i in range(0, len(text), CHARS_PER_TOKEN)]
+        self.text = text
+        self.token_delay = token_delay
+
+    def invoke_model(self, **kwargs):
+        time.sleep(self.token_delay * len(self.tokens))
+        body = json.dumps({"content": [{"type": "text", "text": self.text}]}).encode("utf-8")
+
+        class Body:
+            def read(self):
+                return body
+        return {"body": Body()}
+
+    def invoke_model_with_response_stream(self, **kwargs):
+        def events():
+            yield {"chunk": {"bytes": json.dumps({"type": "message_start"}).encode("utf-8")}}
+            for token in self.tokens:
+                time.sleep(self.token_delay)
+                payload = {"type": "content_block_delta", "delta": {"type": "text_delta", "text": token}}
+                yield {"chunk": {"bytes": json.dumps(payload, ensure_ascii=False).encode("utf-8")}}
+            yield {"chunk": {"bytes": json.dumps({"type": "message_stop"}).encode("utf-8")}}
+        return {"body": events()}
+
+
+def measure(item_count: int) -> dict:
+    bedrock_util = BedrockUtil(runtime_client=FakeBedrockRuntime(fake_response(item_count)), s3_client=object())
+
+    started = time.perf_counter()
+    blocking = bedrock_util.extract_todos("회의 내용")
+    blocking_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    first_token = first_item = None
+    streamed = None
+    for event, data in bedrock_util.stream_task("todos", "회의 내용"):
+        elapsed = time.perf_counter() - started
+        if event == "token" and first_token is None:
+            first_token = elapsed
+        elif event == "item" and first_item is None:
+            first_item = elapsed
+        elif event == "result":
+            streamed = data
+    total = time.perf_counter() - started
+
+    return {
+        "items": item_count,
+        "blocking_seconds": round(blocking_seconds, 3),
+        "stream_first_token_seconds": round(first_token, 3),
+        "stream_first_item_seconds": round(first_item, 3),
+        "stream_total_seconds": round(total, 3),
+        "match": streamed == blocking
+    }
+
+
+def main():
+    # 사용법: python benchmarks/bench_rag_stream.py
+    for item_count in (1, 5, 20):
+        print(measure(item_count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import sys
+import copy
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.speaker_util import assign_word_speakers
+
+WORD_COUNTS = [10_000, 100_000, 1_000_000]
+WORDS_PER_SEGMENT = 12
+WORDS_PER_TURN = 20
+# 기존 방식은 단어마다 전체 화자 구간을 훑으므로 작은 크기에서만 비교
+REFERENCE_MAX_WORDS = 10_000
+
+
+def reference_assign_word_speakers(diarize_df: pd.DataFrame, transcript_result: dict) -> dict:
+    """whisperx 3.3.1 assign_word_speakers 와 같은 방식 (fill_nearest=False)"""
+    for seg in transcript_result["segments"]:
+        targets = [seg] + [word for word in seg.get("words", []) if "start" in word]
+        for target in targets:
+            intersection = np.minimum(diarize_df["end"], target["end"]) - np.maximum(diarize_df["start"], target["start"])
+            hits = diarize_df.assign(intersection=intersection)[intersection > 0]
+            if len(hits) > 0:
+                target["speaker"] = hits.groupby("speaker")["intersection"].sum().sort_values(ascending=False).index[0]
+    return transcript_result
+
+
+def make_meeting(word_count: int, speakers: int = 6, seed: int = 0):
+    """단어 word_count 개 분량의 합성 회의 (화자 구간은 조금씩 겹침)"""
+    rng = np.random.default_rng(seed)
+    word_starts = np.cumsum(rng.uniform(0.2, 0.6, word_count))
+    word_ends = word_starts + rng.uniform(0.1, 0.4, word_count)
+
+    segments = []
+    for i in range(0, word_count, WORDS_PER_SEGMENT):
+        words = [
+            {"word": "w", "start": round(float(s), 3), "end": round(float(e), 3)}
+            for s, e in zip(word_starts[i:i + WORDS_PER_SEGMENT], word_ends[i:i + WORDS_PER_SEGMENT])
+        ]
+        segments.append({"start": words[0]["start"], "end": words[-1]["end"], "text": "", "words": words})
+
+    turn_count = max(1, word_count // WORDS_PER_TURN)
+    turn_starts = np.sort(rng.uniform(0, word_ends[-1], turn_count))
+    turn_ends = turn_starts + rng.uniform(1.0, 12.0, turn_count)
+    diarize_df = pd.DataFrame({
+        "start": turn_starts,
+        "end": turn_ends,
+        "speaker": [f"SPEAKER_{k:02d}" for k in rng.integers(0, speakers, turn_count)]
+    })
+    return {"segments": segments}, diarize_df
+
+
+def speakers_of(result: dict):
+    return [
+        (seg.get("speaker"), [word.get("speaker") for word in seg.get("words", [])])
+        for seg in result["segments"]
+    ]
+
+
+def compare_on_audio(audio_paths):
+    """실제 오디오에서 whisperx.assign_word_speakers 와 결과 비교"""
+    import whisperx
+    from app.utils.whisper_util import WhisperUtil
+
+    whisper_util = WhisperUtil()
+    for path in audio_paths:
+        whisper_result, diarize_segments, _ = whisper_util.transcribe_and_diarize(path)
+        started = time.perf_counter()
+        reference = whisperx.assign_word_speakers(diarize_segments, copy.deepcopy(whisper_result))
+        reference_time = time.perf_counter() - started
+        started = time.perf_counter()
+        vectorized = assign_word_speakers(diarize_segments, copy.deepcopy(whisper_result))
+        vectorized_time = time.perf_counter() - started
+        matches = speakers_of(vectorized) == speakers_of(reference)
+        print(f"{path}: vectorized {vectorized_time:.3f}s, whisperx {reference_time:.3f}s, match={matches}")
+
+
+def main():
+    # 사용법: python benchmarks/bench_speaker_assignment.py [오디오 파일 ...]
+    if len(sys.argv) > 1:
+        compare_on_audio(sys.argv[1:])
+        return
+
+    for word_count in WORD_COUNTS:
+        transcript, diarize_df = make_meeting(word_count)
+
+        vectorized_input = copy.deepcopy(transcript)
+        started = time.perf_counter()
+        vectorized = assign_word_speakers(diarize_df, vectorized_input)
+        vectorized_time = time.perf_counter() - started
+
+        line = f"{word_count:>9} words / {len(diarize_df):>6} turns: vectorized {vectorized_time:.3f}s"
+        if word_count <= REFERENCE_MAX_WORDS:
+            started = time.perf_counter()
+            reference = reference_assign_word_speakers(diarize_df, copy.deepcopy(transcript))
+            reference_time = time.perf_counter() - started
+            matches = speakers_of(vectorized) == speakers_of(reference)
+            line += f", reference {reference_time:.3f}s, match={matches}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
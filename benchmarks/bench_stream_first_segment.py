@@ -0,0 +1,48 @@
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.audio_utils import decode_audio
+from app.utils.whisper_util import WhisperUtil
+
+AUDIO_FILES = ["moat1.mp3", "aod.mp3"]
+
+
+def bench_file(whisper_util: WhisperUtil, path: str) -> None:
+    waveform = decode_audio(path)
+    duration = len(waveform) / 16000
+
+    # 기존: 전체 파이프라인이 끝나야 첫 세그먼트를 받음
+    started = time.perf_counter()
+    whisper_result, diarize_segments, _ = whisper_util.transcribe_and_diarize(waveform)
+    whisper_util.integrate_segments(whisper_result, diarize_segments)
+    full_time = time.perf_counter() - started
+
+    # 스트리밍: 첫 구간 전사가 끝나면 바로 첫 세그먼트를 받음
+    summary = {}
+    for event, data in whisper_util.transcribe_stream(waveform):
+        if event == "done":
+            summary = data
+
+    print(f"{Path(path).name}: 길이 {duration:.1f}s")
+    print(f"  전체 처리 후 첫 세그먼트: {full_time:.2f}s")
+    print(f"  스트리밍 첫 세그먼트 (time-to-first-segment): {summary.get('time_to_first_segment')}s")
+    print(f"  스트리밍 전체 (화자 라벨 포함): {summary.get('total')}s")
+
+
+def main():
+    whisper_util = WhisperUtil()
+    for name in AUDIO_FILES:
+        path = str(Path(project_root) / name)
+        if not Path(path).exists():
+            print(f"❌ 파일 없음: {path}")
+            continue
+        bench_file(whisper_util, path)
+
+
+if __name__ == "__main__":
+    main()
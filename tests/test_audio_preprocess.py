@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.audio_utils import SAMPLE_RATE, preprocess_audio
+
+
+def tone(seconds: float, amplitude: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def make_waveform() -> np.ndarray:
+    # 음성 2초 + 무음 3초 + 음성이 아닌 큰 소리 3초 + 음성 2초
+    return np.concatenate([tone(2, 0.1), np.zeros(3 * SAMPLE_RATE, np.float32), tone(3, 0.1), tone(2, 0.1)])
+
+
+def test_energy_only_removes_silence():
+    processed, offset_map, report = preprocess_audio(make_waveform())
+
+    assert report["vad"] is False
+    assert 2.0 < report["removed_seconds"] < 3.0
+    # 무음 뒤의 첫 시각은 원본 기준으로 복원
+    assert abs(float(offset_map.to_original(2.5)) - (2.5 + report["removed_seconds"])) < 0.05
+
+
+def test_vad_removes_loud_non_speech():
+    def speech_intervals(waveform):
+        return [(0.0, 2.0), (8.0, 10.0)]
+
+    processed, offset_map, report = preprocess_audio(make_waveform(), speech_intervals=speech_intervals)
+
+    assert report["vad"] is True
+    # 무음과 VAD 가 음성이 아니라고 본 구간(앞뒤 여유 제외)까지 제거
+    assert report["removed_seconds"] > 5.0
+    assert abs(float(offset_map.to_original(len(processed) / SAMPLE_RATE - 1.0)) - 9.0) < 0.05
+
+
+def test_vad_failure_falls_back_to_energy():
+    def broken(waveform):
+        raise RuntimeError("vad unavailable")
+
+    _, _, report = preprocess_audio(make_waveform(), speech_intervals=broken)
+    assert report["vad"] is False
+    assert 2.0 < report["removed_seconds"] < 3.0
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.batch_manifest_util import BatchManifest, MISSING
+
+
+def make_manifest(tmp_path) -> BatchManifest:
+    return BatchManifest(backend="local", path=str(tmp_path / "batch_manifest.json"))
+
+
+def test_result_reused_until_etag_changes(tmp_path):
+    manifest = make_manifest(tmp_path)
+    manifest.put("meetings/a.json", "etag-1", "summary", "v1", {"subject": "배포"})
+    manifest.put("meetings/a.json", "etag-1", "todos", "v1", {"items": []})
+
+    assert manifest.get("meetings/a.json", "etag-1", "summary", "v1") == {"subject": "배포"}
+    # 파일이 바뀌면(ETag 변경) 결과 없음
+    assert manifest.get("meetings/a.json", "etag-2", "summary", "v1") is MISSING
+
+    # 새 ETag 로 저장하면 이전 ETag 의 다른 작업 결과도 버림
+    manifest.put("meetings/a.json", "etag-2", "summary", "v1", {"subject": "수정본"})
+    assert manifest.get("meetings/a.json", "etag-2", "todos", "v1") is MISSING
+    assert manifest.get("meetings/a.json", "etag-2", "summary", "v1") == {"subject": "수정본"}
+
+
+def test_result_invalidated_by_template_version(tmp_path):
+    manifest = make_manifest(tmp_path)
+    manifest.put("meetings/a.json", "etag-1", "summary", "v1", {"subject": "배포"})
+
+    # 프롬프트가 바뀌면(템플릿 버전 변경) 다시 처리
+    assert manifest.get("meetings/a.json", "etag-1", "summary", "v2") is MISSING
+    assert manifest.get("meetings/a.json", "etag-1", "todos", "v1") is MISSING
+
+
+def test_saved_manifest_reloaded_and_pruned(tmp_path):
+    manifest = make_manifest(tmp_path)
+    for key in ("meetings/a.json", "meetings/b.json"):
+        manifest.put(key, "etag-1", "summary", "v1", {"key": key})
+    manifest.save()
+
+    reloaded = make_manifest(tmp_path)
+    assert reloaded.get("meetings/b.json", "etag-1", "summary", "v1") == {"key": "meetings/b.json"}
+
+    # 목록에서 사라진 키의 결과 삭제
+    reloaded.retain(["meetings/a.json"])
+    reloaded.save()
+    assert reloaded.stats()["entries"] == 1
+
+    pruned = make_manifest(tmp_path)
+    assert pruned.get("meetings/b.json", "etag-1", "summary", "v1") is MISSING
+    assert pruned.get("meetings/a.json", "etag-1", "summary", "v1") == {"key": "meetings/a.json"}
+
+
+def test_returned_value_is_a_copy(tmp_path):
+    manifest = make_manifest(tmp_path)
+    manifest.put("meetings/a.json", "etag-1", "todos", "v1", {"items": []})
+
+    manifest.get("meetings/a.json", "etag-1", "todos", "v1")["items"].append("변경")
+    assert manifest.get("meetings/a.json", "etag-1", "todos", "v1") == {"items": []}
+
+
+def test_invalidate_task(tmp_path):
+    manifest = make_manifest(tmp_path)
+    manifest.put("meetings/a.json", "etag-1", "summary", "v1", {})
+    manifest.put("meetings/a.json", "etag-1", "todos", "v1", {})
+    manifest.put("meetings/b.json", "etag-1", "todos", "v1", {})
+
+    assert manifest.invalidate(task="todos") == 2
+    assert manifest.stats() == {"backend": "local", "entries": 1, "results": 1}
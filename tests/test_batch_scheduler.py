@@ -0,0 +1,93 @@
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("whisperx")
+
+from app.utils.batch_scheduler_util import WhisperBatchScheduler
+
+SAMPLE_RATE = 16000
+
+
+class FakeWhisperModel:
+    """배치마다 받은 구간 수를 기록하고, 특징 값으로 텍스트를 만드는 가짜 모델"""
+
+    def __init__(self):
+        self.hf_tokenizer = object()
+        self.model = type("CT2Model", (), {"is_multilingual": True})()
+        self.batch_sizes = []
+
+    def generate_segment_batched(self, features, tokenizer, options):
+        self.batch_sizes.append(len(features))
+        return [f"seg-{int(feature[0])}" for feature in features]
+
+
+class FakePipeline:
+    def __init__(self):
+        self.model = FakeWhisperModel()
+        self.vad_model = None
+        self._vad_params = {"vad_onset": 0.5, "vad_offset": 0.363}
+        self.options = None
+
+    def preprocess(self, inputs):
+        # 구간의 첫 샘플 값을 특징으로 사용 (요청/구간 식별용)
+        return {"inputs": torch.tensor([float(inputs["inputs"][0])])}
+
+
+def make_scheduler(pipeline, batch_size=4):
+    @contextmanager
+    def acquire():
+        yield pipeline
+
+    scheduler = WhisperBatchScheduler(acquire, batch_size=batch_size, max_wait_ms=2000)
+    # VAD 와 토크나이저는 실제 모델 없이 고정값으로 대체 (1초 구간 두 개)
+    scheduler._vad_segments = lambda pipeline, audio: [
+        {"start": 0.0, "end": 1.0}, {"start": 1.0, "end": 2.0}]
+    scheduler._tokenizer = lambda pipeline, language: None
+    return scheduler
+
+
+def two_second_audio(first: float, second: float) -> np.ndarray:
+    return np.concatenate([np.full(SAMPLE_RATE, first), np.full(SAMPLE_RATE, second)]).astype(np.float32)
+
+
+def test_segments_from_two_requests_share_one_batch():
+    pipeline = FakePipeline()
+    scheduler = make_scheduler(pipeline)
+    results = {}
+
+    def run(name, audio):
+        results[name] = scheduler.transcribe(audio, "ko")
+
+    threads = [
+        threading.Thread(target=run, args=("a", two_second_audio(1, 2))),
+        threading.Thread(target=run, args=("b", two_second_audio(3, 4)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # 두 요청의 구간 4개가 한 번에 디코딩되고, 결과는 각자 요청으로 돌아감
+    assert pipeline.model.batch_sizes == [4]
+    assert [seg["text"] for seg in results["a"]["segments"]] == ["seg-1", "seg-2"]
+    assert [seg["text"] for seg in results["b"]["segments"]] == ["seg-3", "seg-4"]
+    assert results["a"]["segments"][1]["start"] == 1.0
+    assert scheduler.stats()["avg_batch_size"] == 4.0
+
+
+def test_unsupported_pipeline_fails_fast():
+    pipeline = FakePipeline()
+    del pipeline._vad_params
+
+    with pytest.raises(RuntimeError, match="_vad_params"):
+        make_scheduler(pipeline)
@@ -0,0 +1,114 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.batch_util import AdaptiveLimiter, map_bounded
+
+
+class ThrottlingError(Exception):
+    """botocore ClientError 형식의 속도 제한 오류"""
+
+    def __init__(self):
+        super().__init__("ThrottlingException")
+        self.response = {"Error": {"Code": "ThrottlingException"}}
+
+
+def test_limiter_halves_on_throttle_and_recovers():
+    limiter = AdaptiveLimiter(max_limit=8)
+
+    for expected in (4, 2, 1, 1):
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.limit == expected
+    assert limiter.stats()["throttled"] == 4
+
+    # 현재 허용치만큼 연속 성공하면 하나씩 늘림 (1 -> 2 에 1번, 2 -> 3 에 2번 ...)
+    for expected in (2, 3, 4):
+        for _ in range(expected - 1):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.limit == expected
+
+    # 성공 도중 속도 제한이 나면 연속 성공 횟수도 초기화
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+    limiter.acquire()
+    limiter.release()
+    assert limiter.limit == 2
+
+
+def test_limiter_call_retries_throttling_only():
+    limiter = AdaptiveLimiter(max_limit=4)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ThrottlingError()
+        return "ok"
+
+    assert limiter.call(flaky, base_delay=0) == "ok"
+    assert len(attempts) == 3
+    # 4 -> 2 -> 1 로 줄었다가 성공 한 번에 2 로 회복
+    assert limiter.limit == 2
+    assert limiter.stats()["in_flight"] == 0
+
+    def fail():
+        attempts.append(1)
+        raise ValueError("다른 오류")
+
+    # 속도 제한이 아닌 오류는 재시도하지 않음
+    with pytest.raises(ValueError):
+        limiter.call(fail, base_delay=0)
+    assert len(attempts) == 4
+    assert limiter.stats()["throttled"] == 2
+
+
+def test_map_bounded_reads_ahead_at_most_twice_workers_and_yields_in_completion_order():
+    max_workers = 2
+    pulled = []
+    gates = {index: threading.Event() for index in range(8)}
+
+    def items():
+        for index in range(8):
+            pulled.append(index)
+            yield index
+
+    def work(index):
+        gates[index].wait(timeout=10)
+        return index
+
+    results = []
+    consumer = threading.Thread(target=lambda: results.extend(map_bounded(work, items(), max_workers)))
+    consumer.start()
+
+    def wait_for(condition):
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert condition()
+
+    # 처리 중인 작업이 없어도 목록은 작업 수의 두 배까지만 읽음
+    time.sleep(0.1)
+    assert len(pulled) == max_workers * 2
+
+    # 나중에 시작한 작업이 먼저 끝나면 그 결과가 먼저 나옴
+    gates[1].set()
+    wait_for(lambda: results == [1])
+    wait_for(lambda: len(pulled) == max_workers * 2 + 1)
+
+    for index in (0, 3, 2, 4, 5, 6, 7):
+        gates[index].set()
+        wait_for(lambda: index in results)
+        assert len(pulled) - len(results) <= max_workers * 2
+    consumer.join(timeout=5)
+
+    assert results == [1, 0, 3, 2, 4, 5, 6, 7]
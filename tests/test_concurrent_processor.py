@@ -0,0 +1,136 @@
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.services.api_service import ConcurrentProcessor
+from app.utils.date_util import DateUtil
+from app.utils.langchain_util import LangChainUtil
+from app.utils.llm_cache_util import LLMResponseCache
+
+SEGMENTS = {"segments": [
+    {"speaker": "SPEAKER_00", "text": "다음 주까지 배포 문서를 정리하겠습니다.", "start": 0.0, "end": 3.0},
+    {"speaker": "SPEAKER_01", "text": "금요일에 회의실에서 리뷰합시다.", "start": 3.0, "end": 6.0}
+]}
+
+VALID_EXTRACTION = {
+    "summary": {"subject": "배포", "summary": "배포 문서 정리"},
+    "todos": {"items": [{"text": "배포 문서 정리", "start": None, "end": None}]},
+    "schedule": {"items": [{"text": "리뷰", "start": None, "end": None, "place": "회의실"}]}
+}
+
+FANOUT_RESPONSES = {
+    "summarize": json.dumps({"subject": "개별 요약", "summary": "개별 호출 결과"}, ensure_ascii=False),
+    "todos": json.dumps({"items": [{"text": "개별 할 일", "start": None, "end": None}]}, ensure_ascii=False),
+    "schedule": json.dumps({"items": []})
+}
+
+
+class StubChain:
+    """작업별로 정해 둔 응답을 돌려주는 체인 (delay 초 뒤 응답)"""
+
+    def __init__(self, response, delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+        self.calls = 0
+
+    async def ainvoke(self, variables):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.response
+
+
+@pytest.fixture
+def make_processor(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("LLM_MAP_REDUCE", "false")
+
+    def make(mode: str, chains):
+        langchain_util = LangChainUtil(llm_cache=LLMResponseCache(db_path=str(tmp_path / "llm_cache.sqlite3")))
+        # 토큰 수는 공백 기준으로 계산 (tiktoken 인코딩 다운로드 없이)
+        monkeypatch.setattr(langchain_util, "count_tokens", lambda text, task=None: len(text.split()))
+        monkeypatch.setattr(langchain_util, "create_chain", lambda template, task=None, schema=None: chains[task])
+        return ConcurrentProcessor(langchain_util, DateUtil(), mode=mode)
+    return make
+
+
+def fanout_chains(**overrides):
+    chains = {name: StubChain(response) for name, response in FANOUT_RESPONSES.items()}
+    chains.update(overrides)
+    return chains
+
+
+def test_combined_uses_single_structured_call(make_processor):
+    chains = fanout_chains(extract=StubChain(VALID_EXTRACTION))
+    processor = make_processor("combined", chains)
+
+    results = processor.process_all(SEGMENTS, "2025-01-01")
+
+    assert results["summarize"] == VALID_EXTRACTION["summary"]
+    assert results["todos"]["items"][0]["text"] == "배포 문서 정리"
+    assert results["schedule"]["items"][0]["place"] == "회의실"
+    assert chains["extract"].calls == 1
+    assert chains["summarize"].calls == chains["todos"].calls == chains["schedule"].calls == 0
+
+
+def test_combined_schema_violation_falls_back_to_fanout(make_processor):
+    invalid = {"summary": {"subject": "배포", "summary": "요약"}, "todos": {"items": []}}
+    chains = fanout_chains(extract=StubChain(invalid))
+    processor = make_processor("combined", chains)
+
+    results = processor.process_all(SEGMENTS, "2025-01-01")
+
+    assert chains["extract"].calls == 1
+    assert results["summarize"]["subject"] == "개별 요약"
+    assert results["todos"]["items"][0]["text"] == "개별 할 일"
+    assert results["schedule"] == {"items": []}
+
+
+def test_task_timeout_returns_default_result(make_processor, monkeypatch):
+    monkeypatch.setenv("LLM_TIMEOUT_TODOS", "0.05")
+    chains = fanout_chains(todos=StubChain(FANOUT_RESPONSES["todos"], delay=1.0))
+    processor = make_processor("fanout", chains)
+    reported = []
+
+    results = processor.process_all(SEGMENTS, "2025-01-01", on_result=lambda name, value: reported.append(name))
+
+    assert results["todos"] == processor._default_result("todos")
+    assert results["summarize"]["subject"] == "개별 요약"
+    assert sorted(reported) == ["schedule", "summarize", "todos"]
+
+
+class FailingChain:
+    """항상 실패하는 체인"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, variables):
+        self.calls += 1
+        raise RuntimeError("LLM 호출 실패")
+
+
+def test_map_reduce_all_windows_failed_returns_default(make_processor, monkeypatch):
+    monkeypatch.setenv("LLM_MAP_REDUCE", "true")
+    reduced = json.dumps({"subject": "합친 요약", "summary": "구간 요약을 합침"}, ensure_ascii=False)
+    chains = fanout_chains(todos=FailingChain(), reduce=StubChain(reduced))
+    processor = make_processor("fanout", chains)
+    monkeypatch.setattr(processor.langchain_util, "split_transcript",
+                        lambda transcript, max_tokens=None, task=None: [["A: 첫 구간"], ["B: 둘째 구간"]])
+
+    results = processor.process_all(SEGMENTS, "2025-01-01")
+
+    # 구간마다 한 번씩 호출했지만 모두 실패 -> 기본 결과
+    assert chains["todos"].calls == 2
+    assert results["todos"] == processor._default_result("todos")
+    # 일정은 구간별 결과를 합치고, 요약은 구간별 요약을 reduce 로 압축
+    assert chains["schedule"].calls == 2
+    assert results["schedule"] == {"items": []}
+    assert chains["reduce"].calls == 1
+    assert results["summarize"]["subject"] == "합친 요약"
@@ -0,0 +1,92 @@
+import sys
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.json_stream_util import IncrementalJSONParser, parse_llm_json
+
+DOCUMENT = {
+    "items": [
+        {"text": "\"배포\" 문서 정리 {초안}", "start": None, "end": "2025-01-10T00:00:00"},
+        {"text": "리뷰 [회의실] \\ 예약", "start": "2025-01-03T10:00:00", "end": None, "tags": [{"name": "}]"}]},
+        {"text": "줄바꿈\n과 탭\t", "start": None, "end": None}
+    ],
+    "note": "끝 \"}\" ]"
+}
+RAW = json.dumps(DOCUMENT, ensure_ascii=False, indent=2)
+
+
+def expected_items(value):
+    """배열의 원소인 객체 중 다른 항목 안에 들어 있지 않은 것 (파서가 꺼내는 단위)"""
+    items = []
+    if isinstance(value, dict):
+        for child in value.values():
+            items.extend(expected_items(child))
+    elif isinstance(value, list):
+        for child in value:
+            if isinstance(child, dict):
+                items.append(child)
+            else:
+                items.extend(expected_items(child))
+    return items
+
+
+def stream(chunks):
+    parser = IncrementalJSONParser()
+    emitted = []
+    for chunk in chunks:
+        emitted.extend(parser.feed(chunk))
+    return parser, emitted
+
+
+def test_feed_one_character_at_a_time():
+    parser, emitted = stream(RAW)
+
+    assert parser.complete
+    assert emitted == expected_items(json.loads(RAW))
+    assert parser.result() == json.loads(RAW)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_feed_random_chunk_splits(seed):
+    rng = random.Random(seed)
+    cuts = sorted(rng.sample(range(1, len(RAW)), rng.randint(1, 30)))
+    chunks = [RAW[start:end] for start, end in zip([0] + cuts, cuts + [len(RAW)])]
+
+    parser, emitted = stream(chunks)
+
+    assert emitted == expected_items(json.loads(RAW))
+    assert parser.result() == json.loads(RAW)
+
+
+def test_items_emitted_as_soon_as_closed():
+    parser = IncrementalJSONParser()
+    # 첫 항목의 닫는 괄호 (문자열 안의 "}" 다음)
+    first_end = RAW.index("}", RAW.index("2025-01-10")) + 1
+
+    assert parser.feed(RAW[:first_end - 1]) == []
+    assert parser.feed(RAW[first_end - 1:first_end]) == [DOCUMENT["items"][0]]
+    assert not parser.complete
+    with pytest.raises(ValueError):
+        parser.result()
+
+
+def test_top_level_array_and_surrounding_text():
+    raw = json.dumps([{"a": "{\"}"}, {"b": [1, 2]}], ensure_ascii=False)
+    parser, emitted = stream(["```json\n", raw, "\n```\n설명"])
+
+    assert emitted == json.loads(raw)
+    assert parser.result() == json.loads(raw)
+
+
+def test_parse_llm_json():
+    assert parse_llm_json(RAW) == json.loads(RAW)
+    assert parse_llm_json(f"다음은 결과입니다.\n```json\n{RAW}\n```") == json.loads(RAW)
+    with pytest.raises(ValueError):
+        parse_llm_json("JSON 이 없는 응답")
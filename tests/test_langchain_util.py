@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.langchain_util import LangChainUtil, PromptBudgetError, merge_extracted_items
+from app.utils.llm_cache_util import LLMResponseCache
+
+
+@pytest.fixture
+def langchain_util(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    util = LangChainUtil(llm_cache=LLMResponseCache(db_path=str(tmp_path / "llm_cache.sqlite3")))
+    # 토큰 수는 공백 기준으로 계산 (tiktoken 인코딩 다운로드 없이)
+    monkeypatch.setattr(util, "count_tokens", lambda text, task=None: len(text.split()))
+    return util
+
+
+def segment(speaker: str, text: str, index: int) -> dict:
+    return {"speaker": speaker, "text": text, "start": float(index), "end": float(index + 1)}
+
+
+def test_split_transcript_cuts_at_turn_boundaries(langchain_util):
+    transcript = {"segments": [
+        segment("SPEAKER_00", "배포 일정 공유", 0),
+        segment("SPEAKER_00", "문서 정리", 1),
+        segment("SPEAKER_01", "금요일 리뷰", 2),
+        segment("SPEAKER_00", "좋습니다", 3)
+    ]}
+
+    # 줄마다 토큰 수 + 1 (A 턴 7, B 턴 4, A 턴 3)
+    windows = langchain_util.split_transcript(transcript, max_tokens=11)
+    assert windows == [["A: 배포 일정 공유 문서 정리", "B: 금요일 리뷰"], ["A: 좋습니다"]]
+
+    # 예산 안이면 구간 하나
+    assert len(langchain_util.split_transcript(transcript, max_tokens=100)) == 1
+
+
+def test_split_transcript_splits_long_turn_at_segments(langchain_util):
+    transcript = {"segments": [
+        segment("SPEAKER_00", "하나 둘 셋", 0),
+        segment("SPEAKER_00", "넷 다섯 여섯", 1),
+        segment("SPEAKER_01", "네", 2)
+    ]}
+
+    # A 턴(8 토큰)이 예산 6 을 넘으므로 세그먼트(5 토큰씩) 경계에서 자름
+    windows = langchain_util.split_transcript(transcript, max_tokens=6)
+    assert windows == [["A: 하나 둘 셋"], ["A: 넷 다섯 여섯"], ["B: 네"]]
+
+
+def test_prompt_over_budget_raises_before_llm_call(langchain_util, monkeypatch):
+    monkeypatch.setenv("LLM_PROMPT_MAX_TOKENS", "50")
+    transcript = {"segments": [segment("SPEAKER_00", "단어 " * 100, 0)]}
+
+    with pytest.raises(PromptBudgetError):
+        langchain_util._task_request("todos", transcript, "2025-01-01")
+
+    short = {"segments": [segment("SPEAKER_00", "짧은 회의", 0)]}
+    monkeypatch.setenv("LLM_PROMPT_MAX_TOKENS", "100000")
+    assert langchain_util._task_request("todos", short, "2025-01-01")["task"] == "todos"
+
+
+def test_merge_extracted_items_dedupes_similar_text():
+    merged = merge_extracted_items([
+        [{"text": "배포 문서 정리하기", "start": None, "end": "2025-01-10T00:00:00"}],
+        # 공백/문장부호만 다른 같은 항목 -> 빠진 start 만 채움
+        [{"text": "배포 문서, 정리하기!", "start": "2025-01-03T00:00:00", "end": None}],
+        # 유사도 0.85 이상 (한 글자 차이)
+        [{"text": "배포 문서를 정리하기", "start": None, "end": None, "place": "회의실"}]
+    ])
+
+    assert merged == [{
+        "text": "배포 문서 정리하기",
+        "start": "2025-01-03T00:00:00",
+        "end": "2025-01-10T00:00:00",
+        "place": "회의실"
+    }]
+
+
+def test_merge_extracted_items_keeps_distinct_and_conflicting_items():
+    merged = merge_extracted_items([
+        [{"text": "주간 회의", "start": "2025-01-06T10:00:00", "end": None}],
+        # 텍스트는 같지만 시작 날짜가 다르면 다른 일정
+        [{"text": "주간 회의", "start": "2025-01-13T10:00:00", "end": None}],
+        # 유사도가 낮은 항목
+        [{"text": "예산안 검토", "start": None, "end": None}, "항목이 아닌 값"],
+        None
+    ])
+
+    assert [(item["text"], item["start"]) for item in merged] == [
+        ("주간 회의", "2025-01-06T10:00:00"),
+        ("주간 회의", "2025-01-13T10:00:00"),
+        ("예산안 검토", None)
+    ]
@@ -0,0 +1,103 @@
+import sys
+import json
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.langchain_util import LangChainUtil
+from app.utils.llm_cache_util import LLMResponseCache, MISS
+
+
+def make_cache(tmp_path, **kwargs) -> LLMResponseCache:
+    return LLMResponseCache(db_path=str(tmp_path / "llm_cache.sqlite3"), **kwargs)
+
+
+def key(name: str) -> str:
+    return LLMResponseCache.make_key("gpt-4o", "v1", name, 0)
+
+
+def test_key_ignores_whitespace_and_tracks_model_settings():
+    assert LLMResponseCache.make_key("gpt-4o", "v1", "회의  요약\n", 0) == LLMResponseCache.make_key("gpt-4o", "v1", "회의 요약", 0)
+    assert LLMResponseCache.make_key("gpt-4o", "v1", "회의 요약", 0) != LLMResponseCache.make_key("gpt-4o", "v2", "회의 요약", 0)
+    assert LLMResponseCache.make_key("gpt-4o", "v1", "회의 요약", 0) != LLMResponseCache.make_key("gpt-4o", "v1", "회의 요약", 0.7)
+
+
+def test_entries_persist_and_expire(tmp_path):
+    cache = make_cache(tmp_path, ttl_seconds=0.2)
+    cache.put(key("a"), {"items": ["배포"]})
+
+    # 새 인스턴스(메모리 비어 있음)에서도 SQLite 에서 읽음
+    reopened = make_cache(tmp_path, ttl_seconds=0.2)
+    assert reopened.get(key("a")) == {"items": ["배포"]}
+    assert reopened.stats()["disk_hits"] == 1
+
+    time.sleep(0.3)
+    assert cache.get(key("a")) is MISS
+    assert reopened.get(key("a")) is MISS
+    assert cache.stats()["expired"] + reopened.stats()["expired"] == 1
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    value = {"text": "x" * 100}
+    entry_size = len(json.dumps(value))
+    # 메모리 캐시 없이 디스크 항목 세 개까지만 허용
+    cache = make_cache(tmp_path, memory_items=0, max_size_mb=(entry_size * 3 + 10) / 1024 / 1024)
+
+    for name in ("a", "b", "c"):
+        cache.put(key(name), value)
+        time.sleep(0.01)
+    # a 를 읽어 최근 사용으로 만든 뒤 하나 더 넣으면 b 가 삭제됨
+    assert cache.get(key("a")) == value
+    time.sleep(0.01)
+    cache.put(key("d"), value)
+
+    assert cache.get(key("b")) is MISS
+    assert all(cache.get(key(name)) == value for name in ("a", "c", "d"))
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["disk_bytes"] <= cache.max_size_bytes
+
+
+def test_nonzero_temperature_not_cached_by_default(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.cacheable(0)
+    assert not cache.cacheable(0.7)
+    assert make_cache(tmp_path, cache_nonzero_temperature=True).cacheable(0.7)
+
+
+class StubChain:
+    """차례로 정해 둔 응답을 돌려주는 체인"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def ainvoke(self, variables):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_response_cached_only_after_parse(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0")
+    langchain_util = LangChainUtil(llm_cache=make_cache(tmp_path))
+    chain = StubChain(["JSON 이 아닌 응답", '{"items": []}', '{"items": ["다른 값"]}'])
+    monkeypatch.setattr(langchain_util, "create_chain", lambda template, task=None, schema=None: chain)
+
+    def call():
+        return asyncio.run(langchain_util.ainvoke_chain(
+            "{transcript}", {"transcript": "A: 회의"}, task="todos", parse=langchain_util._parse_json))
+
+    # 변환에 실패한 응답은 캐시하지 않으므로 다음 호출에서 다시 LLM 호출
+    with pytest.raises(ValueError):
+        call()
+    assert langchain_util.llm_cache.stats()["puts"] == 0
+
+    assert call() == {"items": []}
+    assert call() == {"items": []}
+    assert chain.calls == 2
@@ -0,0 +1,131 @@
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.llm_router_util import BedrockProvider, LLMRouter, OpenAIProvider
+
+
+class FakeProvider:
+    """지정한 지연 시간 뒤 응답하거나 실패하는 가짜 공급자"""
+
+    def __init__(self, name: str, latency: float, fail: bool = False):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def complete(self, task, text, meeting_date=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} 503")
+        return json.dumps({"items": [{"text": self.name}]}, ensure_ascii=False)
+
+
+def make_router(providers, hedge=False, min_samples=3):
+    router = LLMRouter(providers, hedge=hedge)
+    router.min_samples = min_samples
+    router.hedge_default_delay = 0.05
+    router.hedge_min_delay = 0.01
+    return router
+
+
+def run(router, task="todos"):
+    return asyncio.run(router.arun(task, "회의 내용"))
+
+
+def test_failing_provider_loses_rank():
+    broken = FakeProvider("openai", latency=0.001, fail=True)
+    healthy = FakeProvider("bedrock", latency=0.001)
+    router = make_router([broken, healthy])
+
+    for _ in range(5):
+        assert run(router) == [{"text": "bedrock"}]
+
+    # 계속 실패하는 공급자는 기록이 부족해도 성공한 공급자 뒤로 밀림
+    assert router.rank("todos") == ["bedrock", "openai"]
+    assert broken.calls < 5
+    assert router.stats()["failovers"] == broken.calls
+
+
+def test_ranks_faster_provider_first():
+    slow = FakeProvider("openai", latency=0.03)
+    fast = FakeProvider("bedrock", latency=0.001)
+    router = make_router([slow, fast])
+    for name in ("openai", "bedrock"):
+        for _ in range(3):
+            router._record(name, "todos", {"openai": 0.03, "bedrock": 0.001}[name], True)
+
+    assert router.rank("todos") == ["bedrock", "openai"]
+    assert run(router) == [{"text": "bedrock"}]
+    assert slow.calls == 0
+
+
+def test_all_providers_fail():
+    router = make_router([FakeProvider("openai", 0.001, fail=True), FakeProvider("bedrock", 0.001, fail=True)])
+    with pytest.raises(RuntimeError):
+        run(router)
+    assert router.stats()["failures"] == 1
+
+
+def test_hedge_cancels_slow_primary_and_records_lower_bound():
+    slow = FakeProvider("openai", latency=1.0)
+    fast = FakeProvider("bedrock", latency=0.001)
+    router = make_router([slow, fast], hedge=True)
+
+    assert run(router) == [{"text": "bedrock"}]
+
+    stats = router.stats()
+    assert stats["hedges"] == 1
+    assert stats["hedge_wins"] == 1
+    assert slow.cancelled == 1
+    # 취소된 첫 요청도 헤지 지연 이상의 지연 시간으로 기록
+    tracker = router.trackers[("openai", "todos")]
+    assert tracker.samples == 1
+    assert tracker.attempts == 0
+    assert tracker.percentile(50) >= router.hedge_default_delay
+
+
+class FakeLangChainUtil:
+    """arun_task 호출 인자를 기록하고 검증 함수를 그대로 적용하는 가짜 LangChainUtil"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = []
+
+    async def arun_task(self, task, transcript, meeting_date=None, validate=None):
+        self.calls.append(task)
+        return validate(self.value)
+
+
+class FakeBedrockUtil:
+    def __init__(self, value):
+        self.value = value
+
+    def run_task(self, task, text, meeting_date=None, validate=None):
+        return validate(self.value)
+
+
+def test_providers_use_cached_task_methods_with_validation():
+    items = {"items": [{"text": "배포"}]}
+    langchain_util = FakeLangChainUtil(items)
+    router = make_router([OpenAIProvider(langchain_util), BedrockProvider(FakeBedrockUtil([{"text": "백업"}]))])
+
+    assert run(router) == [{"text": "배포"}]
+    assert langchain_util.calls == ["todos"]
+
+    # 라우터가 변환할 수 없는 응답은 검증에서 실패해 다음 공급자로 넘어감
+    langchain_util.value = "형식이 다른 응답"
+    assert run(router) == [{"text": "백업"}]
@@ -0,0 +1,133 @@
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.model_lifecycle_util import ModelLifecycleManager
+
+
+class FakeLoader:
+    """로드/정리 횟수를 세는 가짜 모델 로더"""
+
+    def __init__(self):
+        self.loads = 0
+        self.unloaded = []
+
+    def load(self):
+        self.loads += 1
+        return {"model": self.loads}
+
+    def unload(self, model):
+        self.unloaded.append(model)
+
+
+def make_manager(idle_seconds: float):
+    # 점검 주기를 길게 잡아 백그라운드 점검 대신 reap 을 직접 호출
+    manager = ModelLifecycleManager(idle_seconds=idle_seconds, rss_watermark_mb=0, check_interval=3600)
+    loader = FakeLoader()
+    manager.register("asr", loader.load, loader.unload)
+    return manager, loader
+
+
+def test_reap_keeps_preloaded_model_until_idle():
+    manager, loader = make_manager(idle_seconds=0.2)
+    manager.preload(["asr"])
+
+    # 미리 로드한 직후에는 유휴 시간이 지나지 않았으므로 내리지 않음
+    manager.reap()
+    assert manager.is_loaded("asr")
+
+    time.sleep(0.3)
+    manager.reap()
+    assert not manager.is_loaded("asr")
+    assert loader.unloaded == [{"model": 1}]
+    assert manager.metrics()["unloads_idle"] == 1
+
+
+def test_reap_skips_model_in_use_and_reloads():
+    manager, loader = make_manager(idle_seconds=0.1)
+
+    with manager.acquire("asr") as model:
+        assert model == {"model": 1}
+        time.sleep(0.2)
+        manager.reap()
+        assert manager.is_loaded("asr")
+
+    time.sleep(0.2)
+    manager.reap()
+    assert not manager.is_loaded("asr")
+
+    # 내려간 모델은 다음 사용 시 다시 로드
+    with manager.acquire("asr") as model:
+        assert model == {"model": 2}
+    assert loader.loads == 2
+
+
+def test_unload_all_runs_unloader_and_counts():
+    manager, loader = make_manager(idle_seconds=60)
+    manager.preload(["asr"])
+
+    manager.unload_all()
+    assert not manager.is_loaded("asr")
+    assert loader.unloaded == [{"model": 1}]
+    assert manager.metrics()["unloads_manual"] == 1
+
+
+class FakeRss:
+    """정해 둔 순서대로 RSS 값을 돌려주는 가짜 측정 함수 (마지막 값 유지)"""
+
+    def __init__(self, values):
+        self.values = list(values)
+
+    def __call__(self):
+        if len(self.values) > 1:
+            return self.values.pop(0)
+        return self.values[0]
+
+
+def make_watermark_manager(monkeypatch, rss_values, cooldown: float):
+    monkeypatch.setattr("app.utils.model_lifecycle_util.get_rss_mb", FakeRss(rss_values))
+    manager = ModelLifecycleManager(idle_seconds=0, rss_watermark_mb=1000, check_interval=3600,
+                                    rss_low_watermark_mb=800, watermark_cooldown=cooldown)
+    loaders = {name: FakeLoader() for name in ("asr", "align")}
+    for name, loader in loaders.items():
+        manager.register(name, loader.load, loader.unload)
+    manager.preload(["asr", "align"])
+    return manager, loaders
+
+
+def test_watermark_evicts_until_low_watermark(monkeypatch):
+    # 점검 시작 1100 -> 캐시 정리 후 1100 -> asr 해제 후 900 (하한 초과) -> align 해제 후 700
+    manager, loaders = make_watermark_manager(monkeypatch, [1100, 1100, 900, 700], cooldown=60)
+
+    manager.reap()
+    assert not manager.is_loaded("asr")
+    assert not manager.is_loaded("align")
+    assert manager.metrics()["unloads_watermark"] == 2
+
+
+def test_watermark_does_not_unload_on_consecutive_ticks(monkeypatch):
+    # 해제 후에도 RSS 가 워터마크 위에 머무는 상황 (할당자가 메모리를 바로 돌려주지 않음)
+    manager, loaders = make_watermark_manager(monkeypatch, [1100, 1100, 700, 1100], cooldown=0.2)
+
+    manager.reap()
+    assert not manager.is_loaded("asr")
+    assert manager.is_loaded("align")
+
+    # 요청이 asr 을 다시 올린 직후의 다음 점검에서는 아무것도 내리지 않음
+    with manager.acquire("asr"):
+        pass
+    manager.reap()
+    assert manager.is_loaded("asr")
+    assert manager.is_loaded("align")
+    assert manager.metrics()["unloads_watermark"] == 1
+    assert manager.metrics()["watermark_skips"] == 1
+
+    # 쿨다운이 지나면 다시 워터마크 기준으로 해제
+    time.sleep(0.3)
+    manager.reap()
+    assert manager.metrics()["unloads_watermark"] > 1
+    assert loaders["asr"].loads == 2
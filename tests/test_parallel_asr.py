@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils import parallel_asr_util
+from app.utils.parallel_asr_util import ParallelTranscriber
+
+
+def test_default_threads_leave_only_diarize_budget(monkeypatch):
+    for name in ("LONG_AUDIO_WORKERS", "LONG_AUDIO_THREADS_PER_WORKER", "ASR_CPU_THREADS", "DIARIZE_TORCH_THREADS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(parallel_asr_util.os, "cpu_count", lambda: 16)
+
+    # WhisperUtil 기본값: 전사 16 // 2, 화자 분리 16 - 8 (워커가 전사를 대신하므로 화자 분리만 예약)
+    diarize_threads = 16 - 16 // 2
+    transcriber = ParallelTranscriber("base", "float32", reserved_threads=diarize_threads)
+
+    assert transcriber.num_workers == 4
+    assert transcriber.threads_per_worker == 2
+    assert transcriber.num_workers * transcriber.threads_per_worker + diarize_threads <= 16
+
+
+def test_threads_per_worker_is_at_least_one(monkeypatch):
+    monkeypatch.delenv("LONG_AUDIO_THREADS_PER_WORKER", raising=False)
+    monkeypatch.setattr(parallel_asr_util.os, "cpu_count", lambda: 2)
+
+    transcriber = ParallelTranscriber("base", "float32", num_workers=2, reserved_threads=2)
+    assert transcriber.threads_per_worker == 1
@@ -0,0 +1,119 @@
+import sys
+import copy
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.speaker_util import assign_word_speakers
+
+DIARIZE = pd.DataFrame({
+    "start": [0.0, 4.0, 12.0, 20.0],
+    "end": [5.0, 10.0, 15.0, 22.0],
+    "speaker": ["SPEAKER_A", "SPEAKER_B", "SPEAKER_A", "SPEAKER_C"]
+})
+
+
+def make_transcript():
+    return {"segments": [
+        {"start": 0.0, "end": 6.0, "text": "안녕하세요 반갑습니다 %", "words": [
+            {"word": "안녕하세요", "start": 0.0, "end": 3.0},
+            # 화자 A(0.8초)와 B(1.6초)가 겹치는 구간
+            {"word": "반갑습니다", "start": 4.2, "end": 5.8},
+            # 정렬되지 않아 시각 정보가 없는 단어
+            {"word": "%"}
+        ]},
+        # 어떤 화자 구간과도 겹치지 않는 세그먼트
+        {"start": 10.5, "end": 11.5, "text": "네", "words": [{"word": "네", "start": 10.5, "end": 11.5}]},
+        {"start": 13.0, "end": 14.0, "text": "좋아요"}
+    ]}
+
+
+def reference_assign_word_speakers(diarize_df: pd.DataFrame, transcript_result: dict, fill_nearest: bool = False) -> dict:
+    """whisperx.assign_word_speakers 와 같은 방식 (단어/세그먼트마다 전체 화자 구간 비교)"""
+    for seg in transcript_result["segments"]:
+        targets = [seg] + [word for word in seg.get("words", []) if "start" in word]
+        for target in targets:
+            intersection = np.minimum(diarize_df["end"], target["end"]) - np.maximum(diarize_df["start"], target["start"])
+            rows = diarize_df.assign(intersection=intersection)
+            if not fill_nearest:
+                rows = rows[rows["intersection"] > 0]
+            if len(rows) > 0:
+                target["speaker"] = rows.groupby("speaker")["intersection"].sum().sort_values(ascending=False).index[0]
+    return transcript_result
+
+
+def speakers_of(result: dict):
+    return [
+        (seg.get("speaker"), [word.get("speaker") for word in seg.get("words", [])])
+        for seg in result["segments"]
+    ]
+
+
+def test_overlapping_turns_and_words_without_timestamps():
+    result = assign_word_speakers(DIARIZE, make_transcript())
+
+    first, silent, last = result["segments"]
+    # 세그먼트는 A 와 5초, B 와 2초 겹침
+    assert first["speaker"] == "SPEAKER_A"
+    assert [word.get("speaker") for word in first["words"]] == ["SPEAKER_A", "SPEAKER_B", None]
+    assert "speaker" not in first["words"][2]
+    # 겹치는 화자가 없으면 speaker 키를 넣지 않음
+    assert "speaker" not in silent
+    assert "speaker" not in silent["words"][0]
+    # words 가 없는 세그먼트도 처리
+    assert last["speaker"] == "SPEAKER_A"
+
+
+def test_fill_nearest_assigns_closest_speaker():
+    result = assign_word_speakers(DIARIZE, make_transcript(), fill_nearest=True)
+
+    silent = result["segments"][1]
+    # 교집합 합: A -6.0, B -0.5, C -8.5 -> 가장 가까운 B
+    assert silent["speaker"] == "SPEAKER_B"
+    assert silent["words"][0]["speaker"] == "SPEAKER_B"
+    # 시각 정보가 없는 단어는 fill_nearest 여도 지정하지 않음
+    assert "speaker" not in result["segments"][0]["words"][2]
+
+
+@pytest.mark.parametrize("fill_nearest", [False, True])
+def test_matches_reference_on_fixture(fill_nearest):
+    expected = reference_assign_word_speakers(DIARIZE, make_transcript(), fill_nearest)
+    actual = assign_word_speakers(DIARIZE, make_transcript(), fill_nearest)
+    assert speakers_of(actual) == speakers_of(expected)
+
+
+@pytest.mark.parametrize("fill_nearest", [False, True])
+def test_matches_reference_on_random_meeting(fill_nearest):
+    rng = np.random.default_rng(7)
+    word_starts = np.cumsum(rng.uniform(0.2, 0.6, 120))
+    word_ends = word_starts + rng.uniform(0.1, 0.4, 120)
+    segments = []
+    for i in range(0, 120, 12):
+        words = [{"word": "w", "start": round(float(s), 3), "end": round(float(e), 3)}
+                 for s, e in zip(word_starts[i:i + 12], word_ends[i:i + 12])]
+        segments.append({"start": words[0]["start"], "end": words[-1]["end"], "text": "", "words": words})
+    turn_starts = np.sort(rng.uniform(0, word_ends[-1], 8)).round(3)
+    diarize_df = pd.DataFrame({
+        "start": turn_starts,
+        "end": (turn_starts + rng.uniform(1.0, 6.0, 8)).round(3),
+        "speaker": [f"SPEAKER_{k:02d}" for k in rng.integers(0, 3, 8)]
+    })
+
+    expected = reference_assign_word_speakers(diarize_df, copy.deepcopy({"segments": segments}), fill_nearest)
+    actual = assign_word_speakers(diarize_df, copy.deepcopy({"segments": segments}), fill_nearest)
+    assert speakers_of(actual) == speakers_of(expected)
+
+
+def test_matches_whisperx():
+    whisperx = pytest.importorskip("whisperx")
+
+    for fill_nearest in (False, True):
+        expected = whisperx.assign_word_speakers(DIARIZE, make_transcript(), fill_nearest=fill_nearest)
+        actual = assign_word_speakers(DIARIZE, make_transcript(), fill_nearest)
+        assert speakers_of(actual) == speakers_of(expected)
@@ -0,0 +1,53 @@
+import sys
+import os
+import json
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.transcript_cache_util import TranscriptCache
+
+RESULT = {"segments": [{"start": 0.0, "end": 1.0, "text": "안녕하세요", "speaker": "SPEAKER_00"}]}
+
+
+def test_key_depends_on_audio_and_config(tmp_path):
+    audio = tmp_path / "meeting.wav"
+    audio.write_bytes(b"RIFF" + b"\x00" * 64)
+    audio_hash = TranscriptCache.hash_file(str(audio), chunk_size=16)
+
+    config = {"model": "large-v3", "language": "ko"}
+    assert TranscriptCache.make_key(audio_hash, config) == TranscriptCache.make_key(audio_hash, dict(reversed(config.items())))
+    assert TranscriptCache.make_key(audio_hash, config) != TranscriptCache.make_key(audio_hash, {**config, "language": "en"})
+
+    audio.write_bytes(b"RIFF" + b"\x01" * 64)
+    assert TranscriptCache.hash_file(str(audio)) != audio_hash
+
+
+def test_get_put_round_trip(tmp_path):
+    cache = TranscriptCache(cache_dir=str(tmp_path))
+
+    assert cache.get("missing") is None
+    cache.put("a", RESULT)
+    assert cache.get("a") == RESULT
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+    # 임시 파일이 남지 않음
+    assert os.listdir(tmp_path) == ["a.json"]
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    entry_size = len(json.dumps(RESULT, ensure_ascii=False).encode("utf-8"))
+    cache = TranscriptCache(cache_dir=str(tmp_path), max_size_mb=(entry_size * 3 + 10) / 1024 / 1024)
+
+    for index, key in enumerate(("a", "b", "c")):
+        cache.put(key, RESULT)
+        # 마지막 사용 시각(수정 시각)을 차례로 지정
+        os.utime(tmp_path / f"{key}.json", (1000 + index, 1000 + index))
+
+    # a 를 읽으면 가장 최근 사용이 되므로 다음 저장에서 b 가 삭제됨
+    assert cache.get("a") == RESULT
+    cache.put("d", RESULT)
+
+    assert sorted(os.listdir(tmp_path)) == ["a.json", "c.json", "d.json"]
+    assert cache.stats()["evictions"] == 1
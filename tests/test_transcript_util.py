@@ -0,0 +1,54 @@
+import sys
+import copy
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.append(project_root)
+
+from app.utils.transcript_util import Transcript, clean_asr_text
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "text": " 안녕하세요", "speaker": "SPEAKER_00", "words": [
+        {"word": "안녕하세요", "start": 0.0, "end": 2.5, "score": 0.9, "speaker": "SPEAKER_00"}
+    ]},
+    # 화자 분리 결과가 없는 세그먼트 (speaker 키가 None 으로 있음)
+    {"start": 2.5, "end": 4.0, "text": " 네", "speaker": None, "words": [
+        {"word": "네", "start": 2.5, "end": 4.0, "speaker": None},
+        # 정렬되지 않은 단어 (시각 정보 없음)
+        {"word": "%"}
+    ]},
+    # words 키가 없는 세그먼트와 배열로 보관하지 않는 필드
+    {"start": 4.0, "end": 6.0, "text": " 좋습니다", "speaker": "SPEAKER_01", "avg_logprob": -0.2},
+    # speaker 키 자체가 없는 세그먼트
+    {"start": 6.0, "end": 7.0, "text": " 끝", "words": []}
+]
+
+
+def test_round_trip_preserves_segments():
+    transcript = Transcript.from_segments(copy.deepcopy(SEGMENTS))
+
+    assert transcript.to_segments(include_words=True) == SEGMENTS
+
+
+def test_to_segments_without_words():
+    transcript = Transcript.from_segments(copy.deepcopy(SEGMENTS))
+
+    segments = transcript.to_segments()
+    assert all("words" not in segment for segment in segments)
+    assert segments[1]["speaker"] is None
+    assert "speaker" not in segments[3]
+    assert transcript[1].speaker is None
+    assert transcript.word_count == 3
+
+
+def test_clean_asr_text_strips_fillers_tags_and_repeats():
+    assert clean_asr_text("음, 다음 주까지 어... 정리하겠습니다") == "다음 주까지 정리하겠습니다"
+    assert clean_asr_text("[음악] 시작하겠습니다 (웃음) ♪") == "시작하겠습니다"
+    assert clean_asr_text("네 네 네 네 알겠습니다!!!") == "네 알겠습니다!"
+    # 숫자나 일반 단어의 반복, 단어 안의 간투사 글자는 그대로 둠
+    assert clean_asr_text("1 1 1 2 번 항목") == "1 1 1 2 번 항목"
+    assert clean_asr_text("음식 주문은 어제 했습니다") == "음식 주문은 어제 했습니다"
+    # 세그먼트 전체가 잡음이면 빈 문자열
+    assert clean_asr_text("음...") == ""
+    assert clean_asr_text("시청해 주셔서 감사합니다.") == ""